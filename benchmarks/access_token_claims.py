@@ -0,0 +1,86 @@
+"""Compare access token decoding with and without the claims cache.
+
+Usage: python -m benchmarks.access_token_claims
+"""
+
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import Request
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.adapters.auth.idp.access_token import UnverifiedAccessTokenDecoder
+from crudik.adapters.auth.idp.auth_user import WebAuthConfig, WebAuthUserIdProvider
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+
+CALLS = 20_000
+
+config = WebAuthConfig(
+    user_id_header="X-Auth-User",
+    access_token_header="X-Access-Token",  # noqa: S106
+    access_token_alg="RS256",  # noqa: S106
+    allow_unverified_email=False,
+)
+
+
+def make_access_token() -> str:
+    """Sign a realistic access token with a throwaway key."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "sub": "1",
+            "iat": now,
+            "exp": now + 3600,
+            "email_verified": True,
+            "preferred_username": "user",
+            "scope": "openid profile email",
+            "realm_access": {"roles": ["offline_access", "uma_authorization", "default-roles"]},
+        },
+        key=pem,
+        algorithm=config.access_token_alg,
+    )
+
+
+def make_idp(access_token: str, cache: AccessTokenClaimsCache) -> WebAuthUserIdProvider:
+    """Create id provider for a request carrying the access token."""
+    request = Request(
+        {
+            "type": "http",
+            "headers": [
+                (config.user_id_header.lower().encode(), b"1"),
+                (config.access_token_header.lower().encode(), access_token.encode()),
+            ],
+        },
+    )
+    return WebAuthUserIdProvider(
+        http_request=request,
+        config=config,
+        claims_cache=cache,
+        decoder=UnverifiedAccessTokenDecoder(algorithm=config.access_token_alg),
+    )
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    access_token = make_access_token()
+
+    uncached = make_idp(access_token, AccessTokenClaimsCache(max_size=0, ttl=300))
+    cache = AccessTokenClaimsCache(max_size=10_000, ttl=300)
+    cached = make_idp(access_token, cache)
+
+    print(await measure("uncached jwt.decode", uncached.get_auth_user_id, CALLS))
+    print(await measure("cached claims", cached.get_auth_user_id, CALLS))
+    print(f"claims cache hit ratio: {cache.stats.hit_ratio:.4f}")
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,87 @@
+"""Compare concurrent ReadUser throughput with and without cross-request batching against $APP_CONFIG_PATH.
+
+The auth user cache is disabled, so every request resolves its identity with the database.
+
+Usage: python -m benchmarks.batch_loader
+"""
+
+import asyncio
+from dataclasses import replace
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.adapters.cache.config import TTLCacheConfig
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.entities.common.identifiers import UserId
+from crudik.main.config.loader import Config, get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+CONCURRENCY = 100
+ROUNDS = 50
+
+
+def make_request(config: Config, auth_user_id: str) -> Request:
+    """Create HTTP request authenticated as the given auth user."""
+    return Request(
+        {
+            "type": "http",
+            "headers": [(config.web_auth.user_id_header.lower().encode(), auth_user_id.encode())],
+        },
+    )
+
+
+async def bench(config: Config, users: dict[str, UserId], name: str) -> None:
+    """Measure rounds of concurrent ReadUser calls, one per user."""
+    container = get_async_container(config)
+
+    async def read_user(auth_user_id: str, user_id: UserId) -> None:
+        async with container({Request: make_request(config, auth_user_id)}) as request_container:
+            interactor = await request_container.get(ReadUser)
+            await interactor.execute(user_id)
+
+    async def read_users() -> None:
+        await asyncio.gather(*(read_user(*item) for item in users.items()))
+
+    try:
+        result = await measure(name, read_users, ROUNDS, warmup=5)
+        print(f"{result} {result.per_second * len(users):>12.0f} requests/s")
+    finally:
+        await container.close()
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    config = replace(config, cache=replace(config.cache, auth_user=TTLCacheConfig(enabled=False)))
+    container = get_async_container(config)
+
+    try:
+        users: dict[str, UserId] = {}
+        for _ in range(CONCURRENCY):
+            auth_user_id = uuid4().hex
+            async with container({Request: make_request(config, auth_user_id)}) as request_container:
+                users[auth_user_id] = (await (await request_container.get(CreateUser)).execute()).id
+
+        await bench(replace(config, batching=BatchingConfig(enabled=False)), users, "ReadUser x100")
+        for window in (0.0, 0.001, 0.005):
+            await bench(
+                replace(config, batching=BatchingConfig(enabled=True, window=window, max_batch_size=CONCURRENCY)),
+                users,
+                f"ReadUser x100, batched, window={window}",
+            )
+    finally:
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+        await container.close()
+
+
+if __name__ == "__main__":
+    run(main)
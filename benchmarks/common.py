@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, override
+
+import structlog
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class BenchmarkResult:
+    """Timings of a single benchmark case."""
+
+    name: str
+    calls: int
+    seconds: float
+    samples: list[float]
+
+    @property
+    def per_call_us(self) -> float:
+        """Mean time of a single call in microseconds."""
+        return self.seconds / self.calls * 1e6
+
+    @property
+    def per_second(self) -> float:
+        """Calls per second."""
+        return self.calls / self.seconds
+
+    @property
+    def p99_us(self) -> float:
+        """99th percentile of a single call in microseconds."""
+        return statistics.quantiles(self.samples, n=100)[98] * 1e6
+
+    @override
+    def __str__(self) -> str:
+        """Render result as a report line."""
+        return (
+            f"{self.name:<40} {self.per_call_us:>10.2f} us/call "
+            f"{self.p99_us:>10.2f} us p99 {self.per_second:>12.0f} calls/s"
+        )
+
+
+def silence_logs() -> None:
+    """Drop all log events below WARNING, so benchmarks measure the code rather than stdout."""
+    logging.basicConfig(level=logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+async def measure(name: str, func: Callable[[], Awaitable[object]], calls: int, warmup: int = 100) -> BenchmarkResult:
+    """Await ``func`` sequentially ``calls`` times and collect per-call timings."""
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        call_started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - call_started)
+    seconds = time.perf_counter() - started
+
+    return BenchmarkResult(name=name, calls=calls, seconds=seconds, samples=samples)
+
+
+def measure_sync(name: str, func: Callable[[], object], calls: int, warmup: int = 100) -> BenchmarkResult:
+    """Call ``func`` sequentially ``calls`` times and collect per-call timings."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        call_started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - call_started)
+    seconds = time.perf_counter() - started
+
+    return BenchmarkResult(name=name, calls=calls, seconds=seconds, samples=samples)
+
+
+def run(main: Callable[[], Coroutine[Any, Any, None]]) -> None:
+    """Run benchmark entry point."""
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+"""Measure CreateUser latency against the database from $APP_CONFIG_PATH.
+
+Usage: python -m benchmarks.create_user
+"""
+
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.application.create_user import CreateUser
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+CALLS = 2_000
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    container = get_async_container(config)
+
+    async def create_user() -> None:
+        request = Request(
+            {
+                "type": "http",
+                "headers": [(config.web_auth.user_id_header.lower().encode(), uuid4().hex.encode())],
+            },
+        )
+        async with container({Request: request}) as request_container:
+            interactor = await request_container.get(CreateUser)
+            await interactor.execute()
+
+    try:
+        print(await measure("CreateUser", create_user, CALLS))
+    finally:
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+        await container.close()
+
+
+if __name__ == "__main__":
+    run(main)
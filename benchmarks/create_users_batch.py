@@ -0,0 +1,81 @@
+"""Compare rows per second of CreateUsersBatch and CreateUser against the database from $APP_CONFIG_PATH.
+
+Batches are created by a caller with an unsigned access token granting the provisioner role,
+so the config must not verify token signatures.
+
+Usage: python -m benchmarks.create_users_batch
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import jwt
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import BenchmarkResult, measure, run, silence_logs
+from crudik.application.create_user import CreateUser
+from crudik.application.create_users_batch import CreateUsersBatch, UsersBatchForm
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+SINGLE_CALLS = 2_000
+BATCH_CALLS = 40
+BATCH_SIZE = 500
+
+
+def report(result: BenchmarkResult, rows_per_call: int) -> str:
+    """Render result with the number of created rows per second."""
+    return f"{result} {result.per_second * rows_per_call:>12.0f} rows/s"
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    container = get_async_container(config)
+    caller_id = uuid4().hex
+    *path, roles_key = config.web_auth.roles_claim.split(".")
+    claims: dict[str, Any] = {"email_verified": True, roles_key: [config.users_batch.provisioner_role]}
+    for key in reversed(path):
+        claims = {key: claims}
+    provisioner_token = jwt.encode(claims, key="", algorithm="none")
+
+    def make_request(auth_user_id: str, access_token: str | None = None) -> Request:
+        headers = [(config.web_auth.user_id_header.lower().encode(), auth_user_id.encode())]
+        if access_token is not None:
+            headers.append((config.web_auth.access_token_header.lower().encode(), access_token.encode()))
+        return Request({"type": "http", "headers": headers})
+
+    async def create_user() -> None:
+        async with container({Request: make_request(uuid4().hex)}) as request_container:
+            interactor = await request_container.get(CreateUser)
+            await interactor.execute()
+
+    async def create_users_batch() -> None:
+        form = UsersBatchForm(auth_user_ids=[uuid4().hex for _ in range(BATCH_SIZE)])
+        async with container({Request: make_request(caller_id, provisioner_token)}) as request_container:
+            interactor = await request_container.get(CreateUsersBatch)
+            await interactor.execute(form)
+
+    try:
+        async with container({Request: make_request(caller_id)}) as request_container:
+            await (await request_container.get(CreateUser)).execute()
+
+        print(report(await measure("CreateUser", create_user, SINGLE_CALLS), 1))
+        print(
+            report(
+                await measure(f"CreateUsersBatch[{BATCH_SIZE}]", create_users_batch, BATCH_CALLS, warmup=5),
+                BATCH_SIZE,
+            ),
+        )
+    finally:
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+        await container.close()
+
+
+if __name__ == "__main__":
+    run(main)
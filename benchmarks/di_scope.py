@@ -0,0 +1,53 @@
+"""Measure the cost of entering and closing a request scope and resolving the dependencies of every user endpoint.
+
+Uses the container built from $APP_CONFIG_PATH. Nothing connects to the database, as sessions connect lazily.
+
+Usage: python -m benchmarks.di_scope
+"""
+
+from fastapi import Request
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.application.create_user import CreateUser
+from crudik.application.create_users_batch import CreateUsersBatch
+from crudik.application.read_user import ReadUser
+from crudik.application.read_users import ReadUsers
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+CALLS = 20_000
+ENDPOINTS = {
+    "POST /users/": CreateUser,
+    "POST /users/batch": CreateUsersBatch,
+    "GET /users/": ReadUsers,
+    "GET /users/{user_id}": ReadUser,
+}
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    container = get_async_container(config)
+    request = Request({"type": "http", "headers": [(config.web_auth.user_id_header.lower().encode(), b"1")]})
+
+    async def empty_scope() -> None:
+        async with container({Request: request}):
+            pass
+
+    results = [await measure("empty scope", empty_scope, CALLS)]
+    for endpoint, interactor_type in ENDPOINTS.items():
+
+        async def resolve(interactor_type: type = interactor_type) -> None:
+            async with container({Request: request}) as request_container:
+                await request_container.get(interactor_type)
+
+        results.append(await measure(endpoint, resolve, CALLS))
+
+    await container.close()
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,54 @@
+"""Measure the per-call overhead of a debug log call when the logger level is INFO.
+
+The stdlib bound logger runs the whole processor chain before the stdlib logger drops the record,
+while the level filtering bound logger has a no-op method for the disabled level.
+
+Usage: python -m benchmarks.disabled_logging
+"""
+
+import logging
+import logging.config
+from uuid import uuid4
+
+import structlog
+
+from benchmarks.common import measure_sync
+from crudik.adapters.logs.config import LoggingConfig
+from crudik.main.logs import configure_structlog
+
+CALLS = 200_000
+
+
+def main() -> None:
+    """Run benchmark."""
+    logging.config.dictConfig(configure_structlog(LoggingConfig(level="INFO")))
+    user_id = uuid4()
+
+    def noop() -> None:
+        pass
+
+    print(measure_sync("no-op call", noop, CALLS))
+
+    structlog.configure(wrapper_class=structlog.stdlib.BoundLogger)
+    stdlib_logger = structlog.get_logger("benchmarks.stdlib")
+    print(
+        measure_sync(
+            "disabled debug, stdlib BoundLogger",
+            lambda: stdlib_logger.debug("Read user", user_id=user_id),
+            CALLS,
+        ),
+    )
+
+    logging.config.dictConfig(configure_structlog(LoggingConfig(level="INFO")))
+    filtering_logger = structlog.get_logger("benchmarks.filtering")
+    print(
+        measure_sync(
+            "disabled debug, filtering bound logger",
+            lambda: filtering_logger.debug("Read user", user_id=user_id),
+            CALLS,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
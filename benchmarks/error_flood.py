@@ -0,0 +1,117 @@
+"""Measure the cost of a flood of 401 responses, with the previous and the current error handler.
+
+Logs are rendered at INFO to a stream that discards them, so logging costs are included.
+The app case sends unauthenticated GET /users/{id} requests to the ASGI app in process.
+
+Usage: python -m benchmarks.error_flood
+"""
+
+import io
+import logging.config
+import sys
+from collections.abc import Awaitable, Callable
+from typing import Any, override
+from uuid import uuid4
+
+import structlog
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from starlette.types import Message
+
+from benchmarks.common import measure, run
+from crudik.adapters.auth.errors.base import UnauthorizedError, UnauthorizedReason
+from crudik.adapters.errors.http.response import ErrorResponse
+from crudik.adapters.logs.config import LoggingConfig
+from crudik.entities.errors.base import AppError
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.fast_api import create_app
+from crudik.main.logs import configure_structlog
+from crudik.presentation.fast_api.error_handlers import error_to_http_status, get_app_error_response
+
+CALLS = 5_000
+
+logger = structlog.get_logger(__name__)
+
+
+class DiscardingStream(io.StringIO):
+    """Stream that drops everything written to it."""
+
+    @override
+    def write(self, s: str, /) -> int:
+        return len(s)
+
+
+async def legacy_get_app_error_response(err: AppError) -> Response:
+    """Previous handler, which builds the model and logs the traceback for every error."""
+    http_status = error_to_http_status[type(err)]
+    error_response = ErrorResponse(code=err.code, message=err.message, meta=err.meta).model_dump(mode="json")
+    logger.info("Handled error", error_response=error_response, exc_info=err)
+    return JSONResponse(status_code=http_status, content=error_response)
+
+
+def authenticate() -> None:
+    """Fail authentication like a request without user ID."""
+    raise UnauthorizedError(reason=UnauthorizedReason.MISSING_USER_ID, header="X-Auth-User")
+
+
+def make_handler_call(handler: Callable[[AppError], Awaitable[Response]]) -> Callable[[], Awaitable[None]]:
+    """Create a function raising an UnauthorizedError and converting it to a response."""
+
+    async def call() -> None:
+        try:
+            authenticate()
+        except UnauthorizedError as e:
+            await handler(e)
+
+    return call
+
+
+async def main() -> None:
+    """Run benchmark."""
+    stdout = sys.stdout
+    sys.stdout = DiscardingStream()
+    try:
+        logging.config.dictConfig(configure_structlog(LoggingConfig(level="INFO")))
+        config = load_config_from_toml(get_toml_config_path())
+        app = create_app(config)
+        path = f"/users/{uuid4()}"
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(_message: Message) -> None:
+            pass
+
+        async def request() -> None:
+            scope: dict[str, Any] = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": b"",
+                "root_path": "",
+                "headers": [],
+                "client": ("127.0.0.1", 12345),
+                "server": ("127.0.0.1", 5000),
+            }
+            await app(scope, receive, send)
+
+        results = [
+            await measure("401 handler, previous", make_handler_call(legacy_get_app_error_response), CALLS),
+            await measure("401 handler, fast path", make_handler_call(get_app_error_response), CALLS),
+            await measure("401 GET /users/{id}, app", request, CALLS),
+        ]
+        await app.state.dishka_container.close()
+    finally:
+        logging.shutdown()
+        sys.stdout = stdout
+
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    run(main)
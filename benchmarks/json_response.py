@@ -0,0 +1,80 @@
+"""Measure response serialization of user models, through the default FastAPI path and the fast path.
+
+The default path validates the returned model against the response field, serializes it and renders
+it with ``JSONResponse``. The fast path renders the model with ``FastJSONResponse`` directly.
+Reports wall and CPU time per response and the rendered bytes per second.
+
+Usage: python -m benchmarks.json_response
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+
+from benchmarks.common import run
+from crudik.application.read_user import UserModel
+from crudik.application.read_users import UsersModel
+from crudik.presentation.fast_api.responses import FastJSONResponse
+
+CALLS = 20_000
+WARMUP = 100
+USERS = 100
+
+
+async def measure_response(name: str, render: Callable[[], Awaitable[bytes]], calls: int = CALLS) -> None:
+    """Render the response ``calls`` times and print wall time, CPU time and throughput."""
+    for _ in range(WARMUP):
+        await render()
+
+    rendered = 0
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(calls):
+        rendered += len(await render())
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+
+    print(
+        f"{name:<40} {wall / calls * 1e6:>10.2f} us/call {cpu / calls * 1e6:>10.2f} us CPU "
+        f"{rendered / wall / 1e6:>10.1f} MB/s",
+    )
+
+
+def default_path(model: BaseModel) -> Callable[[], Awaitable[bytes]]:
+    """Render a model the way FastAPI does for an endpoint returning it with a response model."""
+    field = create_model_field(name="Response", type_=type(model), mode="serialization")
+
+    async def render() -> bytes:
+        content = await serialize_response(field=field, response_content=model)
+        return bytes(JSONResponse(content).body)
+
+    return render
+
+
+def fast_path(model: BaseModel) -> Callable[[], Awaitable[bytes]]:
+    """Render a model with ``FastJSONResponse``."""
+
+    async def render() -> bytes:
+        return bytes(FastJSONResponse(model).body)
+
+    return render
+
+
+async def main() -> None:
+    """Run benchmark."""
+    user = UserModel(id=uuid4())
+    users = UsersModel(items=[UserModel(id=uuid4()) for _ in range(USERS)])
+
+    await measure_response("UserModel, default", default_path(user))
+    await measure_response("UserModel, fast path", fast_path(user))
+    await measure_response(f"UsersModel x{USERS}, default", default_path(users))
+    await measure_response(f"UsersModel x{USERS}, fast path", fast_path(users))
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,117 @@
+"""Compare access token throughput of the unverified path and JWKS signature verification.
+
+Each case decodes distinct tokens from concurrent coroutines, while a ticker coroutine
+measures how long the event loop gets stalled.
+
+Usage: python -m benchmarks.jwt_verification
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, override
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from benchmarks.common import run, silence_logs
+from crudik.adapters.auth.idp.access_token import (
+    AccessTokenDecoder,
+    UnverifiedAccessTokenDecoder,
+    VerifiedAccessTokenDecoder,
+)
+from crudik.adapters.auth.idp.jwks import JWKSKeyStore
+
+TOKENS = 4_000
+CONCURRENCY = 64
+TICK = 0.001
+KID = "benchmark"
+
+
+class InlineExecutor(Executor):
+    """Executor that runs the call right away, i.e. verification inside the event loop."""
+
+    @override
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def make_tokens(key: rsa.RSAPrivateKey) -> list[str]:
+    """Sign distinct tokens, so that nothing can be reused between decodes."""
+    exp = int(time.time()) + 3600
+    return [
+        jwt.encode(
+            {"sub": str(i), "email_verified": True, "exp": exp},
+            key=key,
+            algorithm="RS256",
+            headers={"kid": KID},
+        )
+        for i in range(TOKENS)
+    ]
+
+
+async def measure_throughput(name: str, decoder: AccessTokenDecoder, tokens: list[str]) -> None:
+    """Decode all tokens from concurrent workers and print tokens per second and the worst loop stall."""
+    queue = iter(tokens)
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            max_lag = max(max_lag, time.perf_counter() - started - TICK)
+
+    async def worker() -> None:
+        for token in queue:
+            await decoder.decode(token)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    seconds = time.perf_counter() - started
+    done.set()
+    await ticker_task
+
+    print(f"{name:<40} {len(tokens) / seconds:>10.0f} tokens/s {max_lag * 1e3:>10.2f} ms max loop stall")
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    tokens = make_tokens(key)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jwks_path = Path(tmp) / "jwks.json"
+        jwk = {**RSAAlgorithm.to_jwk(key.public_key(), as_dict=True), "kid": KID}
+        jwks_path.write_text(json.dumps({"keys": [jwk]}))
+
+        await measure_throughput("unverified (current)", UnverifiedAccessTokenDecoder(algorithm="RS256"), tokens)
+
+        cases: list[tuple[str, Executor]] = [
+            ("verified in event loop", InlineExecutor()),
+            ("verified, 1 thread", ThreadPoolExecutor(max_workers=1)),
+            ("verified, 4 threads", ThreadPoolExecutor(max_workers=4)),
+        ]
+        for name, executor in cases:
+            with executor:
+                decoder = VerifiedAccessTokenDecoder(
+                    algorithm="RS256",
+                    audience=None,
+                    key_store=JWKSKeyStore(jwks_uri=str(jwks_path), refresh_interval=60, executor=executor),
+                    executor=executor,
+                )
+                await measure_throughput(name, decoder, tokens)
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,83 @@
+"""Compare ReadUser latency with the stream and the queued log handlers while stdout is throttled.
+
+Stdout is replaced with a stream that sleeps on every write, like a pipe to a log collector that falls behind.
+Logs are at DEBUG, so every call emits several events. Uses the database from $APP_CONFIG_PATH.
+
+Usage: python -m benchmarks.log_queue
+"""
+
+import io
+import logging
+import logging.config
+import sys
+import time
+from typing import override
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.adapters.logs.config import LoggingConfig, QueueLoggingConfig
+from crudik.adapters.logs.queue import BatchingQueueHandler
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+from crudik.main.logs import configure_structlog
+
+CALLS = 1_000
+WRITE_DELAY = 0.001
+
+
+class ThrottledStream(io.StringIO):
+    """Stream that takes ``WRITE_DELAY`` for every write and discards the data."""
+
+    @override
+    def write(self, s: str, /) -> int:
+        time.sleep(WRITE_DELAY)
+        return len(s)
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    container = get_async_container(config)
+    stdout = sys.stdout
+    request = Request(
+        {
+            "type": "http",
+            "headers": [(config.web_auth.user_id_header.lower().encode(), uuid4().hex.encode())],
+        },
+    )
+
+    async def read_user() -> None:
+        async with container({Request: request}) as request_container:
+            await (await request_container.get(ReadUser)).execute(user_id)
+
+    try:
+        async with container({Request: request}) as request_container:
+            user_id = (await (await request_container.get(CreateUser)).execute()).id
+
+        for name, queue_enabled in (("ReadUser, stream handler", False), ("ReadUser, queue handler", True)):
+            sys.stdout = ThrottledStream()
+            logging_config = LoggingConfig(queue=QueueLoggingConfig(enabled=queue_enabled))
+            logging.config.dictConfig(configure_structlog(logging_config))
+            result = await measure(name, read_user, CALLS)
+            handler = logging.getLogger().handlers[0]
+            dropped = handler.dropped if isinstance(handler, BatchingQueueHandler) else 0
+            logging.shutdown()
+            sys.stdout = stdout
+            print(result, f"{dropped:>8} dropped")
+    finally:
+        sys.stdout = stdout
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+        await container.close()
+
+
+if __name__ == "__main__":
+    run(main)
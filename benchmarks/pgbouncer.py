@@ -0,0 +1,82 @@
+"""Compare CreateUser + ReadUser throughput of the app-side pool and the PgBouncer mode against $APP_CONFIG_PATH.
+
+PgBouncer at $PGBOUNCER_HOST:$PGBOUNCER_PORT is measured too if the variables are set.
+
+Usage: python -m benchmarks.pgbouncer
+"""
+
+import asyncio
+import os
+from dataclasses import replace
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.adapters.cache.config import CacheConfig, TTLCacheConfig, UserCacheConfig
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.main.config.loader import Config, get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+CONCURRENCY = 50
+ROUNDS = 20
+
+
+async def bench(config: Config, name: str) -> None:
+    """Measure rounds of concurrent requests, each creating a user and reading it back."""
+    container = get_async_container(config)
+
+    def make_request(auth_user_id: str) -> Request:
+        return Request(
+            {
+                "type": "http",
+                "headers": [(config.web_auth.user_id_header.lower().encode(), auth_user_id.encode())],
+            },
+        )
+
+    async def create_and_read() -> None:
+        request = make_request(uuid4().hex)
+        async with container({Request: request}) as request_container:
+            user_id = (await (await request_container.get(CreateUser)).execute()).id
+        async with container({Request: request}) as request_container:
+            await (await request_container.get(ReadUser)).execute(user_id)
+
+    async def round_() -> None:
+        await asyncio.gather(*(create_and_read() for _ in range(CONCURRENCY)))
+
+    try:
+        result = await measure(name, round_, ROUNDS, warmup=2)
+        print(f"{result} {result.per_second * CONCURRENCY:>12.0f} users/s")
+    finally:
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+        await container.close()
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    config = replace(
+        config,
+        cache=CacheConfig(
+            auth_user=TTLCacheConfig(enabled=False),
+            access_token=TTLCacheConfig(enabled=False),
+            user=UserCacheConfig(enabled=False),
+        ),
+    )
+    pgbouncer_db = replace(config.db, pgbouncer=True, null_pool=True)
+
+    await bench(config, "app pool")
+    await bench(replace(config, db=pgbouncer_db), "pgbouncer mode, direct")
+    if (host := os.getenv("PGBOUNCER_HOST")) is not None:
+        port = int(os.getenv("PGBOUNCER_PORT", "6432"))
+        await bench(replace(config, db=replace(pgbouncer_db, host=host, port=port)), "pgbouncer mode, PgBouncer")
+
+
+if __name__ == "__main__":
+    run(main)
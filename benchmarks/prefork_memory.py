@@ -0,0 +1,125 @@
+"""Report memory of API workers started by uvicorn workers and by the prefork manager against $APP_CONFIG_PATH.
+
+Each mode starts the API with ``WORKERS`` workers on ``PORT``, sends some requests to every worker and reads
+the RSS, PSS and private memory of the workers from ``/proc``. RSS counts shared pages in full for every worker,
+PSS divides them between the processes sharing them, so the sum of PSS is the memory the workers actually take.
+
+Usage: python -m benchmarks.prefork_memory
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from crudik.main.config.loader import get_toml_config_path
+
+WORKERS = 4
+PORT = 5002
+REQUESTS = 400
+STARTUP_TIMEOUT = 60.0
+SERVER_SECTION_RE = re.compile(r"^\[server\]\n(?:(?!\[).*\n)*", re.MULTILINE)
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class WorkerMemory:
+    """Memory of a worker process, in kilobytes."""
+
+    rss: int
+    pss: int
+    private: int
+
+
+def write_config(path: Path) -> None:
+    """Write the config with the server section replaced by the benchmark one."""
+    server = f'[server]\nport = {PORT}\nhost = "127.0.0.1"\nworkers = {WORKERS}\n\n'
+    path.write_text(SERVER_SECTION_RE.sub(server, get_toml_config_path().read_text(), count=1))
+
+
+def get_children(pid: int) -> list[int]:
+    """Return PIDs of the child processes."""
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    return [int(child) for child in children if "resource_tracker" not in Path(f"/proc/{child}/cmdline").read_text()]
+
+
+def read_memory(pid: int) -> WorkerMemory:
+    """Read memory of the process from smaps_rollup."""
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        fields[name.rstrip(":")] = int(value)
+    return WorkerMemory(
+        rss=fields["Rss"],
+        pss=fields["Pss"],
+        private=fields["Private_Clean"] + fields["Private_Dirty"],
+    )
+
+
+def wait_ready() -> None:
+    """Wait until the API answers the readiness probe."""
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/internal/ready"):
+                return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    msg = "API is not ready"
+    raise TimeoutError(msg)
+
+
+def send_requests() -> None:
+    """Send requests touching the application code, failing with 401 without the auth header."""
+    for _ in range(REQUESTS):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{PORT}/users/{uuid4()}").close()
+        except urllib.error.HTTPError as e:
+            e.close()
+
+
+def measure_mode(name: str, args: list[str], config_path: Path) -> None:
+    """Start the API, load it and print the memory of its workers."""
+    env = {**os.environ, "APP_CONFIG_PATH": str(config_path)}
+    with subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "crudik.main.cli", "run", "api", *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ) as process:
+        try:
+            wait_ready()
+            send_requests()
+            parent = read_memory(process.pid)
+            workers = [read_memory(pid) for pid in get_children(process.pid)]
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{name}: parent RSS {parent.rss / 1024:.1f} MiB, PSS {parent.pss / 1024:.1f} MiB")
+    for i, worker in enumerate(workers):
+        print(
+            f"  worker {i}: RSS {worker.rss / 1024:>7.1f} MiB  PSS {worker.pss / 1024:>7.1f} MiB  "
+            f"private {worker.private / 1024:>7.1f} MiB",
+        )
+    total_pss = (parent.pss + sum(worker.pss for worker in workers)) / 1024
+    print(f"  total PSS with parent: {total_pss:.1f} MiB")
+
+
+def main() -> None:
+    """Run benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = Path(directory) / "config.toml"
+        write_config(config_path)
+        measure_mode("uvicorn workers", [], config_path)
+        measure_mode("prefork workers", ["--prefork"], config_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare /internal/alive requests per second with the previous and the current tracing middleware.
+
+The previous middleware runs through Starlette's ``BaseHTTPMiddleware`` and resolves ``TraceId`` from the
+request container, it is measured both with a request scope for every request and with scopeless probes.
+The current one is a plain ASGI middleware.
+Requests are sent to the ASGI app in process, so the numbers exclude the server and the network.
+
+Usage: python -m benchmarks.tracing_middleware
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+from dishka import AsyncContainer
+from dishka.integrations.fastapi import setup_dishka as setup_dishka_for_every_request
+from fastapi import FastAPI, Request, Response
+from starlette.types import ASGIApp, Message
+
+from benchmarks.common import measure, run, silence_logs
+from crudik.adapters.tracing import TraceId
+from crudik.main.config.loader import Config, get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+from crudik.main.fast_api import create_app
+from crudik.presentation.fast_api import include_routers
+from crudik.presentation.fast_api.container import setup_dishka
+from crudik.presentation.fast_api.routers.root import PROBE_PATHS
+
+CALLS = 5000
+
+
+async def legacy_tracing_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """Previous middleware, which binds trace id logging contextvar for each request."""
+    dishka_container: AsyncContainer | None = getattr(request.state, "dishka_container", None)
+    if dishka_container is None:
+        return await call_next(request)
+
+    trace_id: TraceId = await dishka_container.get(TraceId)
+    with structlog.contextvars.bound_contextvars(trace_id=trace_id):
+        return await call_next(request)
+
+
+def create_legacy_app(config: Config, *, scopeless_probes: bool) -> FastAPI:
+    """Create the app wired with the previous middleware."""
+    app = FastAPI(root_path="/api")
+    app.middleware("http")(legacy_tracing_middleware)
+    if scopeless_probes:
+        setup_dishka(get_async_container(config), app, scopeless_paths=PROBE_PATHS)
+    else:
+        setup_dishka_for_every_request(container=get_async_container(config), app=app)
+    include_routers(app)
+    return app
+
+
+def make_call(app: ASGIApp, config: Config) -> Callable[[], Awaitable[None]]:
+    """Create a function sending a single GET /internal/alive request to the app."""
+    headers = [(config.tracing.trace_id_header.lower().encode(), b"0" * 32)]
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message: Message) -> None:
+        pass
+
+    async def call() -> None:
+        scope: dict[str, Any] = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/internal/alive",
+            "raw_path": b"/internal/alive",
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 5000),
+        }
+        await app(scope, receive, send)
+
+    return call
+
+
+async def main() -> None:
+    """Run benchmark."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    for name, app in (
+        ("BaseHTTPMiddleware, request scope", create_legacy_app(config, scopeless_probes=False)),
+        ("BaseHTTPMiddleware, scopeless probe", create_legacy_app(config, scopeless_probes=True)),
+        ("ASGI middleware, scopeless probe", create_app(config)),
+    ):
+        print(await measure(name, make_call(app, config), CALLS))
+        await app.state.dishka_container.close()
+
+
+if __name__ == "__main__":
+    run(main)
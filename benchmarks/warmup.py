@@ -0,0 +1,102 @@
+"""Measure latency of the first requests after startup with and without warmup against $APP_CONFIG_PATH.
+
+Every run starts a fresh interpreter, as mapper configuration is process-wide.
+
+Usage: python -m benchmarks.warmup
+"""
+
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import replace
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import run, silence_logs
+from crudik.adapters.db.warmup import DbWarmup
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.main.config.loader import Config, get_toml_config_path, load_config_from_toml
+from crudik.main.di.container import get_async_container
+
+RUNS = 10
+
+
+def make_request(config: Config, auth_user_id: str) -> Request:
+    """Create HTTP request authenticated as the given auth user."""
+    return Request(
+        {
+            "type": "http",
+            "headers": [(config.web_auth.user_id_header.lower().encode(), auth_user_id.encode())],
+        },
+    )
+
+
+async def first_requests(*, warm: bool) -> dict[str, float]:
+    """Start the app in this process and time its first CreateUser and ReadUser requests."""
+    silence_logs()
+    config = load_config_from_toml(get_toml_config_path())
+    config = replace(config, warmup=replace(config.warmup, enabled=warm))
+    container = get_async_container(config)
+    try:
+        if not (warmup := await container.get(DbWarmup)).is_done:
+            await warmup.run()
+
+        request = make_request(config, uuid4().hex)
+        started = time.perf_counter()
+        async with container({Request: request}) as request_container:
+            user_id = (await (await request_container.get(CreateUser)).execute()).id
+        created = time.perf_counter()
+        async with container({Request: request}) as request_container:
+            await (await request_container.get(ReadUser)).execute(user_id)
+        read = time.perf_counter()
+    finally:
+        await container.close()
+
+    return {"create": created - started, "read": read - created}
+
+
+def run_child(*, warm: bool) -> dict[str, float]:
+    """Time the first requests in a fresh interpreter."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmarks.warmup", "child", "warm" if warm else "cold"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    timings: dict[str, float] = json.loads(output)
+    return timings
+
+
+async def main() -> None:
+    """Run benchmark."""
+    for warm in (False, True):
+        timings = [await asyncio.to_thread(run_child, warm=warm) for _ in range(RUNS)]
+        for name in ("create", "read"):
+            samples = [timing[name] * 1e3 for timing in timings]
+            print(
+                f"{'warm' if warm else 'cold'} first {name:<8} "
+                f"{statistics.median(samples):>8.2f} ms median {max(samples):>8.2f} ms max",
+            )
+
+    config = load_config_from_toml(get_toml_config_path())
+    container = get_async_container(config)
+    try:
+        engine = await container.get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(text("TRUNCATE TABLE users CASCADE"))
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["child"]:
+        print(json.dumps(asyncio.run(first_requests(warm=sys.argv[2] == "warm"))))
+    else:
+        run(main)
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import override
 
 import structlog
@@ -32,21 +33,38 @@ class SimpleAuthProvider(AuthProvider):
 
     @override
     async def setup_auth(self, user: User) -> None:
-        """Create auth user record."""
+        """Create user together with auth user record."""
         logger.debug("Creating AuthUser record", user_id=user.id)
 
         auth_user_id = await self._idp.get_auth_user_id()
         logger.debug("Auth user id", auth_user_id=auth_user_id)
 
-        if await self._auth_user_gateway.is_exists(auth_user_id):
-            logger.info("Auth user already exists", auth_user_id=auth_user_id)
-            raise AuthUserAlreadyExistsError(auth_user_id=auth_user_id)
-
         auth_user = AuthUser(
             auth_user_id=auth_user_id,
             user_id=user.id,
             user=user,
         )
-        self._uow.add(auth_user)
+        if not await self._auth_user_gateway.create(auth_user):
+            logger.info("Auth user already exists", auth_user_id=auth_user_id)
+            raise AuthUserAlreadyExistsError(auth_user_id=auth_user_id)
 
         logger.info("Successfully created AuthUser entry", auth_user_id=auth_user_id, user_id=user.id)
+
+    @override
+    async def setup_auth_many(self, users: Mapping[str, User]) -> set[str]:
+        """Create users together with auth user records for the given auth user IDs."""
+        logger.debug("Creating AuthUser records", count=len(users))
+
+        created = await self._auth_user_gateway.create_many(
+            [
+                AuthUser(
+                    auth_user_id=auth_user_id,
+                    user_id=user.id,
+                    user=user,
+                )
+                for auth_user_id, user in users.items()
+            ],
+        )
+
+        logger.info("Successfully created AuthUser entries", created=len(created), conflicts=len(users) - len(created))
+        return created
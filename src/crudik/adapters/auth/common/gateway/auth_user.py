@@ -1,18 +1,41 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from crudik.adapters.auth.model import AuthUser, AuthUserId
+from crudik.entities.user import User
 
 
-class AuthUserGateway(Protocol):
+class AuthUserReader(Protocol):
+    """Protocol defining the read-only interface for authentication user records, which may be served by a replica."""
+
+    @abstractmethod
+    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
+        """Retrieves an authentication user entity by ID, returns None if not found."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user(self, auth_user_id: AuthUserId) -> User | None:
+        """Retrieves the application user linked to the auth user ID, returns None if there is no such link."""
+        raise NotImplementedError
+
+
+class AuthUserGateway(AuthUserReader, Protocol):
     """Protocol defining the interface for accessing authentication user records from persistent storage."""
 
     @abstractmethod
-    async def is_exists(self, auth_user_id: AuthUserId) -> bool:
-        """Checks whether an authentication user record exists for the given auth user ID."""
+    async def create(self, auth_user: AuthUser) -> bool:
+        """Atomically persists the authentication user record together with its application user.
+
+        Returns False and persists nothing if a record with the same auth user ID already exists.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
-        """Retrieves an authentication user entity by ID, returns None if not found."""
+    async def create_many(self, auth_users: Sequence[AuthUser]) -> set[AuthUserId]:
+        """Persists the authentication user records together with their application users.
+
+        Records whose auth user ID already exists are skipped along with their users.
+        Returns the IDs of the records that were created.
+        """
         raise NotImplementedError
@@ -11,6 +11,7 @@ class UnauthorizedReason(Enum):
     INVALID_AUTH_USER_ID = "INVALID_AUTH_USER_ID"
     MISSING_ACCESS_TOKEN = "MISSING_ACCESS_TOKEN"  # noqa: S105
     CORRUPTED_ACCESS_TOKEN = "CORRUPTED_ACCESS_TOKEN"  # noqa: S105
+    INVALID_ACCESS_TOKEN = "INVALID_ACCESS_TOKEN"  # noqa: S105
     EMAIL_IS_NOT_VERIFIED = "EMAIL_IS_NOT_VERIFIED"
 
 
@@ -30,3 +31,11 @@ class UnauthorizedError(AppError):
             "reason": self.reason,
             "header": self.header,
         }
+
+
+@app_error
+class AuthUnavailableError(AppError):
+    """Error raised when the identity provider needed to authenticate a request cannot be reached."""
+
+    code: ClassVar[str] = "AUTH_UNAVAILABLE"
+    message: str = "Authentication is temporarily unavailable"
@@ -0,0 +1,70 @@
+import asyncio
+from abc import abstractmethod
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Protocol, override
+
+import jwt
+
+from crudik.adapters.auth.idp.jwks import JWKSKeyStore
+
+
+class AccessTokenDecoder(Protocol):
+    """Protocol for turning a raw access token into its claims."""
+
+    @abstractmethod
+    async def decode(self, access_token: str) -> dict[str, Any]:
+        """Returns the claims of the token, raises ``jwt.PyJWTError`` if the token is invalid or expired."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class UnverifiedAccessTokenDecoder(AccessTokenDecoder):
+    """Decodes tokens without checking the signature, relying on a proxy in front of the app to have done it."""
+
+    algorithm: str
+
+    @override
+    async def decode(self, access_token: str) -> dict[str, Any]:
+        claims: dict[str, Any] = jwt.decode(
+            access_token,
+            options={"verify_signature": False, "verify_exp": True},
+            algorithms=[self.algorithm],
+        )
+        return claims
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class VerifiedAccessTokenDecoder(AccessTokenDecoder):
+    """Verifies token signatures against JWKS public keys.
+
+    Signature checks are CPU-heavy, so they run in a bounded thread pool instead of the event loop.
+    """
+
+    algorithm: str
+    audience: str | None
+    key_store: JWKSKeyStore
+    executor: Executor
+
+    @override
+    async def decode(self, access_token: str) -> dict[str, Any]:
+        kid = jwt.get_unverified_header(access_token).get("kid")
+        if kid is None:
+            msg = "Access token header has no kid"
+            raise jwt.InvalidTokenError(msg)
+
+        key = await self.key_store.get_key(kid)
+        loop = asyncio.get_running_loop()
+        claims: dict[str, Any] = await loop.run_in_executor(
+            self.executor,
+            partial(
+                jwt.decode,
+                access_token,
+                key=key,
+                algorithms=[self.algorithm],
+                audience=self.audience,
+                options={"verify_exp": True, "verify_aud": self.audience is not None},
+            ),
+        )
+        return claims
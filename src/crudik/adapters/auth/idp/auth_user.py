@@ -1,13 +1,18 @@
-from dataclasses import dataclass
-from typing import override
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, override
 
 import jwt
 import structlog
 from fastapi import Request
 
 from crudik.adapters.auth.errors.base import UnauthorizedError, UnauthorizedReason
+from crudik.adapters.auth.idp.access_token import AccessTokenDecoder
 from crudik.adapters.auth.idp.base import AuthUserIdProvider
 from crudik.adapters.auth.model import AuthUserId
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache, get_access_token_digest
+from crudik.adapters.cache.ttl import MISSING
 from crudik.application.common.logger import Logger
 
 logger: Logger = structlog.get_logger(__name__)
@@ -15,25 +20,75 @@ logger: Logger = structlog.get_logger(__name__)
 
 @dataclass(slots=True, kw_only=True)
 class WebAuthConfig:
-    """Configuration for web-based user ID provider."""
+    """Configuration for web-based user ID provider.
+
+    With ``verify_signature`` the access token signature is checked against the keys from ``jwks_uri``
+    and the auth user ID is taken from the ``user_id_claim`` of the token instead of ``user_id_header``,
+    so the app does not need a proxy in front of it to be trusted.
+    Roles are read from the ``roles_claim`` of the access token, a dot-separated path to a list of names.
+    """
 
     user_id_header: str
     access_token_header: str
     access_token_alg: str
     allow_unverified_email: bool
+    verify_signature: bool = False
+    jwks_uri: str | None = None
+    jwks_refresh_interval: float = 60.0
+    access_token_audience: str | None = None
+    user_id_claim: str = "sub"
+    verification_workers: int = 4
+    roles_claim: str = "realm_access.roles"
 
 
-@dataclass(frozen=True, kw_only=True, slots=True)
+@dataclass(kw_only=True, slots=True)
 class WebAuthUserIdProvider(AuthUserIdProvider):
-    """Adapter that extracts authentication user ID from HTTP request headers."""
+    """Adapter that extracts authentication user ID from HTTP request headers.
+
+    The instance lives in the request scope, so the ID is resolved once and shared by every consumer.
+    """
 
     http_request: Request
     config: WebAuthConfig
+    claims_cache: AccessTokenClaimsCache
+    decoder: AccessTokenDecoder
+    _auth_user_id: AuthUserId | None = field(default=None, init=False)
 
     @override
     async def get_auth_user_id(self) -> AuthUserId:
-        """Reads the auth user ID from the configured HTTP header, raises UnauthorizedError if header is missing."""
-        if (user_id := self.http_request.headers.get(self.config.user_id_header)) is None:
+        """Returns the auth user ID of the request, resolving it on the first call."""
+        if self._auth_user_id is None:
+            self._auth_user_id = await self._resolve_auth_user_id()
+        return self._auth_user_id
+
+    @override
+    async def get_roles(self) -> frozenset[str]:
+        """Returns the roles listed in the access token, none if the token has no roles claim."""
+        value: Any = await self._get_access_token_claims()
+        for key in self.config.roles_claim.split("."):
+            if not isinstance(value, Mapping) or key not in value:
+                return frozenset()
+            value = value[key]
+        if not isinstance(value, list):
+            logger.debug("Access token roles claim is not a list", claim=self.config.roles_claim)
+            return frozenset()
+        return frozenset(str(role) for role in value)
+
+    async def _resolve_auth_user_id(self) -> AuthUserId:
+        """Reads the auth user ID from the configured HTTP header or the verified access token.
+
+        Raises UnauthorizedError if it is missing.
+        """
+        claims: Mapping[str, Any] | None = None
+        if self.config.verify_signature:
+            claims = await self._get_access_token_claims()
+            if (user_id := claims.get(self.config.user_id_claim)) is None:
+                logger.debug("Request unauthorized due to missing user id claim", claim=self.config.user_id_claim)
+                raise UnauthorizedError(
+                    message="Corrupted access token",
+                    reason=UnauthorizedReason.CORRUPTED_ACCESS_TOKEN,
+                )
+        elif (user_id := self.http_request.headers.get(self.config.user_id_header)) is None:
             logger.debug("Request unauthorized due to missing user id header", header=self.config.user_id_header)
             msg = f"Missing {self.config.user_id_header} header"
             raise UnauthorizedError(
@@ -43,24 +98,10 @@ class WebAuthUserIdProvider(AuthUserIdProvider):
             )
 
         if not self.config.allow_unverified_email:
-            access_token = self.http_request.headers.get(self.config.access_token_header)
-            if access_token is None:
-                logger.debug(
-                    "Request unauthorized due to missing access token header",
-                    header=self.config.access_token_header,
-                )
-                msg = f"Missing {self.config.access_token_header} header"
-                raise UnauthorizedError(
-                    message=msg,
-                    reason=UnauthorizedReason.MISSING_ACCESS_TOKEN,
-                    header=self.config.access_token_header,
-                )
+            if claims is None:
+                claims = await self._get_access_token_claims()
             try:
-                email_verified: bool = jwt.decode(
-                    access_token,
-                    options={"verify_signature": False, "verify_exp": True},
-                    algorithms=[self.config.access_token_alg],
-                )["email_verified"]
+                email_verified: bool = claims["email_verified"]
             except KeyError as e:
                 logger.debug("Request unauthorized due to corrupted access token")
                 raise UnauthorizedError(
@@ -75,4 +116,45 @@ class WebAuthUserIdProvider(AuthUserIdProvider):
                     reason=UnauthorizedReason.EMAIL_IS_NOT_VERIFIED,
                 )
 
-        return user_id
+        return str(user_id)
+
+    async def _get_access_token_claims(self) -> Mapping[str, Any]:
+        """Reads and decodes the access token from the configured HTTP header.
+
+        Raises UnauthorizedError if it is missing or invalid.
+        """
+        access_token = self.http_request.headers.get(self.config.access_token_header)
+        if access_token is None:
+            logger.debug(
+                "Request unauthorized due to missing access token header",
+                header=self.config.access_token_header,
+            )
+            msg = f"Missing {self.config.access_token_header} header"
+            raise UnauthorizedError(
+                message=msg,
+                reason=UnauthorizedReason.MISSING_ACCESS_TOKEN,
+                header=self.config.access_token_header,
+            )
+
+        try:
+            return await self._decode_access_token(access_token)
+        except jwt.PyJWTError as e:
+            logger.debug("Request unauthorized due to invalid access token", error=str(e))
+            raise UnauthorizedError(
+                message="Invalid access token",
+                reason=UnauthorizedReason.INVALID_ACCESS_TOKEN,
+            ) from e
+
+    async def _decode_access_token(self, access_token: str) -> Mapping[str, Any]:
+        """Decodes the access token, reusing claims of a token that was already decoded.
+
+        Cached claims expire together with the token, so an expired token is decoded again and rejected.
+        """
+        digest = get_access_token_digest(access_token)
+        if (claims := self.claims_cache.get(digest)) is not MISSING:
+            return claims
+
+        decoded = await self.decoder.decode(access_token)
+        exp = decoded.get("exp")
+        self.claims_cache.set(digest, decoded, ttl=None if exp is None else exp - time.time())
+        return decoded
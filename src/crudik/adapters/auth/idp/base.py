@@ -11,3 +11,8 @@ class AuthUserIdProvider(Protocol):
     async def get_auth_user_id(self) -> AuthUserId:
         """Extracts and returns the authentication user ID from the current request (e.g., from headers or tokens)."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_roles(self) -> frozenset[str]:
+        """Returns the roles granted to the authentication user of the current request."""
+        raise NotImplementedError
@@ -0,0 +1,73 @@
+import asyncio
+import time
+import urllib.request
+from concurrent.futures import Executor
+from pathlib import Path
+
+import jwt
+import structlog
+
+from crudik.adapters.auth.errors.base import AuthUnavailableError
+from crudik.application.common.logger import Logger
+
+logger: Logger = structlog.get_logger(__name__)
+
+JWKS_FETCH_TIMEOUT = 10
+
+
+def fetch_jwks(jwks_uri: str) -> jwt.PyJWKSet:
+    """Loads a JWKS document from an URL or from a local file, which can stand in for the identity provider."""
+    if "://" in jwks_uri:
+        with urllib.request.urlopen(jwks_uri, timeout=JWKS_FETCH_TIMEOUT) as response:  # noqa: S310
+            data = response.read().decode()
+    else:
+        data = Path(jwks_uri).read_text("utf-8")
+    return jwt.PyJWKSet.from_json(data)
+
+
+class JWKSKeyStore:
+    """Application-wide store of parsed public keys from a JWKS document, looked up by ``kid``.
+
+    The document is loaded lazily and reloaded when a token is signed with an unknown key,
+    but not more often than ``refresh_interval`` after a successful load,
+    so forged ``kid`` values cannot flood the identity provider, while a failed load is retried by the next request.
+    """
+
+    def __init__(self, *, jwks_uri: str, refresh_interval: float, executor: Executor) -> None:
+        self._jwks_uri = jwks_uri
+        self._refresh_interval = refresh_interval
+        self._executor = executor
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._refreshed_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        """Returns the public key with the given ID, raises ``jwt.PyJWKClientError`` if there is none.
+
+        Raises ``AuthUnavailableError`` if the JWKS document cannot be loaded.
+        """
+        if (key := self._keys.get(kid)) is not None:
+            return key
+
+        async with self._lock:
+            if kid not in self._keys and self._can_refresh():
+                await self._refresh()
+
+        if (key := self._keys.get(kid)) is None:
+            msg = f"Unable to find a signing key that matches {kid!r}"
+            raise jwt.PyJWKClientError(msg)
+        return key
+
+    def _can_refresh(self) -> bool:
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self._refresh_interval
+
+    async def _refresh(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            jwk_set = await loop.run_in_executor(self._executor, fetch_jwks, self._jwks_uri)
+        except (OSError, ValueError, jwt.PyJWKSetError) as e:
+            logger.warning("JWKS loading failed", jwks_uri=self._jwks_uri, error=str(e))
+            raise AuthUnavailableError from e
+        self._refreshed_at = time.monotonic()
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id is not None}
+        logger.info("JWKS loaded", jwks_uri=self._jwks_uri, kids=list(self._keys))
@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import override
 
 import structlog
 
-from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway
+from crudik.adapters.auth.common.gateway.auth_user import AuthUserReader
 from crudik.adapters.auth.errors.base import UnauthorizedError, UnauthorizedReason
 from crudik.adapters.auth.idp.base import AuthUserIdProvider
 from crudik.application.common.idp import IdProvider
@@ -13,22 +13,37 @@ from crudik.entities.user import User
 logger: Logger = structlog.get_logger(__name__)
 
 
-@dataclass(frozen=True, kw_only=True, slots=True)
+@dataclass(kw_only=True, slots=True)
 class IdProviderImpl(IdProvider):
-    """Adapter implementation that resolves application User entity from authentication user ID."""
+    """Adapter implementation that resolves application User entity from authentication user ID.
+
+    The instance lives in the request scope, so the user is resolved once and shared by every consumer.
+    """
 
     auth_user_idp: AuthUserIdProvider
-    auth_user_gateway: AuthUserGateway
+    auth_user_gateway: AuthUserReader
+    _user: User | None = field(default=None, init=False)
 
     @override
     async def get_user(self) -> User:
+        """Returns the authenticated user of the request, resolving it on the first call."""
+        if self._user is None:
+            self._user = await self._resolve_user()
+        return self._user
+
+    @override
+    async def has_role(self, role: str) -> bool:
+        """Checks the role among the roles of the auth user of the request."""
+        return role in await self.auth_user_idp.get_roles()
+
+    async def _resolve_user(self) -> User:
         """Resolves the authenticated user by looking up the auth user ID.
 
         and returning the associated application user.
         """
         auth_user_id = await self.auth_user_idp.get_auth_user_id()
-        if (auth_user := await self.auth_user_gateway.get(auth_user_id)) is None:
+        if (user := await self.auth_user_gateway.get_user(auth_user_id)) is None:
             logger.info("Request unauthorized due to auth user is not exists", auth_user_id=auth_user_id)
             raise UnauthorizedError(reason=UnauthorizedReason.INVALID_AUTH_USER_ID)
 
-        return auth_user.user
+        return user
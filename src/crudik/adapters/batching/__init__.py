@@ -0,0 +1,5 @@
+from .loader import BatchLoader
+
+__all__ = [
+    "BatchLoader",
+]
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, kw_only=True)
+class BatchingConfig:
+    """Cross-request batching of gateway lookups configuration."""
+
+    enabled: bool = False
+    window: float = 0.002
+    max_batch_size: int = 100
@@ -0,0 +1,48 @@
+from collections.abc import Sequence
+from typing import override
+
+from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway
+from crudik.adapters.auth.model import AuthUser, AuthUserId
+from crudik.adapters.batching.loader import BatchLoader
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.user import User
+
+
+class AuthUserLoader(BatchLoader[AuthUserId, UserId]):
+    """Application-wide loader of auth user ID to application user ID mappings."""
+
+
+class BatchingAuthUserGateway(AuthUserGateway):
+    """AuthUserGateway decorator that merges auth user lookups of concurrent requests into one query.
+
+    Only the identifiers are loaded: a lookup builds fresh entities,
+    so no ORM instance is ever shared between sessions.
+    """
+
+    def __init__(self, gateway: AuthUserGateway, loader: AuthUserLoader) -> None:
+        self._gateway = gateway
+        self._loader = loader
+
+    @override
+    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
+        """Retrieves an authentication user entity through the batching loader."""
+        if (user_id := await self._loader.load(auth_user_id)) is None:
+            return None
+        return AuthUser(auth_user_id=auth_user_id, user_id=user_id, user=User(user_id))
+
+    @override
+    async def get_user(self, auth_user_id: AuthUserId) -> User | None:
+        """Retrieves the linked application user through the batching loader."""
+        if (user_id := await self._loader.load(auth_user_id)) is None:
+            return None
+        return User(user_id)
+
+    @override
+    async def create(self, auth_user: AuthUser) -> bool:
+        """Persists the authentication user record with the wrapped gateway."""
+        return await self._gateway.create(auth_user)
+
+    @override
+    async def create_many(self, auth_users: Sequence[AuthUser]) -> set[AuthUserId]:
+        """Persists the authentication user records with the wrapped gateway."""
+        return await self._gateway.create_many(auth_users)
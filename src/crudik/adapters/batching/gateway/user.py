@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from typing import override
+
+from crudik.adapters.batching.loader import BatchLoader
+from crudik.application.common.gateway.user import UserGateway
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.user import User
+
+
+class UserLoader(BatchLoader[UserId, UserId]):
+    """Application-wide loader checking which user IDs exist."""
+
+
+class BatchingUserGateway(UserGateway):
+    """UserGateway decorator that merges single user lookups of concurrent requests into one query.
+
+    The loader reads on its own connection, so it only sees committed users,
+    and a lookup builds a fresh entity that is not attached to the request session.
+    """
+
+    def __init__(self, gateway: UserGateway, loader: UserLoader) -> None:
+        self._gateway = gateway
+        self._loader = loader
+
+    @override
+    async def get(self, user_id: UserId) -> User | None:
+        """Retrieves a user entity through the batching loader."""
+        if (loaded_id := await self._loader.load(user_id)) is None:
+            return None
+        return User(loaded_id)
+
+    @override
+    async def get_many(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Asks the wrapped gateway, as the lookup is already batched."""
+        return await self._gateway.get_many(user_ids)
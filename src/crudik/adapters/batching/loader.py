@@ -0,0 +1,76 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+type LoadMany[K, V] = Callable[[Sequence[K]], Awaitable[Mapping[K, V]]]
+
+
+class BatchLoader[K, V]:
+    """Application-wide loader that merges lookups of concurrent requests into one batch query.
+
+    Keys are collected for ``window`` seconds or until there are ``max_batch_size`` of them,
+    then loaded with a single ``load_many`` call. Concurrent lookups of the same key share one future,
+    and a cancelled caller does not cancel the lookup for the others.
+
+    Not thread-safe, it is meant to be shared between coroutines of a single event loop.
+    """
+
+    def __init__(self, *, load_many: LoadMany[K, V], window: float, max_batch_size: int) -> None:
+        self._load_many = load_many
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._batch: list[K] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Returns the value for the key, or None if there is none."""
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            self._batch.append(key)
+
+            if len(self._batch) >= self._max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self._window, self._dispatch)
+
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Loads the collected keys and waits for all batches in flight."""
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._load(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, batch: list[K]) -> None:
+        try:
+            values = await self._load_many(batch)
+        except asyncio.CancelledError:
+            for key in batch:
+                self._futures.pop(key).cancel()
+            raise
+        except Exception as error:  # noqa: BLE001
+            for key in batch:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for key in batch:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_result(values.get(key))
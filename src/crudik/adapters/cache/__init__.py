@@ -0,0 +1,8 @@
+from .ttl import MISSING, CacheStats, Missing, TTLCache
+
+__all__ = [
+    "MISSING",
+    "CacheStats",
+    "Missing",
+    "TTLCache",
+]
@@ -0,0 +1,16 @@
+import hashlib
+from collections.abc import Mapping
+from typing import Any
+
+from crudik.adapters.cache.ttl import TTLCache
+
+type AccessTokenDigest = bytes
+
+
+class AccessTokenClaimsCache(TTLCache[AccessTokenDigest, Mapping[str, Any]]):
+    """Application-wide cache of already decoded access token claims, keyed by token digest."""
+
+
+def get_access_token_digest(access_token: str) -> AccessTokenDigest:
+    """Returns a short fixed-size digest of the token, so the cache does not keep raw tokens in memory."""
+    return hashlib.blake2b(access_token.encode(), digest_size=16).digest()
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, kw_only=True)
+class TTLCacheConfig:
+    """Configuration of a single in-process TTL cache."""
+
+    enabled: bool = True
+    max_size: int = 10_000
+    ttl: float = 60.0
+
+
+@dataclass(slots=True, kw_only=True)
+class UserCacheConfig(TTLCacheConfig):
+    """Configuration of the user cache, which remembers missing users for a shorter time.
+
+    Entries are not invalidated, so ``ttl`` bounds how long a user changed outside of the application is served stale.
+    """
+
+    negative_ttl: float = 5.0
+
+
+@dataclass(slots=True, kw_only=True)
+class CacheConfig:
+    """In-process caches configuration."""
+
+    auth_user: TTLCacheConfig
+    access_token: TTLCacheConfig
+    user: UserCacheConfig
@@ -0,0 +1,61 @@
+from collections.abc import Sequence
+from typing import override
+
+from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway
+from crudik.adapters.auth.model import AuthUser, AuthUserId
+from crudik.adapters.cache.ttl import MISSING, TTLCache
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.user import User
+
+
+class AuthUserCache(TTLCache[AuthUserId, UserId]):
+    """Application-wide cache of auth user ID to application user ID mappings."""
+
+
+class CachedAuthUserGateway(AuthUserGateway):
+    """AuthUserGateway decorator that serves auth user lookups from an in-process cache.
+
+    Only the identifiers are cached: a hit builds fresh entities,
+    so no ORM instance is ever shared between sessions.
+    """
+
+    def __init__(self, gateway: AuthUserGateway, cache: AuthUserCache) -> None:
+        self._gateway = gateway
+        self._cache = cache
+
+    @override
+    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
+        """Retrieves an authentication user entity from the cache, falling back to the wrapped gateway."""
+        if (user_id := self._cache.get(auth_user_id)) is not MISSING:
+            return AuthUser(auth_user_id=auth_user_id, user_id=user_id, user=User(user_id))
+
+        if (auth_user := await self._gateway.get(auth_user_id)) is not None:
+            self._cache.set(auth_user_id, auth_user.user_id)
+
+        return auth_user
+
+    @override
+    async def get_user(self, auth_user_id: AuthUserId) -> User | None:
+        """Retrieves the linked application user from the cache, falling back to the wrapped gateway."""
+        if (user_id := self._cache.get(auth_user_id)) is not MISSING:
+            return User(user_id)
+
+        if (user := await self._gateway.get_user(auth_user_id)) is not None:
+            self._cache.set(auth_user_id, user.id)
+
+        return user
+
+    @override
+    async def create(self, auth_user: AuthUser) -> bool:
+        """Persists the authentication user record and drops the cached mapping for its ID."""
+        created = await self._gateway.create(auth_user)
+        self._cache.invalidate(auth_user.auth_user_id)
+        return created
+
+    @override
+    async def create_many(self, auth_users: Sequence[AuthUser]) -> set[AuthUserId]:
+        """Persists the authentication user records and drops the cached mappings for their IDs."""
+        created = await self._gateway.create_many(auth_users)
+        for auth_user_id in created:
+            self._cache.invalidate(auth_user_id)
+        return created
@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+from typing import override
+
+from crudik.adapters.cache.ttl import MISSING, TTLCache
+from crudik.application.common.gateway.user import UserGateway
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.user import User
+
+
+class UserCache(TTLCache[UserId, bool]):
+    """Application-wide cache of whether a user ID exists, remembering missing users too."""
+
+
+class CachedUserGateway(UserGateway):
+    """UserGateway decorator that serves user lookups from an in-process read-through cache.
+
+    Missing users are cached for ``negative_ttl`` only, so IDs probed before the user exists do not stick.
+    The application never changes or deletes users and creates them with fresh random IDs, so entries
+    are not invalidated: users changed outside of it are served from the cache until the entry expires.
+    """
+
+    def __init__(self, gateway: UserGateway, cache: UserCache, negative_ttl: float) -> None:
+        self._gateway = gateway
+        self._cache = cache
+        self._negative_ttl = negative_ttl
+
+    @override
+    async def get(self, user_id: UserId) -> User | None:
+        """Retrieves a user entity from the cache, falling back to the wrapped gateway."""
+        if (exists := self._cache.get(user_id)) is not MISSING:
+            return User(user_id) if exists else None
+
+        user = await self._gateway.get(user_id)
+        self._remember(user_id, exists=user is not None)
+        return user
+
+    @override
+    async def get_many(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Retrieves user entities from the cache, loading the rest with one call of the wrapped gateway."""
+        users: list[User] = []
+        misses: list[UserId] = []
+        for user_id in user_ids:
+            exists = self._cache.get(user_id)
+            if exists is MISSING:
+                misses.append(user_id)
+            elif exists:
+                users.append(User(user_id))
+
+        if not misses:
+            return users
+
+        loaded = await self._gateway.get_many(misses)
+        loaded_ids = {user.id for user in loaded}
+        for user_id in misses:
+            self._remember(user_id, exists=user_id in loaded_ids)
+        return users + loaded
+
+    def _remember(self, user_id: UserId, *, exists: bool) -> None:
+        self._cache.set(user_id, exists, ttl=None if exists else self._negative_ttl)
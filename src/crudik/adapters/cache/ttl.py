@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Literal
+
+
+class Missing(Enum):
+    """Sentinel type returned by cache lookups when there is no live entry for the key."""
+
+    MISSING = "MISSING"
+
+
+MISSING = Missing.MISSING
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters describing how effective a cache is."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class TTLCache[K, V]:
+    """Bounded in-process LRU cache whose entries expire after a time-to-live.
+
+    Not thread-safe, it is meant to be shared between coroutines of a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Returns the number of stored entries, including expired ones that were not evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V | Literal[Missing.MISSING]:
+        """Returns the cached value for the key, or ``MISSING`` if it is absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Stores the value, evicting the least recently used entry if the cache is full.
+
+        ``ttl`` shortens the default time-to-live of the cache for this entry.
+        """
+        if self._max_size <= 0:
+            return
+
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Drops the entry for the key, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        self._entries.clear()
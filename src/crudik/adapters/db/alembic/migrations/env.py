@@ -6,8 +6,9 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
+from crudik.adapters.db.config import DbConfig
 from crudik.adapters.db.models.base import mapper_registry
-from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.config.toml import get_toml_config_path, load_section_from_toml
 
 config = context.config
 
@@ -18,7 +19,8 @@ target_metadata = mapper_registry.metadata
 
 
 def get_url() -> str:
-    config = load_config_from_toml(get_toml_config_path()).db
+    # Only the database section is loaded, so migrations do not import the web stack
+    config = load_section_from_toml(get_toml_config_path(), "db", DbConfig)
     url = config.connection_url
     return url.render_as_string(hide_password=False)
 
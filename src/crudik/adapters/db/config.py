@@ -1,32 +1,65 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sqlalchemy import URL
 
 
+@dataclass(slots=True, kw_only=True)
+class DbReplicaConfig:
+    """Read replica address, credentials and database name are shared with the primary.
+
+    Pool limits default to the ones of the primary.
+    """
+
+    host: str
+    port: int
+    pool_size: int | None = None
+    max_overflow: int | None = None
+
+
 @dataclass(slots=True, kw_only=True)
 class DbConfig:
-    """Database connection configuration parameters."""
+    """Database connection configuration parameters.
+
+    ``pgbouncer`` makes connections safe behind PgBouncer in transaction pooling mode,
+    where consecutive transactions may run on different server connections: prepared statements are not cached
+    and get unique names, and ``server_settings`` are not sent, so set them on the role or database instead.
+    ``null_pool`` opens a connection per checkout, leaving all pooling to PgBouncer.
+    """
 
     user: str
     password: str
     host: str
     port: int
     db_name: str
+    replicas: list[DbReplicaConfig] = field(default_factory=list)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: float | None = None
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+    server_settings: dict[str, str] = field(default_factory=dict)
+    pgbouncer: bool = False
+    null_pool: bool = False
+    replica_retry_interval: float = 5.0
+    read_your_writes_window: float = 5.0
 
     @property
     def connection_url(self) -> URL:
         """Constructs and returns the SQLAlchemy asyncpg connection URL string for database connections."""
-        user = self.user
-        password = self.password
-        host = self.host
-        port = self.port
-        db_name = self.db_name
+        return self._make_url(self.host, self.port)
+
+    @property
+    def replica_urls(self) -> list[URL]:
+        """Constructs and returns the SQLAlchemy asyncpg connection URLs of the read replicas."""
+        return [self._make_url(replica.host, replica.port) for replica in self.replicas]
 
+    def _make_url(self, host: str, port: int) -> URL:
         return URL.create(
             drivername="postgresql+asyncpg",
-            username=user,
-            password=password,
+            username=self.user,
+            password=self.password,
             port=port,
             host=host,
-            database=db_name,
+            database=self.db_name,
         )
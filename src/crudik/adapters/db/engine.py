@@ -0,0 +1,58 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from crudik.adapters.db.config import DbConfig
+from crudik.adapters.db.pool import InstrumentedAsyncQueuePool
+
+
+def _make_prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def create_engine(
+    config: DbConfig,
+    url: URL,
+    *,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> AsyncEngine:
+    """Creates an engine with the pool and asyncpg connection settings from the config.
+
+    ``pool_size`` and ``max_overflow`` override the configured ones, e.g. for a differently sized replica.
+    """
+    pool_options: dict[str, Any]
+    if config.null_pool:
+        pool_options = {"poolclass": NullPool}
+    else:
+        pool_options = {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": config.pool_size if pool_size is None else pool_size,
+            "max_overflow": config.max_overflow if max_overflow is None else max_overflow,
+            "pool_timeout": config.pool_timeout,
+        }
+
+    connect_args: dict[str, Any]
+    if config.pgbouncer:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _make_prepared_statement_name,
+        }
+    else:
+        connect_args = {
+            "statement_cache_size": config.statement_cache_size,
+            "server_settings": config.server_settings,
+        }
+
+    return create_async_engine(
+        url,
+        future=True,
+        pool_recycle=-1 if config.pool_recycle is None else config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args=connect_args,
+        **pool_options,
+    )
@@ -1,11 +1,16 @@
+from collections.abc import Sequence
 from typing import override
 
-from sqlalchemy import exists, select
+from sqlalchemy import UUID, Text, any_, delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway
 from crudik.adapters.auth.model import AuthUser, AuthUserId
 from crudik.adapters.db.models.auth_user import auth_user_table
+from crudik.adapters.db.models.user import user_table
+from crudik.entities.user import User
 
 
 class SAAuthUserGateway(AuthUserGateway):
@@ -15,15 +20,79 @@ class SAAuthUserGateway(AuthUserGateway):
         self._session = session
 
     @override
-    async def is_exists(self, auth_user_id: AuthUserId) -> bool:
-        """Checks whether an authentication user record exists in the database for the given auth user ID."""
+    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
+        """Retrieves an authentication user entity from the database by auth user ID, returns None if not found."""
+        return await self._session.get(AuthUser, auth_user_id)
+
+    @override
+    async def get_user(self, auth_user_id: AuthUserId) -> User | None:
+        """Loads the linked user with a single joined query instead of loading AuthUser and its relationship."""
         return (
             await self._session.execute(
-                select(exists().where(auth_user_table.c.auth_user_id == auth_user_id)),
+                select(User)
+                .join(auth_user_table, auth_user_table.c.user_id == user_table.c.id)
+                .where(auth_user_table.c.auth_user_id == auth_user_id),
             )
-        ).scalar_one()
+        ).scalar_one_or_none()
 
     @override
-    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
-        """Retrieves an authentication user entity from the database by auth user ID, returns None if not found."""
-        return await self._session.get(AuthUser, auth_user_id)
+    async def create(self, auth_user: AuthUser) -> bool:
+        """Inserts the user and the auth user record with a single statement.
+
+        The auth user insert does nothing on conflict, so an existing auth user ID yields no row.
+        The orphan user row is then discarded with the rollback of the transaction.
+        """
+        new_user = insert(user_table).values(id=auth_user.user_id).returning(user_table.c.id).cte("new_user")
+        statement = (
+            pg_insert(auth_user_table)
+            .from_select(
+                [auth_user_table.c.auth_user_id, auth_user_table.c.user_id],
+                select(literal(auth_user.auth_user_id, Text), new_user.c.id),
+            )
+            .on_conflict_do_nothing(index_elements=[auth_user_table.c.auth_user_id])
+            .returning(auth_user_table.c.user_id)
+            .add_cte(new_user)
+        )
+        return (await self._session.execute(statement)).scalar_one_or_none() is not None
+
+    @override
+    async def create_many(self, auth_users: Sequence[AuthUser]) -> set[AuthUserId]:
+        """Inserts all users and auth user records with a single statement.
+
+        The rows are passed as two arrays, so the statement does not depend on the batch size.
+        Users of conflicting records are deleted by a second statement, issued only if there were conflicts.
+        """
+        if not auth_users:
+            return set()
+
+        rows = select(
+            func.unnest(literal([auth_user.auth_user_id for auth_user in auth_users], ARRAY(Text))).label(
+                "auth_user_id",
+            ),
+            func.unnest(literal([auth_user.user_id for auth_user in auth_users], ARRAY(UUID))).label("user_id"),
+        ).cte("rows")
+        new_users = (
+            insert(user_table)
+            .from_select([user_table.c.id], select(rows.c.user_id))
+            .returning(user_table.c.id)
+            .cte("new_users")
+        )
+        statement = (
+            pg_insert(auth_user_table)
+            .from_select(
+                [auth_user_table.c.auth_user_id, auth_user_table.c.user_id],
+                select(rows.c.auth_user_id, new_users.c.id).join(new_users, new_users.c.id == rows.c.user_id),
+            )
+            .on_conflict_do_nothing(index_elements=[auth_user_table.c.auth_user_id])
+            .returning(auth_user_table.c.auth_user_id, auth_user_table.c.user_id)
+            .add_cte(rows, new_users)
+        )
+        created = {row.auth_user_id: row.user_id for row in await self._session.execute(statement)}
+
+        if orphans := [
+            auth_user.user_id for auth_user in auth_users if created.get(auth_user.auth_user_id) != auth_user.user_id
+        ]:
+            await self._session.execute(
+                delete(user_table).where(user_table.c.id == any_(literal(orphans, ARRAY(UUID)))),
+            )
+        return set(created)
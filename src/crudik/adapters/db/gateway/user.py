@@ -1,7 +1,11 @@
+from collections.abc import Sequence
 from typing import override
 
+from sqlalchemy import UUID, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from crudik.adapters.db.models.user import user_table
 from crudik.application.common.gateway.user import UserGateway
 from crudik.entities.common.identifiers import UserId
 from crudik.entities.user import User
@@ -17,3 +21,20 @@ class SAUserGateway(UserGateway):
     async def get(self, user_id: UserId) -> User | None:
         """Queries the database for a user by ID using SQLAlchemy session, returns None if not found."""
         return await self._session.get(User, user_id)
+
+    @override
+    async def get_many(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Queries the database for all users with a single ``id = ANY(:ids)`` statement.
+
+        The IDs are bound as one array, so the statement text does not depend on their count.
+        """
+        if not user_ids:
+            return []
+
+        return list(
+            (
+                await self._session.execute(
+                    select(User).where(user_table.c.id == any_(literal(list(user_ids), ARRAY(UUID)))),
+                )
+            ).scalars(),
+        )
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.adapters.db.pool import get_pool_saturation
+from crudik.application.common.logger import Logger
+
+logger: Logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class HealthConfig:
+    """Background database health check configuration.
+
+    The pod is not ready when the last check failed, is older than ``max_age``,
+    or when the primary pool saturation exceeds ``max_pool_saturation``.
+    """
+
+    interval: float = 2.0
+    timeout: float = 1.0
+    max_age: float = 10.0
+    max_pool_saturation: float = 1.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DbHealth:
+    """Snapshot of the database health, as seen by the last background check."""
+
+    ready: bool
+    healthy: bool
+    age: float | None
+    pool_saturation: float
+    error: str | None
+
+
+class DbHealthChecker:
+    """Application-wide periodic check of the primary database.
+
+    The check runs in background on a single pooled connection, so probes only read its cached result
+    and never wait for the pool themselves.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: HealthConfig,
+        engine: AsyncEngine,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._engine = engine
+        self._clock = clock
+        self._healthy = False
+        self._checked_at: float | None = None
+        self._error: str | None = None
+
+    async def check(self) -> None:
+        """Runs a single check, recording its outcome instead of raising errors."""
+        try:
+            async with asyncio.timeout(self._config.timeout), self._engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        except Exception as e:  # noqa: BLE001
+            if self._healthy or self._checked_at is None:
+                await logger.awarning("Database is not healthy", exc_info=e)
+            self._healthy = False
+            self._error = type(e).__name__
+        else:
+            if not self._healthy and self._checked_at is not None:
+                await logger.ainfo("Database is healthy again")
+            self._healthy = True
+            self._error = None
+        self._checked_at = self._clock()
+
+    async def run(self) -> None:
+        """Checks the database every ``interval`` until cancelled."""
+        while True:
+            await self.check()
+            await asyncio.sleep(self._config.interval)
+
+    def get_health(self) -> DbHealth:
+        """Returns the cached state of the last check, with the live pool saturation."""
+        age = None if self._checked_at is None else self._clock() - self._checked_at
+        saturation = get_pool_saturation(self._engine.pool)
+        return DbHealth(
+            ready=(
+                self._healthy
+                and age is not None
+                and age <= self._config.max_age
+                and saturation <= self._config.max_pool_saturation
+            ),
+            healthy=self._healthy,
+            age=age,
+            pool_saturation=saturation,
+            error=self._error,
+        )
@@ -0,0 +1,30 @@
+from collections.abc import Sequence
+
+from sqlalchemy import UUID, Text, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.adapters.auth.model import AuthUserId
+from crudik.adapters.db.models.auth_user import auth_user_table
+from crudik.adapters.db.models.user import user_table
+from crudik.entities.common.identifiers import UserId
+
+
+async def load_user_ids(engine: AsyncEngine, user_ids: Sequence[UserId]) -> dict[UserId, UserId]:
+    """Loads the IDs of existing users with a single ``id = ANY(:ids)`` statement on its own connection."""
+    async with engine.connect() as connection:
+        result = await connection.execute(
+            select(user_table.c.id).where(user_table.c.id == any_(literal(list(user_ids), ARRAY(UUID)))),
+        )
+        return {user_id: user_id for (user_id,) in result}
+
+
+async def load_auth_user_ids(engine: AsyncEngine, auth_user_ids: Sequence[AuthUserId]) -> dict[AuthUserId, UserId]:
+    """Loads user IDs bound to auth user IDs with a single ``ANY(:ids)`` statement on its own connection."""
+    async with engine.connect() as connection:
+        result = await connection.execute(
+            select(auth_user_table.c.auth_user_id, auth_user_table.c.user_id).where(
+                auth_user_table.c.auth_user_id == any_(literal(list(auth_user_ids), ARRAY(Text))),
+            ),
+        )
+        return dict(result.tuples().all())
@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass
+from typing import Any, override
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, QueuePool
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Counters describing how long requests wait for a pooled connection."""
+
+    checkouts: int = 0
+    waits: int = 0
+    waiters: int = 0
+    timeouts: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean time of a checkout that had to wait, in seconds."""
+        if self.waits == 0:
+            return 0.0
+        return self.wait_time / self.waits
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Asyncio queue pool that counts checkouts waiting for a connection to be returned.
+
+    A checkout waits when there is no idle connection and the overflow limit is reached.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    @override
+    def _do_get(self) -> ConnectionPoolEntry:
+        self.stats.checkouts += 1
+        if self.checkedin() > 0 or not -1 < self._max_overflow <= self._overflow:
+            return super()._do_get()
+
+        self.stats.waits += 1
+        self.stats.waiters += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.waiters -= 1
+            waited = time.perf_counter() - started
+            self.stats.wait_time += waited
+            self.stats.max_wait_time = max(self.stats.max_wait_time, waited)
+
+
+def get_pool_stats(pool: Pool) -> dict[str, Any]:
+    """Returns occupancy of the pool, and wait counters if it is instrumented."""
+    result: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, QueuePool):
+        result |= {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        }
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats = pool.stats
+        result |= {
+            "checkouts": stats.checkouts,
+            "waits": stats.waits,
+            "waiters": stats.waiters,
+            "timeouts": stats.timeouts,
+            "mean_wait_time": stats.mean_wait_time,
+            "max_wait_time": stats.max_wait_time,
+        }
+    return result
+
+
+def get_pool_saturation(pool: Pool) -> float:
+    """Returns the share of the pool capacity in use or waited for, which exceeds 1 when checkouts queue up.
+
+    Pools without a fixed capacity, such as unlimited overflow or no pooling at all, are never saturated.
+    """
+    if not isinstance(pool, QueuePool) or pool._max_overflow < 0:  # noqa: SLF001
+        return 0.0
+
+    capacity = pool.size() + pool._max_overflow  # noqa: SLF001
+    if capacity <= 0:
+        return 0.0
+    in_use = pool.checkedout()
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        in_use += pool.stats.waiters
+    return in_use / capacity
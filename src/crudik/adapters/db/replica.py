@@ -0,0 +1,127 @@
+import itertools
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, NewType, override
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from crudik.adapters.auth.idp.base import AuthUserIdProvider
+from crudik.adapters.auth.model import AuthUserId
+from crudik.adapters.cache.ttl import MISSING, TTLCache
+from crudik.application.common.logger import Logger
+from crudik.application.common.uow import UoW
+
+logger: Logger = structlog.get_logger(__name__)
+
+ReadSession = NewType("ReadSession", AsyncSession)
+"""Request session for read-only lookups, bound to a replica when one is available."""
+
+RECENT_WRITERS_MAX_SIZE = 100_000
+
+
+class ReplicaRouter:
+    """Application-wide selector of the read replica engine for a request.
+
+    Replicas are picked round-robin. A replica that fails to connect or drops a connection is skipped
+    for ``retry_interval``, and auth users that have just committed are pinned to the primary
+    for ``read_your_writes_window``, so they never read a replica that has not caught up with their writes yet.
+    """
+
+    def __init__(
+        self,
+        *,
+        engines: Sequence[AsyncEngine],
+        retry_interval: float,
+        read_your_writes_window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engines = list(engines)
+        self._retry_interval = retry_interval
+        self._clock = clock
+        self._next = itertools.cycle(range(len(self._engines)))
+        self._unhealthy_until = [0.0] * len(self._engines)
+        self._recent_writers: TTLCache[AuthUserId, bool] = TTLCache(
+            max_size=RECENT_WRITERS_MAX_SIZE,
+            ttl=read_your_writes_window,
+            clock=clock,
+        )
+        for index, engine in enumerate(self._engines):
+            event.listen(engine.sync_engine, "handle_error", self._make_error_listener(index))
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        """Replica engines, in configuration order."""
+        return self._engines
+
+    def pick(self, auth_user_id: AuthUserId | None) -> AsyncEngine | None:
+        """Returns the replica engine to read from, or None if the request must read from the primary."""
+        if auth_user_id is not None and self._recent_writers.get(auth_user_id) is not MISSING:
+            return None
+
+        now = self._clock()
+        for _ in range(len(self._engines)):
+            index = next(self._next)
+            if self._unhealthy_until[index] <= now:
+                return self._engines[index]
+        return None
+
+    async def connect(self, session: AsyncSession, engine: AsyncEngine) -> bool:
+        """Checks out a replica connection for the session, marking the replica unhealthy if it cannot connect."""
+        try:
+            _ = await session.connection()
+        except (OSError, DBAPIError) as error:
+            logger.warning("Replica connection failed", replica=engine.url.host, error=str(error))
+            self.mark_unhealthy(engine)
+            return False
+        return True
+
+    def pin(self, auth_user_id: AuthUserId) -> None:
+        """Routes reads of the auth user to the primary until its writes have reached the replicas."""
+        self._recent_writers.set(auth_user_id, True)  # noqa: FBT003
+
+    def mark_unhealthy(self, engine: AsyncEngine) -> None:
+        """Stops routing reads to the replica for the retry interval."""
+        index = self._engines.index(engine)
+        self._unhealthy_until[index] = self._clock() + self._retry_interval
+        logger.warning("Replica marked unhealthy", replica=engine.url.host, retry_interval=self._retry_interval)
+
+    def _make_error_listener(self, index: int) -> Callable[[ExceptionContext], None]:
+        def on_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or isinstance(context.original_exception, OSError):
+                self.mark_unhealthy(self._engines[index])
+
+        return on_error
+
+
+class ReadYourWritesUoW(UoW):
+    """UoW decorator that pins the auth user of the request to the primary after a successful commit."""
+
+    def __init__(self, uow: UoW, router: ReplicaRouter, auth_user_idp: AuthUserIdProvider) -> None:
+        self._uow = uow
+        self._router = router
+        self._auth_user_idp = auth_user_idp
+
+    @override
+    async def commit(self) -> None:
+        """Commits the wrapped UoW, then pins the writer to the primary."""
+        await self._uow.commit()
+        self._router.pin(await self._auth_user_idp.get_auth_user_id())
+
+    @override
+    def add(self, instance: object) -> None:
+        """Registers a new entity instance with the wrapped UoW."""
+        self._uow.add(instance)
+
+    @override
+    async def delete(self, instance: object) -> None:
+        """Marks an entity instance for deletion with the wrapped UoW."""
+        await self._uow.delete(instance)
+
+    @override
+    async def flush(self, objects: Sequence[Any] | None = None) -> None:
+        """Flushes pending changes of the wrapped UoW."""
+        await self._uow.flush(objects)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from crudik.adapters.auth.model import AuthUser
+from crudik.adapters.db.gateway.auth_user import SAAuthUserGateway
+from crudik.adapters.db.gateway.user import SAUserGateway
+from crudik.application.common.logger import Logger
+from crudik.entities.user import User
+
+logger: Logger = structlog.get_logger(__name__)
+
+WARMUP_AUTH_USER_ID = "__warmup__"
+WARMUP_USER_ID = UUID(int=0)
+
+
+@dataclass(slots=True, kw_only=True)
+class WarmupConfig:
+    """Startup warmup configuration.
+
+    ``connections`` are opened on every engine at once, the pools keep up to their ``pool_size`` of them.
+    """
+
+    enabled: bool = False
+    connections: int = 5
+    statements: bool = True
+
+
+class DbWarmup:
+    """Application-wide warmup of mappers, connection pools and statement caches.
+
+    Hot statements are the ones of the gateways, run with dummy IDs on every warmed connection,
+    so both SQLAlchemy compiled cache and asyncpg prepared statements are filled.
+    The write statements run on the primary only, in a transaction that is rolled back.
+    """
+
+    def __init__(self, *, config: WarmupConfig, engine: AsyncEngine, replica_engines: list[AsyncEngine]) -> None:
+        self._config = config
+        self._engine = engine
+        self._replica_engines = replica_engines
+        self._done = not config.enabled
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the warmup has finished, successfully or not, or is disabled."""
+        return self._done
+
+    async def run(self) -> None:
+        """Warms the application up, logging instead of raising errors, as a cold start is still a working one."""
+        started = time.perf_counter()
+        try:
+            configure_mappers()
+            await asyncio.gather(
+                *(self._warm_connection(self._engine, primary=True) for _ in range(self._config.connections)),
+                *(
+                    self._warm_connection(engine, primary=False)
+                    for engine in self._replica_engines
+                    for _ in range(self._config.connections)
+                ),
+            )
+        except Exception as e:  # noqa: BLE001
+            await logger.awarning("Warmup failed", exc_info=e)
+        else:
+            await logger.ainfo("Warmup finished", duration=time.perf_counter() - started)
+        finally:
+            self._done = True
+
+    async def _warm_connection(self, engine: AsyncEngine, *, primary: bool) -> None:
+        async with engine.connect() as connection, AsyncSession(bind=connection) as session:
+            if not self._config.statements:
+                return
+
+            auth_user_gateway = SAAuthUserGateway(session)
+            user_gateway = SAUserGateway(session)
+            await auth_user_gateway.get_user(WARMUP_AUTH_USER_ID)
+            await user_gateway.get(WARMUP_USER_ID)
+            await user_gateway.get_many([WARMUP_USER_ID])
+
+            if primary:
+                user = User(uuid4())
+                await auth_user_gateway.create(
+                    AuthUser(auth_user_id=f"{WARMUP_AUTH_USER_ID}{user.id}", user_id=user.id, user=user),
+                )
+                await session.rollback()
@@ -0,0 +1,12 @@
+from .config import EventSamplingConfig, LoggingConfig, OverflowPolicy, QueueLoggingConfig
+from .queue import BatchingQueueHandler
+from .sampling import EventSampler
+
+__all__ = [
+    "BatchingQueueHandler",
+    "EventSampler",
+    "EventSamplingConfig",
+    "LoggingConfig",
+    "OverflowPolicy",
+    "QueueLoggingConfig",
+]
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """What the log queue does with a record when it is full."""
+
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+@dataclass(slots=True, kw_only=True)
+class QueueLoggingConfig:
+    """Configuration of the log queue, which moves rendering and stdout writes to a background thread.
+
+    Up to ``batch_size`` queued records are written at once. ``BLOCK`` waits for the writer like a plain
+    stream handler does, while the drop policies keep the event loop going and count the dropped records.
+    """
+
+    enabled: bool = False
+    max_size: int = 10_000
+    batch_size: int = 256
+    overflow: OverflowPolicy = OverflowPolicy.DROP_NEW
+
+
+@dataclass(slots=True, kw_only=True)
+class EventSamplingConfig:
+    """Sampling of a single event, keeping one in ``every`` events, or up to ``rate`` events per second if set.
+
+    Warnings, errors and events of debugged traces are always kept.
+    """
+
+    every: int = 1
+    rate: float | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class LoggingConfig:
+    """Logging configuration.
+
+    ``level`` is the root level, ``levels`` override it for loggers by name, including their children.
+    ``sampling`` is configured per event name.
+    """
+
+    level: str = "INFO"
+    levels: dict[str, str] = field(default_factory=dict)
+    sampling: dict[str, EventSamplingConfig] = field(default_factory=dict)
+    queue: QueueLoggingConfig = field(default_factory=QueueLoggingConfig)
@@ -0,0 +1,136 @@
+import logging
+import queue
+import threading
+from contextlib import suppress
+from contextvars import Context, copy_context
+from logging.handlers import QueueHandler
+from typing import Final, TextIO, override
+
+from crudik.adapters.logs.config import OverflowPolicy
+
+type _QueuedRecord = tuple[logging.LogRecord, Context]
+
+_STOP: Final = (logging.makeLogRecord({"msg": "stop"}), Context())
+
+
+class BatchingQueueHandler(QueueHandler):
+    """Log handler that queues records for a background thread, which formats and writes them in batches.
+
+    Records are queued as they are, so rendering happens in the writer thread as well. It runs in a copy
+    of the context the record was logged in, so context variables, such as the trace ID, reach foreign records too.
+    Records that do not fit in a full queue are counted in ``dropped`` and reported by the writer
+    straight to the stream, as the queue is full.
+    """
+
+    def __init__(
+        self,
+        *,
+        stream: TextIO,
+        max_size: int,
+        batch_size: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self._queue: queue.Queue[_QueuedRecord] = queue.Queue(max_size)
+        super().__init__(self._queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._reported_dropped = 0
+        self._stream = stream
+        self._batch_size = batch_size
+        self._overflow = overflow
+        self._stopping = threading.Event()
+        self._writer = threading.Thread(target=self._write, name="log-writer", daemon=True)
+        self._writer.start()
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    @override
+    def enqueue(self, record: logging.LogRecord) -> None:
+        item = (record, copy_context())
+        if self._overflow is OverflowPolicy.BLOCK:
+            self._queue.put(item)
+            return
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.put_nowait(item)
+                except (queue.Empty, queue.Full):
+                    pass
+
+    @override
+    def close(self) -> None:
+        """Writes the queued records and stops the writer.
+
+        The stop is signalled by an event, as a record in a full queue can be dropped by the overflow policy.
+        The queued one only wakes up an idle writer, which waits on an empty queue, so it always fits.
+        """
+        if self._writer.is_alive():
+            self._stopping.set()
+            with suppress(queue.Full):
+                self._queue.put_nowait(_STOP)
+            self._writer.join()
+        super().close()
+
+    def _write(self) -> None:
+        while not self._stopping.is_set():
+            self._write_records(self._next_batch(block=True))
+            if (dropped := self.dropped) > self._reported_dropped:
+                self._write_dropped(dropped)
+
+        # Only records queued by now are written, so a flood of new ones cannot keep the writer from stopping
+        for _ in range(self._queue.qsize() // self._batch_size + 1):
+            self._write_records(self._next_batch(block=False))
+
+    def _write_records(self, batch: list[_QueuedRecord]) -> None:
+        records = [item for item in batch if item is not _STOP]
+        if records:
+            self._write_batch(records)
+
+    def _write_dropped(self, dropped: int) -> None:
+        record = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="Log records dropped: %d, %d in total",
+            args=(dropped - self._reported_dropped, dropped),
+            exc_info=None,
+        )
+        self._write_batch([(record, copy_context())])
+        self._reported_dropped = dropped
+
+    def _next_batch(self, *, block: bool) -> list[_QueuedRecord]:
+        try:
+            batch = [self._queue.get(block=block)]
+        except queue.Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, records: list[_QueuedRecord]) -> None:
+        lines = []
+        for record, context in records:
+            try:
+                lines.append(context.run(self.format, record))
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+        if not lines:
+            return
+
+        try:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+        except OSError:
+            self.handleError(records[-1][0])
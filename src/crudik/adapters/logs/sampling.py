@@ -0,0 +1,76 @@
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Final
+
+import structlog
+from structlog.typing import EventDict, WrappedLogger
+
+from crudik.adapters.logs.config import EventSamplingConfig
+from crudik.adapters.tracing import TRACE_DEBUG_KEY
+
+SAMPLE_RATE_KEY: Final = "sample_rate"
+UNSAMPLED_LEVELS: Final = frozenset({"warning", "error", "critical", "exception"})
+
+
+class _EventSample:
+    """Sampling state of a single event, safe to share between threads."""
+
+    def __init__(self, config: EventSamplingConfig, clock: Callable[[], float]) -> None:
+        self._every = max(config.every, 1)
+        self._rate = config.rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._skipped = 0
+        self._tokens = 1.0 if config.rate is None else max(config.rate, 1.0)
+        self._refilled_at = clock()
+
+    def sample(self) -> int | None:
+        """Returns the number of events the kept one stands for, or ``None`` if the event is skipped."""
+        with self._lock:
+            keep = self._take_token(self._rate) if self._rate is not None else self._seen % self._every == 0
+            self._seen += 1
+            if not keep:
+                self._skipped += 1
+                return None
+
+            represented = self._skipped + 1
+            self._skipped = 0
+            return represented
+
+    def _take_token(self, rate: float) -> bool:
+        now = self._clock()
+        self._tokens = min(self._tokens + (now - self._refilled_at) * rate, max(rate, 1.0))
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class EventSampler:
+    """Structlog processor that samples events by name.
+
+    Every kept event carries ``sample_rate``, the number of events it stands for including itself,
+    so the counts can be reconstructed by summing it. It must run after ``add_log_level`` and ``merge_contextvars``.
+    """
+
+    def __init__(
+        self,
+        config: Mapping[str, EventSamplingConfig],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._samples = {event: _EventSample(event_config, clock) for event, event_config in config.items()}
+
+    def __call__(self, _logger: WrappedLogger, _method_name: str, event_dict: EventDict) -> EventDict:
+        """Drops a skipped event, or adds the sample rate to a kept one."""
+        sample = self._samples.get(event_dict.get("event"))  # type: ignore[arg-type]
+        if sample is None or event_dict.get("level") in UNSAMPLED_LEVELS or event_dict.get(TRACE_DEBUG_KEY):
+            return event_dict
+
+        represented = sample.sample()
+        if represented is None:
+            raise structlog.DropEvent
+        event_dict[SAMPLE_RATE_KEY] = represented
+        return event_dict
@@ -0,0 +1,14 @@
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import to_json
+
+
+def dump_json(obj: Any, *, fallback: Callable[[Any], Any] | None = None) -> bytes:
+    """Serializes the object to compact UTF-8 JSON with the pydantic core serializer.
+
+    Every type pydantic serializes is supported, such as enums, UUIDs, datetimes, decimals, dataclasses and models.
+    Values of other types are converted by ``fallback``, without it they raise ``PydanticSerializationError``.
+    NaN and infinity are rendered as ``null``.
+    """
+    return to_json(obj, inf_nan_mode="null", fallback=fallback)
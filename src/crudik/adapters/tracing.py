@@ -1,6 +1,6 @@
 from abc import abstractmethod
-from dataclasses import dataclass
-from typing import Any, ClassVar, Protocol, override
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Final, Protocol, override
 from uuid import uuid4
 
 from fastapi.requests import Request
@@ -9,6 +9,8 @@ from crudik.entities.errors.base import AppError, app_error
 
 type TraceId = str
 
+TRACE_DEBUG_KEY: Final = "trace_debug"
+
 
 @app_error
 class MissingTraceIdError(AppError):
@@ -28,10 +30,26 @@ class MissingTraceIdError(AppError):
 
 @dataclass(slots=True, kw_only=True)
 class TracingConfig:
-    """Tracing configuration."""
+    """Tracing configuration.
+
+    Requests with ``debug_header`` set to ``1`` or ``true`` are flagged for debugging, so none of their logs is sampled.
+    The header is honored only from clients in ``debug_trusted_networks``, as external clients could otherwise
+    opt out of sampling. By default it is ignored from everyone.
+    """
 
     trace_id_header: str
     trace_id_required: bool = False
+    debug_header: str | None = None
+    debug_trusted_networks: list[str] = field(default_factory=list)
+
+
+def make_trace_id(header_value: str | None, config: TracingConfig) -> TraceId:
+    """Returns the trace id passed in the header, or a new one if it is optional and missing."""
+    if header_value is not None:
+        return header_value
+    if config.trace_id_required:
+        raise MissingTraceIdError(header=config.trace_id_header)
+    return uuid4().hex
 
 
 class TraceProvider(Protocol):
@@ -44,18 +62,17 @@ class TraceProvider(Protocol):
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class HTTPTraceProvider(TraceProvider):
-    """Provide ``TraceId`` from HTTP request headers."""
+    """Provide ``TraceId`` from HTTP request headers.
+
+    The id bound by the tracing middleware is reused from the request state, so generated ids stay the same.
+    """
 
     request: Request
     config: TracingConfig
 
     @override
     def get_trace_id(self) -> TraceId:
-        trace_id = self.request.headers.get(self.config.trace_id_header)
-        if trace_id is None and self.config.trace_id_required:
-            raise MissingTraceIdError(header=self.config.trace_id_header)
-
-        if trace_id is None:
-            trace_id = uuid4().hex
-
-        return trace_id
+        trace_id: TraceId | None = getattr(self.request.state, "trace_id", None)
+        if trace_id is not None:
+            return trace_id
+        return make_trace_id(self.request.headers.get(self.config.trace_id_header), self.config)
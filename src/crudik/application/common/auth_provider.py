@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import Protocol
 
 from crudik.entities.user import User
@@ -9,5 +10,13 @@ class AuthProvider(Protocol):
 
     @abstractmethod
     async def setup_auth(self, user: User) -> None:
-        """Binds the user that is created to the authentication system."""
+        """Persists the user that is created and binds it to the authentication system in one atomic step."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def setup_auth_many(self, users: Mapping[str, User]) -> set[str]:
+        """Persists the users that are created, binding each to the given ID in the authentication system.
+
+        Users whose ID is already bound are not persisted. Returns the IDs that were bound.
+        """
         raise NotImplementedError
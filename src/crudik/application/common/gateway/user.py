@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from crudik.entities.common.identifiers import UserId
@@ -12,3 +13,8 @@ class UserGateway(Protocol):
     async def get(self, user_id: UserId) -> User | None:
         """Retrieves a user entity by its unique identifier, returns None if not found."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, user_ids: Sequence[UserId]) -> list[User]:
+        """Retrieves user entities by their unique identifiers in no particular order, skipping missing ones."""
+        raise NotImplementedError
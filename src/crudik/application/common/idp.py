@@ -11,3 +11,8 @@ class IdProvider(Protocol):
     async def get_user(self) -> User:
         """Returns the User entity representing the currently authenticated user making the request."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def has_role(self, role: str) -> bool:
+        """Checks whether the authentication system granted the role to the currently authenticated user."""
+        raise NotImplementedError
@@ -1,3 +1,3 @@
 import structlog
 
-type Logger = structlog.stdlib.BoundLogger
+type Logger = structlog.typing.FilteringBoundLogger
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, kw_only=True)
+class UsersBatchConfig:
+    """Limits of batch user creation.
+
+    Creating users binds arbitrary auth user IDs, so it is allowed only to users with ``provisioner_role``.
+    """
+
+    max_size: int = 1000
+    provisioner_role: str = "users-provisioner"
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, kw_only=True)
+class UsersReadConfig:
+    """Limits of bulk user reads."""
+
+    max_ids: int = 100
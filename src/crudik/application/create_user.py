@@ -33,8 +33,6 @@ class CreateUser:
         logger.debug("Generated new user id", user_id=user_id)
         user = User(user_id)
 
-        self.uow.add(user)
-        await self.uow.flush([user])
         await self.auth_provider.setup_auth(user)
         await self.uow.commit()
 
@@ -0,0 +1,93 @@
+from enum import Enum
+from uuid import uuid4
+
+import structlog
+from pydantic import BaseModel
+
+from crudik.application.common.auth_provider import AuthProvider
+from crudik.application.common.idp import IdProvider
+from crudik.application.common.interactor import interactor
+from crudik.application.common.logger import Logger
+from crudik.application.common.uow import UoW
+from crudik.application.common.users_batch import UsersBatchConfig
+from crudik.application.errors.user import UsersBatchTooLargeError
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.errors.base import AccessDeniedError
+from crudik.entities.user import User
+
+logger: Logger = structlog.get_logger(__name__)
+
+
+class UsersBatchForm(BaseModel):
+    """Request model containing IDs in the authentication system to create users for."""
+
+    auth_user_ids: list[str]
+
+
+class UsersBatchItemStatus(Enum):
+    """Outcome of creating a single user of the batch."""
+
+    CREATED = "CREATED"
+    ALREADY_EXISTS = "ALREADY_EXISTS"
+
+
+class UsersBatchItem(BaseModel):
+    """Response model containing the outcome for a single ID of the batch."""
+
+    auth_user_id: str
+    status: UsersBatchItemStatus
+    id: UserId | None
+
+
+class CreatedUsersBatch(BaseModel):
+    """Response model containing the outcome for every distinct ID of the batch, in request order."""
+
+    items: list[UsersBatchItem]
+
+
+@interactor
+class CreateUsersBatch:
+    """Interactor for creating many users bound to the given authentication system IDs in one transaction."""
+
+    uow: UoW
+    auth_provider: AuthProvider
+    idp: IdProvider
+    config: UsersBatchConfig
+
+    async def execute(self, form: UsersBatchForm) -> CreatedUsersBatch:
+        """Creates a user for every new ID, reporting IDs that are already bound as conflicts.
+
+        Raises AccessDeniedError if the current user is not a provisioner.
+        """
+        current_user = await self.idp.get_user()
+        logger.debug("Create users batch request", user_id=current_user.id, size=len(form.auth_user_ids))
+
+        if not await self.idp.has_role(self.config.provisioner_role):
+            logger.debug("Create users batch access denied", user_id=current_user.id)
+            raise AccessDeniedError
+
+        if len(form.auth_user_ids) > self.config.max_size:
+            logger.debug("Users batch is too large", size=len(form.auth_user_ids), max_size=self.config.max_size)
+            raise UsersBatchTooLargeError(size=len(form.auth_user_ids), max_size=self.config.max_size)
+
+        users = {auth_user_id: User(uuid4()) for auth_user_id in form.auth_user_ids}
+        created = await self.auth_provider.setup_auth_many(users)
+        await self.uow.commit()
+
+        logger.info("Users batch created", created=len(created), conflicts=len(users) - len(created))
+        return CreatedUsersBatch(
+            items=[
+                UsersBatchItem(
+                    auth_user_id=auth_user_id,
+                    status=UsersBatchItemStatus.CREATED,
+                    id=user.id,
+                )
+                if auth_user_id in created
+                else UsersBatchItem(
+                    auth_user_id=auth_user_id,
+                    status=UsersBatchItemStatus.ALREADY_EXISTS,
+                    id=None,
+                )
+                for auth_user_id, user in users.items()
+            ],
+        )
@@ -18,3 +18,21 @@ class UserNotFoundError(AppError):
         return {
             "user_id": self.user_id,
         }
+
+
+@app_error
+class UsersBatchTooLargeError(AppError):
+    """Error raised when a batch of users to create or read exceeds the configured limit."""
+
+    code: ClassVar[str] = "USERS_BATCH_TOO_LARGE"
+    message: str = "Users batch is too large"
+    size: int
+    max_size: int
+
+    @override
+    @property
+    def meta(self) -> dict[str, Any] | None:
+        return {
+            "size": self.size,
+            "max_size": self.max_size,
+        }
@@ -0,0 +1,56 @@
+import structlog
+from pydantic import BaseModel
+
+from crudik.application.common.gateway.user import UserGateway
+from crudik.application.common.idp import IdProvider
+from crudik.application.common.interactor import interactor
+from crudik.application.common.logger import Logger
+from crudik.application.common.users_read import UsersReadConfig
+from crudik.application.errors.user import UserNotFoundError, UsersBatchTooLargeError
+from crudik.application.read_user import UserModel
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.errors.base import AccessDeniedError
+
+logger: Logger = structlog.get_logger(__name__)
+
+
+class UsersModel(BaseModel):
+    """Response model containing data of many users, in request order."""
+
+    items: list[UserModel]
+
+
+@interactor
+class ReadUsers:
+    """Interactor for reading data of many users at once."""
+
+    gateway: UserGateway
+    idp: IdProvider
+    config: UsersReadConfig
+
+    async def execute(self, user_ids: list[UserId]) -> UsersModel:
+        """Retrieves users by IDs with one query, applying the same checks as reading a single user to each of them."""
+        logger.debug("Read users request", size=len(user_ids))
+        current_user = await self.idp.get_user()
+        logger.debug("Current user id", user_id=current_user.id)
+
+        if len(user_ids) > self.config.max_ids:
+            logger.debug("Users batch is too large", size=len(user_ids), max_size=self.config.max_ids)
+            raise UsersBatchTooLargeError(size=len(user_ids), max_size=self.config.max_ids)
+
+        user_ids = list(dict.fromkeys(user_ids))
+        users = {user.id: user for user in await self.gateway.get_many(user_ids)}
+
+        for user_id in user_ids:
+            if (user := users.get(user_id)) is None:
+                logger.debug("User by id not found", user_id=user_id)
+                raise UserNotFoundError(user_id=user_id)
+
+            if user.id != current_user.id:
+                logger.debug("Read user access denied", current_user_id=current_user.id, user_id=user_id)
+                raise AccessDeniedError
+
+        logger.info("Read users successful", size=len(user_ids))
+        return UsersModel(
+            items=[UserModel(id=user_id) for user_id in user_ids],
+        )
@@ -1,14 +1,26 @@
 import argparse
 import contextlib
 
-import alembic.config
 
-from crudik.adapters.db.alembic.config import get_alembic_config_path
-from crudik.main.fast_api import run_api
+def run_api(*, prefork: bool) -> None:
+    """Starts the FastAPI application server, in workers forked by the prefork manager if ``prefork`` is set."""
+    # Commands import their dependencies on call, so migrations do not load the web stack, nor the API alembic
+    if prefork:
+        from crudik.main import prefork as prefork_main  # noqa: PLC0415
+
+        prefork_main.run_prefork_api()
+    else:
+        from crudik.main import fast_api  # noqa: PLC0415
+
+        fast_api.run_api()
 
 
 def run_migrations() -> None:
     """Applies all pending database migrations to bring the database schema to the latest version."""
+    import alembic.config  # noqa: PLC0415
+
+    from crudik.adapters.db.alembic.config import get_alembic_config_path  # noqa: PLC0415
+
     alembic_path_gen = get_alembic_config_path()
     alembic_path = str(next(alembic_path_gen))
     alembic.config.main(
@@ -21,6 +33,10 @@ def run_migrations() -> None:
 
 def autogenerate_migrations(message: str) -> None:
     """Generates a new Alembic migration file by detecting schema changes and using the provided message."""
+    import alembic.config  # noqa: PLC0415
+
+    from crudik.adapters.db.alembic.config import get_alembic_config_path  # noqa: PLC0415
+
     alembic_path_gen = get_alembic_config_path()
     alembic_path = str(next(alembic_path_gen))
     alembic.config.main(
@@ -40,6 +56,7 @@ def create_parser() -> argparse.ArgumentParser:
         epilog="""
 Examples:
   %(prog)s run api          # Run FastAPI server
+  %(prog)s run api --prefork  # Run FastAPI server in forked workers
   %(prog)s migrations autogenerate "Add user table"  # Create migration
   %(prog)s migrations apply  # Apply migrations
         """,
@@ -51,7 +68,12 @@ Examples:
     run_parser = subparsers.add_parser("run", help="Run services")
     run_subparsers = run_parser.add_subparsers(dest="subcommand", help="service to run", required=True)
 
-    run_subparsers.add_parser("api", help="Run FastAPI server")
+    api_parser = run_subparsers.add_parser("api", help="Run FastAPI server")
+    api_parser.add_argument(
+        "--prefork",
+        action="store_true",
+        help="Fork workers from a parent with the application loaded and the GC heap frozen",
+    )
 
     # migrations command
     migrations_parser = subparsers.add_parser("migrations", help="Database migrations")
@@ -76,7 +98,7 @@ def main() -> None:
 
     if args.command == "run":
         if args.subcommand == "api":
-            run_api()
+            run_api(prefork=args.prefork)
         else:
             parser.error(f"Unknown run subcommand: {args.subcommand}")
 
@@ -1,16 +1,25 @@
-import os
 from dataclasses import dataclass
 from pathlib import Path
 
-import toml_rs
-from adaptix import Retort
-
 from crudik.adapters.auth.idp.auth_user import WebAuthConfig
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.adapters.cache.config import CacheConfig
 from crudik.adapters.db.config import DbConfig
+from crudik.adapters.db.health import HealthConfig
+from crudik.adapters.db.warmup import WarmupConfig
+from crudik.adapters.logs.config import LoggingConfig
 from crudik.adapters.tracing import TracingConfig
-from crudik.presentation.fast_api.config import ServerConfig
+from crudik.application.common.users_batch import UsersBatchConfig
+from crudik.application.common.users_read import UsersReadConfig
+from crudik.main.config.toml import get_toml_config_path, read_toml_config, retort
+from crudik.presentation.fast_api.config import ServerConfig, StatsConfig
+from crudik.presentation.fast_api.container import DiProfilingConfig
 
-retort = Retort()
+__all__ = [
+    "Config",
+    "get_toml_config_path",
+    "load_config_from_toml",
+]
 
 
 @dataclass(slots=True, kw_only=True)
@@ -21,17 +30,17 @@ class Config:
     web_auth: WebAuthConfig
     tracing: TracingConfig
     server: ServerConfig
-
-
-def get_toml_config_path() -> Path:
-    """Get TOML config path."""
-    if (env_var := os.getenv("APP_CONFIG_PATH")) is None:
-        msg = "Missing $APP_CONFIG_PATH"
-        raise RuntimeError(msg)
-    return Path(env_var)
+    cache: CacheConfig
+    batching: BatchingConfig
+    users_batch: UsersBatchConfig
+    users_read: UsersReadConfig
+    warmup: WarmupConfig
+    health: HealthConfig
+    logging: LoggingConfig
+    di_profiling: DiProfilingConfig
+    stats: StatsConfig
 
 
 def load_config_from_toml(toml_path: Path) -> Config:
     """Load ``Config`` from toml file."""
-    file = toml_path.read_text("utf-8")
-    return retort.load(toml_rs.loads(file, toml_version="1.1.0"), Config)
+    return retort.load(read_toml_config(toml_path), Config)
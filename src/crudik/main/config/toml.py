@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import toml_rs
+from adaptix import Retort
+
+retort = Retort()
+
+
+def get_toml_config_path() -> Path:
+    """Get TOML config path."""
+    if (env_var := os.getenv("APP_CONFIG_PATH")) is None:
+        msg = "Missing $APP_CONFIG_PATH"
+        raise RuntimeError(msg)
+    return Path(env_var)
+
+
+def read_toml_config(toml_path: Path) -> dict[str, Any]:
+    """Read sections of the toml file as they are."""
+    return toml_rs.loads(toml_path.read_text("utf-8"), toml_version="1.1.0")
+
+
+def load_section_from_toml[T](toml_path: Path, section: str, config_type: type[T]) -> T:
+    """Load a single section of the toml file, importing only the config type of that section.
+
+    Tools that need part of the configuration, such as migrations, use it instead of loading ``Config``,
+    whose section types import the whole application.
+    """
+    return retort.load(read_toml_config(toml_path)[section], config_type)
@@ -2,13 +2,20 @@ from dishka import STRICT_VALIDATION, AsyncContainer, make_async_container
 from dishka.integrations.fastapi import FastapiProvider
 
 from crudik.adapters.auth.idp.auth_user import WebAuthConfig
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.adapters.cache.config import CacheConfig
 from crudik.adapters.db.config import DbConfig
+from crudik.adapters.db.health import HealthConfig
+from crudik.adapters.db.warmup import WarmupConfig
 from crudik.adapters.tracing import TracingConfig
+from crudik.application.common.users_batch import UsersBatchConfig
+from crudik.application.common.users_read import UsersReadConfig
 from crudik.main.config.loader import Config
 from crudik.main.di.providers.adapter import AdapterProvider
 from crudik.main.di.providers.config import ConfigProvider
 from crudik.main.di.providers.interactor import InteractorProvider
 from crudik.main.di.providers.tracing import HTTPTracingProvider
+from crudik.presentation.fast_api.config import StatsConfig
 
 
 def get_async_container(config: Config) -> AsyncContainer:
@@ -25,6 +32,13 @@ def get_async_container(config: Config) -> AsyncContainer:
         DbConfig: config.db,
         WebAuthConfig: config.web_auth,
         TracingConfig: config.tracing,
+        CacheConfig: config.cache,
+        BatchingConfig: config.batching,
+        UsersBatchConfig: config.users_batch,
+        UsersReadConfig: config.users_read,
+        WarmupConfig: config.warmup,
+        HealthConfig: config.health,
+        StatsConfig: config.stats,
     }
     container = make_async_container(*providers, context=context, validation_settings=STRICT_VALIDATION)
     return container
@@ -1,16 +1,98 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 
-from dishka import AnyOf, Provider, Scope, WithParents, provide, provide_all
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from dishka import Provider, Scope, WithParents, provide, provide_all
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from crudik.adapters.auth.auth_provider import SimpleAuthProvider
-from crudik.adapters.auth.idp.auth_user import WebAuthUserIdProvider
+from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway, AuthUserReader
+from crudik.adapters.auth.errors.base import UnauthorizedError
+from crudik.adapters.auth.idp.access_token import (
+    AccessTokenDecoder,
+    UnverifiedAccessTokenDecoder,
+    VerifiedAccessTokenDecoder,
+)
+from crudik.adapters.auth.idp.auth_user import WebAuthConfig, WebAuthUserIdProvider
+from crudik.adapters.auth.idp.base import AuthUserIdProvider
+from crudik.adapters.auth.idp.jwks import JWKSKeyStore
 from crudik.adapters.auth.idp.user import IdProviderImpl
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.adapters.batching.gateway.auth_user import AuthUserLoader, BatchingAuthUserGateway
+from crudik.adapters.batching.gateway.user import BatchingUserGateway, UserLoader
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+from crudik.adapters.cache.config import CacheConfig
+from crudik.adapters.cache.gateway.auth_user import AuthUserCache, CachedAuthUserGateway
+from crudik.adapters.cache.gateway.user import CachedUserGateway, UserCache
 from crudik.adapters.db.config import DbConfig
+from crudik.adapters.db.engine import create_engine
 from crudik.adapters.db.gateway.auth_user import SAAuthUserGateway
 from crudik.adapters.db.gateway.user import SAUserGateway
+from crudik.adapters.db.health import DbHealthChecker, HealthConfig
+from crudik.adapters.db.loader import load_auth_user_ids, load_user_ids
+from crudik.adapters.db.replica import ReadSession, ReadYourWritesUoW, ReplicaRouter
+from crudik.adapters.db.warmup import DbWarmup, WarmupConfig
+from crudik.application.common.gateway.user import UserGateway
 from crudik.application.common.uow import UoW
 
+# Request-scoped factories resolve application-scoped dependencies through the parent containers on every request,
+# so the ones they share are bundled into one application-scoped wrapper each.
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthUserGatewayWrapper:
+    """Wraps auth user gateways with the batching loader and the in-process cache if they are enabled."""
+
+    cache_config: CacheConfig
+    batching_config: BatchingConfig
+    cache: AuthUserCache
+    loader: AuthUserLoader
+
+    def __call__(self, gateway: AuthUserGateway) -> AuthUserGateway:
+        """Returns the wrapped gateway."""
+        if self.batching_config.enabled:
+            gateway = BatchingAuthUserGateway(gateway=gateway, loader=self.loader)
+        if self.cache_config.auth_user.enabled:
+            gateway = CachedAuthUserGateway(gateway=gateway, cache=self.cache)
+        return gateway
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserGatewayWrapper:
+    """Wraps user gateways with the batching loader and the in-process cache if they are enabled."""
+
+    cache_config: CacheConfig
+    batching_config: BatchingConfig
+    cache: UserCache
+    loader: UserLoader
+
+    def __call__(self, gateway: UserGateway) -> UserGateway:
+        """Returns the wrapped gateway."""
+        if self.batching_config.enabled:
+            gateway = BatchingUserGateway(gateway=gateway, loader=self.loader)
+        if self.cache_config.user.enabled:
+            gateway = CachedUserGateway(
+                gateway=gateway,
+                cache=self.cache,
+                negative_ttl=self.cache_config.user.negative_ttl,
+            )
+        return gateway
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UoWWrapper:
+    """Wraps the request session as UoW, pinning writers to the primary when replicas are configured."""
+
+    router: ReplicaRouter
+
+    def __call__(self, session: AsyncSession, auth_user_idp: AuthUserIdProvider) -> UoW:
+        """Returns the wrapped session."""
+        uow: UoW = session
+        if self.router.engines:
+            uow = ReadYourWritesUoW(uow=uow, router=self.router, auth_user_idp=auth_user_idp)
+        return uow
+
 
 class AdapterProvider(Provider):
     """Dishka provider that registers all adapter implementations."""
@@ -21,22 +103,145 @@ class AdapterProvider(Provider):
         scope=Scope.REQUEST,
     )
     gateways = provide_all(
-        WithParents[SAUserGateway],
-        WithParents[SAAuthUserGateway],
+        SAAuthUserGateway,
         scope=Scope.REQUEST,
     )
     auth_provider = provide(WithParents[SimpleAuthProvider], scope=Scope.REQUEST)
+    wrappers = provide_all(
+        AuthUserGatewayWrapper,
+        UserGatewayWrapper,
+        UoWWrapper,
+        scope=Scope.APP,
+    )
+
+    @provide(scope=Scope.APP)
+    def get_auth_user_cache(self, config: CacheConfig) -> AuthUserCache:
+        """Provides the application-wide auth user cache."""
+        return AuthUserCache(
+            max_size=config.auth_user.max_size,
+            ttl=config.auth_user.ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_user_cache(self, config: CacheConfig) -> UserCache:
+        """Provides the application-wide user cache."""
+        return UserCache(
+            max_size=config.user.max_size,
+            ttl=config.user.ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_access_token_claims_cache(self, config: CacheConfig) -> AccessTokenClaimsCache:
+        """Provides the application-wide access token claims cache, which never stores anything if disabled."""
+        return AccessTokenClaimsCache(
+            max_size=config.access_token.max_size if config.access_token.enabled else 0,
+            ttl=config.access_token.ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_access_token_decoder(self, config: WebAuthConfig) -> Iterator[AccessTokenDecoder]:
+        """Provides access token decoder, verifying signatures in a dedicated thread pool if enabled."""
+        if not config.verify_signature:
+            yield UnverifiedAccessTokenDecoder(algorithm=config.access_token_alg)
+            return
+
+        if config.jwks_uri is None:
+            msg = "web_auth.jwks_uri is required to verify access token signature"
+            raise ValueError(msg)
+
+        executor = ThreadPoolExecutor(
+            max_workers=config.verification_workers,
+            thread_name_prefix="access-token-verifier",
+        )
+        yield VerifiedAccessTokenDecoder(
+            algorithm=config.access_token_alg,
+            audience=config.access_token_audience,
+            key_store=JWKSKeyStore(
+                jwks_uri=config.jwks_uri,
+                refresh_interval=config.jwks_refresh_interval,
+                executor=executor,
+            ),
+            executor=executor,
+        )
+        executor.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def get_user_loader(self, config: BatchingConfig, engine: AsyncEngine) -> AsyncIterator[UserLoader]:
+        """Provides the application-wide batching loader of users."""
+        loader = UserLoader(
+            load_many=partial(load_user_ids, engine),
+            window=config.window,
+            max_batch_size=config.max_batch_size,
+        )
+        yield loader
+        await loader.close()
+
+    @provide(scope=Scope.APP)
+    async def get_auth_user_loader(self, config: BatchingConfig, engine: AsyncEngine) -> AsyncIterator[AuthUserLoader]:
+        """Provides the application-wide batching loader of auth users."""
+        loader = AuthUserLoader(
+            load_many=partial(load_auth_user_ids, engine),
+            window=config.window,
+            max_batch_size=config.max_batch_size,
+        )
+        yield loader
+        await loader.close()
+
+    @provide(scope=Scope.REQUEST)
+    def get_user_gateway(self, wrapper: UserGatewayWrapper, session: ReadSession) -> UserGateway:
+        """Provides read-only UserGateway, wrapped with the batching loader and the in-process cache if enabled."""
+        return wrapper(SAUserGateway(session))
+
+    @provide(scope=Scope.REQUEST)
+    def get_auth_user_gateway(self, wrapper: AuthUserGatewayWrapper, gateway: SAAuthUserGateway) -> AuthUserGateway:
+        """Provides AuthUserGateway, wrapped with the batching loader and the in-process cache if they are enabled."""
+        return wrapper(gateway)
+
+    @provide(scope=Scope.REQUEST)
+    def get_auth_user_reader(
+        self,
+        wrapper: AuthUserGatewayWrapper,
+        gateway: AuthUserGateway,
+        session: AsyncSession,
+        read_session: ReadSession,
+    ) -> AuthUserReader:
+        """Provides AuthUserReader reading from the request read session, which is the primary one by default."""
+        if read_session is session:
+            return gateway
+        return wrapper(SAAuthUserGateway(read_session))
 
     @provide(scope=Scope.APP)
     async def get_engine(self, config: DbConfig) -> AsyncIterator[AsyncEngine]:
         """Provides SQLAlchemy async engine instance with proper lifecycle management."""
-        engine = create_async_engine(
-            config.connection_url,
-            future=True,
-        )
+        engine = create_engine(config, config.connection_url)
         yield engine
         await engine.dispose()
 
+    @provide(scope=Scope.APP)
+    async def get_replica_router(self, config: DbConfig) -> AsyncIterator[ReplicaRouter]:
+        """Provides the router between read replica engines, which has none if no replicas are configured."""
+        engines = [
+            create_engine(config, url, pool_size=replica.pool_size, max_overflow=replica.max_overflow)
+            for replica, url in zip(config.replicas, config.replica_urls, strict=True)
+        ]
+        yield ReplicaRouter(
+            engines=engines,
+            retry_interval=config.replica_retry_interval,
+            read_your_writes_window=config.read_your_writes_window,
+        )
+        for engine in engines:
+            await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def get_db_warmup(self, config: WarmupConfig, engine: AsyncEngine, router: ReplicaRouter) -> DbWarmup:
+        """Provides the application-wide database warmup, which is done from the start if disabled."""
+        return DbWarmup(config=config, engine=engine, replica_engines=router.engines)
+
+    @provide(scope=Scope.APP)
+    def get_db_health_checker(self, config: HealthConfig, engine: AsyncEngine) -> DbHealthChecker:
+        """Provides the application-wide background health check of the primary database."""
+        return DbHealthChecker(config=config, engine=engine)
+
     @provide(scope=Scope.APP)
     async def get_async_sessionmaker(
         self,
@@ -54,7 +259,50 @@ class AdapterProvider(Provider):
     async def get_async_session(
         self,
         session_factory: async_sessionmaker[AsyncSession],
-    ) -> AsyncIterator[AnyOf[AsyncSession, UoW]]:
-        """Provides a request-scoped database session that also implements the UoW protocol."""
-        async with session_factory() as session:
-            yield session
+    ) -> AsyncIterator[AsyncSession]:
+        """Provides a request-scoped database session.
+
+        A session that never began a transaction and holds no objects has nothing to release,
+        so closing it is skipped, which spares requests served from caches a greenlet switch.
+        """
+        session = session_factory()
+        yield session
+        if session.in_transaction() or session.identity_map or session.new:
+            await session.close()
+
+    @provide(scope=Scope.REQUEST)
+    async def get_read_session(
+        self,
+        router: ReplicaRouter,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        auth_user_idp: AuthUserIdProvider,
+    ) -> AsyncIterator[ReadSession]:
+        """Provides a request-scoped session for read-only lookups, bound to a healthy replica if there is one.
+
+        The replica connection is checked out upfront, so a replica that is down is skipped by this request already.
+        """
+        if not router.engines:
+            yield ReadSession(session)
+            return
+
+        try:
+            auth_user_id = await auth_user_idp.get_auth_user_id()
+        except UnauthorizedError:
+            auth_user_id = None
+
+        if (engine := router.pick(auth_user_id)) is None:
+            yield ReadSession(session)
+            return
+
+        async with session_factory(bind=engine) as read_session:
+            if await router.connect(read_session, engine):
+                yield ReadSession(read_session)
+                return
+
+        yield ReadSession(session)
+
+    @provide(scope=Scope.REQUEST)
+    def get_uow(self, wrapper: UoWWrapper, session: AsyncSession, auth_user_idp: AuthUserIdProvider) -> UoW:
+        """Provides the request session as UoW, pinning the writer to the primary after the commit with replicas."""
+        return wrapper(session, auth_user_idp)
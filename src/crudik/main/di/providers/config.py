@@ -1,13 +1,32 @@
 from dishka import BaseScope, Provider, Scope, from_context
 
 from crudik.adapters.auth.idp.auth_user import WebAuthConfig
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.adapters.cache.config import CacheConfig
 from crudik.adapters.db.config import DbConfig
+from crudik.adapters.db.health import HealthConfig
+from crudik.adapters.db.warmup import WarmupConfig
 from crudik.adapters.tracing import TracingConfig
+from crudik.application.common.users_batch import UsersBatchConfig
+from crudik.application.common.users_read import UsersReadConfig
 from crudik.main.config.loader import Config
+from crudik.presentation.fast_api.config import StatsConfig
 
 
 class ConfigProvider(Provider):
     """Dishka provider that exposes configuration objects from the context."""
 
     scope: BaseScope | None = Scope.APP
-    configs = from_context(Config) + from_context(DbConfig) + from_context(WebAuthConfig) + from_context(TracingConfig)
+    configs = (
+        from_context(Config)
+        + from_context(DbConfig)
+        + from_context(WebAuthConfig)
+        + from_context(TracingConfig)
+        + from_context(CacheConfig)
+        + from_context(BatchingConfig)
+        + from_context(UsersBatchConfig)
+        + from_context(UsersReadConfig)
+        + from_context(WarmupConfig)
+        + from_context(HealthConfig)
+        + from_context(StatsConfig)
+    )
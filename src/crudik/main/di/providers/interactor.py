@@ -1,7 +1,9 @@
 from dishka import BaseScope, Provider, Scope, provide_all
 
 from crudik.application.create_user import CreateUser
+from crudik.application.create_users_batch import CreateUsersBatch
 from crudik.application.read_user import ReadUser
+from crudik.application.read_users import ReadUsers
 
 
 class InteractorProvider(Provider):
@@ -11,5 +13,7 @@ class InteractorProvider(Provider):
 
     interactors = provide_all(
         CreateUser,
+        CreateUsersBatch,
         ReadUser,
+        ReadUsers,
     )
@@ -1,38 +1,62 @@
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
-from dishka.integrations.fastapi import setup_dishka
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
+from crudik.adapters.db.health import DbHealthChecker
+from crudik.adapters.db.warmup import DbWarmup
 from crudik.main.config.loader import Config, get_toml_config_path, load_config_from_toml
 from crudik.main.di.container import get_async_container
 from crudik.main.logs import configure_structlog
 from crudik.presentation.fast_api import include_exception_handlers, include_routers
-from crudik.presentation.fast_api.tracing import tracing_middleware
-
-log_config = configure_structlog()
+from crudik.presentation.fast_api.container import DiProfiler, setup_dishka
+from crudik.presentation.fast_api.responses import FastJSONResponse
+from crudik.presentation.fast_api.routers.root import PROBE_PATHS
+from crudik.presentation.fast_api.tracing import TracingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """FastAPI lifespan context manager that handles DI container lifecycle during application startup and shutdown."""
+    """FastAPI lifespan context manager that handles DI container lifecycle during application startup and shutdown.
+
+    The warmup runs in background, so the liveness probe answers meanwhile and readiness waits for it.
+    The database health check runs in background too, probes read its cached result from the app state.
+    """
+    warmup = await app.state.dishka_container.get(DbWarmup)
+    health_checker = await app.state.dishka_container.get(DbHealthChecker)
+    app.state.db_warmup = warmup
+    app.state.db_health_checker = health_checker
+    tasks = [asyncio.create_task(health_checker.run())]
+    if not warmup.is_done:
+        tasks.append(asyncio.create_task(warmup.run()))
     yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
     await app.state.dishka_container.close()
 
 
-def create_app(config: Config) -> FastAPI:
-    """Creates and configures the FastAPI application instance with routers, error handlers, and DI container."""
+def create_app(config: Config, *, default_response_class: type[Response] = FastJSONResponse) -> FastAPI:
+    """Creates and configures the FastAPI application instance with routers, error handlers, and DI container.
+
+    ``default_response_class`` renders the data returned by endpoints that do not build their response themselves.
+    """
     app = FastAPI(
         lifespan=lifespan,
+        default_response_class=default_response_class,
         root_path="/api",
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
     )
-    app.middleware("http")(tracing_middleware)
     container = get_async_container(config)
-    setup_dishka(container=container, app=app)
+    profiler = DiProfiler() if config.di_profiling.enabled else None
+    setup_dishka(container, app, scopeless_paths=PROBE_PATHS, profiler=profiler)
+    app.add_middleware(TracingMiddleware, config=config.tracing)
 
     include_routers(app)
     include_exception_handlers(app)
@@ -40,13 +64,34 @@ def create_app(config: Config) -> FastAPI:
     return app
 
 
+def create_worker_app() -> FastAPI:
+    """Application factory called by uvicorn in every worker process.
+
+    Stdlib logging of the worker is configured by uvicorn from the log config, structlog is configured here.
+    """
+    config = load_config_from_toml(get_toml_config_path())
+    configure_structlog(config.logging)
+    return create_app(config)
+
+
 def run_api() -> None:
-    """Starts the FastAPI application server using uvicorn on the configured host and port."""
+    """Starts the FastAPI application server using uvicorn with the configured workers and bind address."""
     config = load_config_from_toml(get_toml_config_path())
+    log_config = configure_structlog(config.logging)
+    server = config.server
     uvicorn.run(
-        create_app(config),
-        port=config.server.port,
-        host=config.server.host,
+        "crudik.main.fast_api:create_worker_app",
+        factory=True,
+        port=server.port,
+        host=server.host,
+        uds=server.uds,
+        workers=server.workers,
+        loop=server.loop.value,
+        http=server.http.value,
+        backlog=server.backlog,
+        timeout_keep_alive=server.timeout_keep_alive,
+        limit_concurrency=server.limit_concurrency,
+        limit_max_requests=server.limit_max_requests,
         log_config=log_config,
     )
 
@@ -1,36 +1,106 @@
+import logging
 from typing import Any
 
 import structlog
+from structlog.typing import FilteringBoundLogger, Processor
 
+from crudik.adapters.logs.config import LoggingConfig
+from crudik.adapters.logs.sampling import EventSampler
+from crudik.adapters.serialization import dump_json
 
-def configure_structlog() -> dict[str, Any]:
-    """Configure structlog and return log_config."""
-    processors = [
+
+def _dumps_json(obj: Any, **_kwargs: Any) -> str:
+    # Values that cannot be serialized are logged with their repr instead of failing the record
+    return dump_json(obj, fallback=repr).decode()
+
+
+def _wrap_level_filtering_logger(
+    logger: logging.Logger,
+    *,
+    processors: list[Processor],
+    context: dict[str, Any],
+) -> FilteringBoundLogger:
+    # Logging methods of levels disabled for the stdlib logger are no-ops, they skip the processors entirely.
+    # The level is taken when the logger is first used, so ``log_config`` must be applied before that.
+    logger_class = structlog.make_filtering_bound_logger(logger.getEffectiveLevel())
+    # The protocol does not declare the constructor of ``BoundLoggerBase``, which the returned classes share
+    return logger_class(logger, processors=processors, context=context)  # type:ignore[call-arg]
+
+
+def configure_structlog(config: LoggingConfig) -> dict[str, Any]:
+    """Configure structlog and return log_config.
+
+    Levels are set on the stdlib loggers, per logger name, and structlog loggers filter by the same levels.
+    Events configured in ``sampling`` are sampled by name. With the log queue enabled,
+    records are rendered and written by a background thread, so the event loop never blocks on stdout.
+    """
+    context_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
+    ]
+    render_processors: list[Processor] = [
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.dict_tracebacks,
         structlog.processors.UnicodeDecoder(),
     ]
+    processors = [*context_processors, *render_processors]
 
+    # Sampling applies to structlog events only, before the timestamp and tracebacks are built for them
     structlog.configure(
-        processors=[*processors, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],  # type:ignore[list-item]
+        processors=[
+            *context_processors,
+            EventSampler(config.sampling),
+            *render_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=_wrap_level_filtering_logger,  # type:ignore[arg-type]
         cache_logger_on_first_use=True,
     )
 
     json_formatter = {
         "()": structlog.stdlib.ProcessorFormatter,
-        "processor": structlog.processors.JSONRenderer(
-            sort_keys=True,
-            ensure_ascii=False,
-        ),
+        "processor": structlog.processors.JSONRenderer(serializer=_dumps_json),
         "foreign_pre_chain": processors,
     }
 
+    json_handler: dict[str, Any] = {
+        "class": "logging.StreamHandler",
+        "formatter": "json",
+        "stream": "ext://sys.stdout",
+    }
+    if config.queue.enabled:
+        json_handler = {
+            "()": "crudik.adapters.logs.queue.BatchingQueueHandler",
+            "formatter": "json",
+            "stream": "ext://sys.stdout",
+            "max_size": config.queue.max_size,
+            "batch_size": config.queue.batch_size,
+            "overflow": config.queue.overflow,
+        }
+
+    loggers: dict[str, dict[str, Any]] = {
+        "uvicorn": {
+            "level": "INFO",
+            "handlers": ["json"],
+            "propagate": False,
+        },
+        "uvicorn.error": {
+            "level": "CRITICAL",
+            "handlers": ["json"],
+            "propagate": False,
+        },
+        "uvicorn.access": {
+            "level": "INFO",
+            "handlers": ["json"],
+            "propagate": False,
+        },
+    }
+    for name, level in config.levels.items():
+        loggers.setdefault(name, {})["level"] = level
+
     log_config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -38,33 +108,13 @@ def configure_structlog() -> dict[str, Any]:
             "json": json_formatter,
         },
         "handlers": {
-            "json": {
-                "class": "logging.StreamHandler",
-                "formatter": "json",
-                "stream": "ext://sys.stdout",
-            },
+            "json": json_handler,
         },
         "root": {
-            "level": "DEBUG",
+            "level": config.level,
             "handlers": ["json"],
         },
-        "loggers": {
-            "uvicorn": {
-                "level": "INFO",
-                "handlers": ["json"],
-                "propagate": False,
-            },
-            "uvicorn.error": {
-                "level": "CRITICAL",
-                "handlers": ["json"],
-                "propagate": False,
-            },
-            "uvicorn.access": {
-                "level": "INFO",
-                "handlers": ["json"],
-                "propagate": False,
-            },
-        },
+        "loggers": loggers,
     }
 
     return log_config
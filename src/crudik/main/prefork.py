@@ -0,0 +1,170 @@
+import gc
+import logging
+import logging.config
+import os
+import signal
+import socket
+import sys
+import time
+from contextlib import suppress
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+from types import FrameType
+from typing import NoReturn
+
+import structlog
+import uvicorn
+
+from crudik.adapters.logs.config import QueueLoggingConfig
+from crudik.application.common.logger import Logger
+from crudik.main.config.loader import get_toml_config_path, load_config_from_toml
+from crudik.main.fast_api import create_app
+from crudik.main.logs import configure_structlog
+
+logger: Logger = structlog.get_logger(__name__)
+
+RESTART_DELAY = 1.0
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+# Exit code of uvicorn when the application fails to start
+STARTUP_FAILURE = 3
+
+
+class PreforkManager:
+    """Forks uvicorn workers serving a socket bound by the parent, and keeps their number.
+
+    Workers build the application, and so their DI container and database engine, after the fork,
+    so no connection is shared between processes. Workers that exit are replaced, crashed ones after a delay
+    and the ones recycled after ``limit_max_requests`` no sooner than the same delay after they were started,
+    so workers exiting right away are not forked in a loop. A worker failing to start stops the parent,
+    as every replacement would fail the same way. No worker is started once a stop signal arrives.
+    """
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int) -> None:
+        self._config = config
+        self._sock = sock
+        self._workers = workers
+        self._started_at: dict[int, float] = {}
+        self._stopping = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """Starts the workers and supervises them until a stop signal, returning the exit code of the parent.
+
+        The socket listens from the start, so connections wait in its backlog while no worker is accepting them.
+        The exit code is ``STARTUP_FAILURE`` if a worker failed to start and 0 otherwise.
+        """
+        self._sock.listen(self._config.backlog)
+        for sig in STOP_SIGNALS:
+            signal.signal(sig, self._stop)
+        logger.info("Starting prefork workers", workers=self._workers, parent_pid=os.getpid())
+        for _ in range(self._workers):
+            self._fork_worker()
+
+        while self._started_at:
+            pid, status = os.wait()
+            started_at = self._started_at.pop(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                continue
+            if exit_code == STARTUP_FAILURE:
+                logger.error("Worker failed to start, stopping", pid=pid)
+                self._exit_code = STARTUP_FAILURE
+                self._stop()
+                continue
+            if exit_code == 0:
+                logger.info("Worker recycled", pid=pid)
+                delay = started_at + RESTART_DELAY - time.monotonic()
+            else:
+                logger.error("Worker crashed", pid=pid, exit_code=exit_code)
+                delay = RESTART_DELAY
+            time.sleep(max(delay, 0))
+            self._fork_worker()
+        logger.info("Prefork workers stopped")
+        return self._exit_code
+
+    def _stop(self, _signum: int | None = None, _frame: FrameType | None = None) -> None:
+        self._stopping = True
+        for pid in self._started_at:
+            # The worker may have exited and not been reaped yet
+            with suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def _fork_worker(self) -> None:
+        # Stop signals wait until the worker is registered, so the handler never misses a started worker
+        signal.pthread_sigmask(signal.SIG_BLOCK, STOP_SIGNALS)
+        try:
+            if self._stopping:
+                return
+            pid = os.fork()
+            if pid == 0:
+                self._run_worker()
+            self._started_at[pid] = time.monotonic()
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
+
+    def _run_worker(self) -> NoReturn:
+        for sig in STOP_SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
+
+        exit_code = 1
+        try:
+            self._serve()
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            logger.exception("Worker failed")
+        finally:
+            logging.shutdown()
+            os._exit(exit_code)
+
+    def _serve(self) -> None:
+        # Log handler threads of the parent do not exist in the fork
+        self._config.configure_logging()
+        server = uvicorn.Server(self._config)
+        server.run(sockets=[self._sock])
+        # Uvicorn returns without an error if the lifespan startup fails
+        if not server.started:
+            raise SystemExit(STARTUP_FAILURE)
+
+
+def run_prefork_api() -> None:
+    """Starts the FastAPI application server in workers forked from a parent with the application code loaded.
+
+    Exits with ``STARTUP_FAILURE`` if a worker failed to start.
+    The garbage collector is disabled while loading and the loaded objects are frozen before forking,
+    so collections in workers do not write to them and their memory pages stay shared with the parent.
+    """
+    gc.disable()
+    config = load_config_from_toml(get_toml_config_path())
+    server = config.server
+    uvicorn_config = uvicorn.Config(
+        partial(create_app, config),
+        factory=True,
+        port=server.port,
+        host=server.host,
+        uds=server.uds,
+        loop=server.loop.value,
+        http=server.http.value,
+        backlog=server.backlog,
+        timeout_keep_alive=server.timeout_keep_alive,
+        limit_concurrency=server.limit_concurrency,
+        limit_max_requests=server.limit_max_requests,
+        log_config=None,
+    )
+    # Workers configure logging after the fork, the parent logs without the queue, as its thread would not be forked
+    uvicorn_config.log_config = configure_structlog(config.logging)
+    logging.config.dictConfig(configure_structlog(replace(config.logging, queue=QueueLoggingConfig())))
+    sock = uvicorn_config.bind_socket()
+    gc.freeze()
+    gc.enable()
+    try:
+        exit_code = PreforkManager(uvicorn_config, sock, server.workers).run()
+    finally:
+        sock.close()
+        if server.uds is not None:
+            Path(server.uds).unlink(missing_ok=True)
+    if exit_code:
+        sys.exit(exit_code)
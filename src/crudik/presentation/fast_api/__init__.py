@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 
+from crudik.entities.errors.base import AppError
 from crudik.presentation.fast_api.error_handlers import (
     app_error_handler,
 )
@@ -14,7 +15,11 @@ def include_routers(app: FastAPI) -> None:
 
 
 def include_exception_handlers(app: FastAPI) -> None:
-    """Registers global exception handlers for converting exceptions to HTTP error responses."""
+    """Registers global exception handlers for converting exceptions to HTTP error responses.
+
+    Application errors are handled inside the middleware stack, so their responses carry the trace id.
+    """
+    app.add_exception_handler(AppError, app_error_handler)
     app.add_exception_handler(Exception, app_error_handler)
 
 
@@ -1,9 +1,49 @@
 from dataclasses import dataclass
+from enum import Enum
+
+
+class LoopImplementation(Enum):
+    """Event loop implementation of the HTTP-server."""
+
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class HttpImplementation(Enum):
+    """HTTP protocol implementation of the HTTP-server."""
+
+    AUTO = "auto"
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
 
 
 @dataclass(slots=True, kw_only=True)
 class ServerConfig:
-    """HTTP-server configuration."""
+    """HTTP-server configuration.
+
+    The server binds to ``uds`` instead of ``host`` and ``port`` if set. Every one of ``workers`` processes
+    builds its own application, DI container and database engine. Their in-memory state is not shared,
+    so with several workers a request may miss the read-your-writes pin of a replica and caches
+    of another worker, and stats cover a single worker. Connections over ``limit_concurrency``
+    are answered with 503, ``None`` means no limit. A worker exits after ``limit_max_requests`` requests
+    and is replaced by a new one.
+    """
 
     port: int
     host: str
+    uds: str | None = None
+    workers: int = 1
+    loop: LoopImplementation = LoopImplementation.AUTO
+    http: HttpImplementation = HttpImplementation.AUTO
+    backlog: int = 2048
+    timeout_keep_alive: int = 5
+    limit_concurrency: int | None = None
+    limit_max_requests: int | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class StatsConfig:
+    """Configuration of the in-process stats endpoint, which is served only to users with ``reader_role``."""
+
+    reader_role: str = "stats-reader"
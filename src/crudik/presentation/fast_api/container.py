@@ -0,0 +1,138 @@
+import time
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from typing import Any, override
+
+from dishka import DEFAULT_COMPONENT, AsyncContainer, Scope
+from dishka.entities.component import Component
+from dishka.integrations.starlette import ContainerMiddleware
+from fastapi import FastAPI, Request
+from starlette.types import ASGIApp, Receive, Send
+from starlette.types import Scope as ASGIScope
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass(slots=True, kw_only=True)
+class DiProfilingConfig:
+    """Configuration of the DI profiler, which times request scopes and dependency resolution per route."""
+
+    enabled: bool = False
+
+
+@dataclass(slots=True, kw_only=True)
+class RouteDiStats:
+    """Accumulated DI timings of a route, in seconds."""
+
+    requests: int = 0
+    enter: float = 0.0
+    resolve: float = 0.0
+    close: float = 0.0
+
+
+class DiProfiler:
+    """Accumulates the time spent entering request scopes, resolving dependencies and closing scopes, per route.
+
+    Resolution covers the dependencies of the endpoint, including the factories called to create them.
+    Closing covers the finalizers of the scope, such as closing the database session.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self._stats: dict[str, RouteDiStats] = {}
+
+    def record(self, route: str, *, enter: float, resolve: float, close: float) -> None:
+        """Adds timings of a request to the route."""
+        stats = self._stats.get(route)
+        if stats is None:
+            stats = self._stats[route] = RouteDiStats()
+        stats.requests += 1
+        stats.enter += enter
+        stats.resolve += resolve
+        stats.close += close
+
+    def get_stats(self) -> dict[str, RouteDiStats]:
+        """Returns a copy of the accumulated timings per route."""
+        return {
+            route: RouteDiStats(requests=stats.requests, enter=stats.enter, resolve=stats.resolve, close=stats.close)
+            for route, stats in self._stats.items()
+        }
+
+
+class _ResolutionTimer:
+    """Request container proxy summing the time spent in ``get``."""
+
+    __slots__ = ("_clock", "_container", "seconds")
+
+    def __init__(self, container: AsyncContainer, clock: Callable[[], float]) -> None:
+        self._container = container
+        self._clock = clock
+        self.seconds = 0.0
+
+    async def get(self, dependency_type: Any, component: Component | None = DEFAULT_COMPONENT) -> Any:
+        started = self._clock()
+        try:
+            return await self._container.get(dependency_type, component)
+        finally:
+            self.seconds += self._clock() - started
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._container, name)
+
+
+class ScopelessPathsContainerMiddleware(ContainerMiddleware):
+    """Dishka container middleware that does not enter a request scope for the given paths.
+
+    Endpoints under these paths must not use ``FromDishka`` dependencies, and ``request.state.dishka_container``
+    is not set for them. With a profiler, DI timings of HTTP requests are recorded under their method and route.
+    """
+
+    def __init__(self, app: ASGIApp, *, paths: Collection[str], profiler: DiProfiler | None = None) -> None:
+        super().__init__(app)
+        self._paths = frozenset(paths)
+        self._profiler = profiler
+
+    @override
+    async def __call__(self, scope: ASGIScope, receive: Receive, send: Send) -> None:
+        """Passes requests to scopeless paths through, entering a request scope for the others."""
+        if scope["type"] == "http" and scope["path"].removeprefix(scope.get("root_path", "")) in self._paths:
+            return await self.app(scope, receive, send)
+        if scope["type"] == "http" and self._profiler is not None:
+            return await self._call_profiled(self._profiler, scope, receive, send)
+        return await super().__call__(scope, receive, send)
+
+    async def _call_profiled(self, profiler: DiProfiler, scope: ASGIScope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive=receive, send=send)
+        clock = profiler.clock
+        started = clock()
+        async with request.app.state.dishka_container({Request: request}, scope=Scope.REQUEST) as request_container:
+            timer = _ResolutionTimer(request_container, clock)
+            request.state.dishka_container = timer
+            entered = clock()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                close_started = clock()
+        closed = clock()
+
+        route = scope.get("route")
+        route_path = UNMATCHED_ROUTE if route is None else route.path
+        profiler.record(
+            f"{scope['method']} {route_path}",
+            enter=entered - started,
+            resolve=timer.seconds,
+            close=closed - close_started,
+        )
+
+
+def setup_dishka(
+    container: AsyncContainer,
+    app: FastAPI,
+    *,
+    scopeless_paths: Collection[str] = (),
+    profiler: DiProfiler | None = None,
+) -> None:
+    """Binds the container to the application, like the Dishka integration, but skipping scopeless paths."""
+    app.add_middleware(ScopelessPathsContainerMiddleware, paths=scopeless_paths, profiler=profiler)
+    app.state.dishka_container = container
+    app.state.di_profiler = profiler
@@ -1,13 +1,15 @@
+from dataclasses import dataclass
+
 import structlog
-from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi import Request, Response, status
 
 from crudik.adapters.auth.errors.auth_user import AuthUserAlreadyExistsError
-from crudik.adapters.auth.errors.base import UnauthorizedError
-from crudik.adapters.errors.http.response import ErrorResponse, InternalServerError
+from crudik.adapters.auth.errors.base import AuthUnavailableError, UnauthorizedError
+from crudik.adapters.errors.http.response import InternalServerError
+from crudik.adapters.serialization import dump_json
 from crudik.adapters.tracing import MissingTraceIdError
 from crudik.application.common.logger import Logger
-from crudik.application.errors.user import UserNotFoundError
+from crudik.application.errors.user import UserNotFoundError, UsersBatchTooLargeError
 from crudik.entities.errors.base import AccessDeniedError, AppError
 
 logger: Logger = structlog.get_logger(__name__)
@@ -15,42 +17,75 @@ logger: Logger = structlog.get_logger(__name__)
 
 error_to_http_status: dict[type[AppError], int] = {
     UnauthorizedError: 401,
+    AuthUnavailableError: 503,
     AuthUserAlreadyExistsError: 409,
     UserNotFoundError: 404,
     AccessDeniedError: 403,
     MissingTraceIdError: 422,
+    UsersBatchTooLargeError: 422,
+    InternalServerError: 500,
 }
 
 
-async def get_app_error_response(
-    err: AppError,
-) -> JSONResponse:
-    """Converts an AppError to an appropriate HTTP JSON response with status code mapping."""
-    try:
-        http_status = error_to_http_status[type(err)]
-    except KeyError:
-        logger.critical(
-            "AppError is missing status code mapping",
-            error_type=err.__class__.__qualname__
-            if not isinstance(err, InternalServerError)
-            else err.orig_error.__class__.__qualname__,
-        )
+@dataclass(frozen=True, slots=True)
+class ErrorResponseSpec:
+    """Precomputed HTTP status and response body prefix of an ``AppError`` type.
+
+    The body has the shape of ``ErrorResponse``, only ``message`` and ``meta`` are serialized per error.
+    They are serialized by the pydantic core serializer, like the model, so ``meta`` may hold any value it supports.
+    """
+
+    status: int
+    body_prefix: bytes
+
+    def render(self, err: AppError) -> bytes:
+        """Serializes the error response body."""
+        message = dump_json(err.message)
+        meta = dump_json(err.meta)
+        return b"".join((self.body_prefix, message, b',"meta":', meta, b"}"))
+
+
+_error_response_specs: dict[type[AppError], ErrorResponseSpec] = {}
+
+
+def get_error_response_spec(error_type: type[AppError]) -> ErrorResponseSpec:
+    """Returns the response spec of the error type, using the status of its closest mapped base class.
+
+    Specs are cached per type, so the MRO is walked once for every error type.
+    """
+    if (spec := _error_response_specs.get(error_type)) is not None:
+        return spec
+
+    http_status = next((error_to_http_status[cls] for cls in error_type.__mro__ if cls in error_to_http_status), None)
+    if http_status is None:
+        logger.critical("AppError is missing status code mapping", error_type=error_type.__qualname__)
         http_status = 500
 
-    error_response = ErrorResponse(
-        code=err.code,
-        message=err.message,
-        meta=err.meta,
-    ).model_dump(mode="json")
+    body_prefix = b'{"code":' + dump_json(error_type.code) + b',"message":'
+    spec = _error_response_specs[error_type] = ErrorResponseSpec(status=http_status, body_prefix=body_prefix)
+    return spec
+
+
+async def get_app_error_response(
+    err: AppError,
+) -> Response:
+    """Converts an AppError to an appropriate HTTP JSON response with status code mapping.
 
-    logger.info("Handled error", error_response=error_response, exc_info=err)
-    return JSONResponse(
-        status_code=http_status,
-        content=error_response,
+    Tracebacks are only logged for server errors, client errors are expected and logged without them.
+    """
+    spec = get_error_response_spec(type(err))
+    if spec.status >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        logger.error("Handled error", code=err.code, meta=err.meta, exc_info=err)
+    else:
+        logger.info("Handled error", code=err.code, meta=err.meta)
+    return Response(
+        content=spec.render(err),
+        status_code=spec.status,
+        media_type="application/json",
     )
 
 
-async def app_error_handler(_request: Request, exc: Exception) -> JSONResponse:
+async def app_error_handler(_request: Request, exc: Exception) -> Response:
     """FastAPI exception handler that converts AppError exceptions to JSON error responses."""
     app_error = exc if isinstance(exc, AppError) else None
     if app_error is None:
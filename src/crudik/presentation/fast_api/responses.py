@@ -0,0 +1,20 @@
+from typing import Any, override
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from crudik.adapters.serialization import dump_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendering pydantic models with their compiled serializer and other content with ``dump_json``.
+
+    Endpoints returning it with an already validated model skip the response model validation and
+    ``jsonable_encoder`` pass of FastAPI, the route ``response_model`` still documents the schema.
+    """
+
+    @override
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return dump_json(content)
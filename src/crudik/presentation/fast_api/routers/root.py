@@ -1,20 +1,31 @@
-import structlog
+from typing import Any
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from crudik.application.common.logger import Logger
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+from crudik.adapters.cache.gateway.auth_user import AuthUserCache
+from crudik.adapters.cache.gateway.user import UserCache
+from crudik.adapters.cache.ttl import TTLCache
+from crudik.adapters.db.pool import get_pool_stats
+from crudik.adapters.db.replica import ReplicaRouter
+from crudik.application.common.idp import IdProvider
+from crudik.entities.errors.base import AccessDeniedError
+from crudik.presentation.fast_api.config import StatsConfig
+from crudik.presentation.fast_api.container import DiProfiler
 
-logger: Logger = structlog.get_logger(__name__)
 router = APIRouter(
     tags=["Root"],
     route_class=DishkaRoute,
 )
 
 
+PROBE_PATHS = frozenset({"/internal/alive", "/internal/ready"})
+
+
 @router.get("/internal/alive")
 async def alive() -> JSONResponse:
     """HTTP endpoint for liveness probe."""
@@ -22,14 +33,84 @@ async def alive() -> JSONResponse:
 
 
 @router.get("/internal/ready")
-async def ready(
-    session: FromDishka[AsyncSession],
+async def ready(request: Request) -> JSONResponse:
+    """HTTP endpoint for readiness probe, which is not ready until the startup warmup finishes.
+
+    It reports the cached result of the background database health check and never touches the pool,
+    so probes keep working and stay cheap when the pod is overloaded.
+    """
+    warmup_done: bool = request.app.state.db_warmup.is_done
+    health = request.app.state.db_health_checker.get_health()
+    is_ready = warmup_done and health.ready
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "warmup_done": warmup_done,
+            "healthy": health.healthy,
+            "age": health.age,
+            "pool_saturation": health.pool_saturation,
+            "error": health.error,
+        },
+    )
+
+
+def _cache_stats(cache: TTLCache[Any, Any]) -> dict[str, Any]:
+    return {
+        "size": len(cache),
+        "hits": cache.stats.hits,
+        "misses": cache.stats.misses,
+        "evictions": cache.stats.evictions,
+        "hit_ratio": cache.stats.hit_ratio,
+    }
+
+
+def _di_stats(profiler: DiProfiler | None) -> dict[str, Any] | None:
+    if profiler is None:
+        return None
+    return {
+        route: {
+            "requests": stats.requests,
+            "enter_us": stats.enter / stats.requests * 1e6,
+            "resolve_us": stats.resolve / stats.requests * 1e6,
+            "close_us": stats.close / stats.requests * 1e6,
+        }
+        for route, stats in profiler.get_stats().items()
+    }
+
+
+@router.get("/internal/stats")
+async def stats(  # noqa: PLR0913
+    request: Request,
+    idp: FromDishka[IdProvider],
+    config: FromDishka[StatsConfig],
+    auth_user_cache: FromDishka[AuthUserCache],
+    access_token_cache: FromDishka[AccessTokenClaimsCache],
+    user_cache: FromDishka[UserCache],
+    engine: FromDishka[AsyncEngine],
+    replica_router: FromDishka[ReplicaRouter],
 ) -> JSONResponse:
-    """HTTP endpoint for readiness probe."""
-    try:
-        await session.execute(text("SELECT 1"))
-    except Exception as e:  # noqa: BLE001
-        await logger.awarning("Database is not ready", exc_info=e)
-        return JSONResponse(status_code=503, content={})
+    """HTTP endpoint exposing in-process cache counters, connection pool occupancy and DI timings if profiled.
 
-    return JSONResponse(status_code=200, content={})
+    DI timings are means per route in microseconds, for the worker process answering the request.
+    The stats disclose the internals of the deployment, so they are served only to users with the reader role.
+    """
+    if not await idp.has_role(config.reader_role):
+        raise AccessDeniedError
+    return JSONResponse(
+        status_code=200,
+        content={
+            "caches": {
+                "auth_user": _cache_stats(auth_user_cache),
+                "access_token": _cache_stats(access_token_cache),
+                "user": _cache_stats(user_cache),
+            },
+            "pools": {
+                "primary": get_pool_stats(engine.pool),
+                "replicas": {
+                    f"{replica.url.host}:{replica.url.port}": get_pool_stats(replica.pool)
+                    for replica in replica_router.engines
+                },
+            },
+            "di": _di_stats(request.app.state.di_profiler),
+        },
+    )
@@ -1,10 +1,15 @@
+from typing import Annotated
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
 from crudik.application.create_user import CreatedUser, CreateUser
+from crudik.application.create_users_batch import CreatedUsersBatch, CreateUsersBatch, UsersBatchForm
 from crudik.application.read_user import ReadUser, UserModel
+from crudik.application.read_users import ReadUsers, UsersModel
 from crudik.entities.common.identifiers import UserId
+from crudik.presentation.fast_api.responses import FastJSONResponse
 
 router = APIRouter(
     tags=["Users"],
@@ -13,18 +18,42 @@ router = APIRouter(
 )
 
 
-@router.post("/")
+@router.post("/", response_model=CreatedUser)
 async def create(
     interactor: FromDishka[CreateUser],
-) -> CreatedUser:
-    """HTTP endpoint for creating a new user."""
-    return await interactor.execute()
+) -> FastJSONResponse:
+    """HTTP endpoint for creating a new user.
+
+    The model is built by the interactor, so it is serialized directly without response validation.
+    """
+    return FastJSONResponse(await interactor.execute())
+
+
+@router.post("/batch")
+async def create_batch(
+    interactor: FromDishka[CreateUsersBatch],
+    form: UsersBatchForm,
+) -> CreatedUsersBatch:
+    """HTTP endpoint for creating many users bound to the given auth user IDs in one transaction."""
+    return await interactor.execute(form)
 
 
-@router.get("/{user_id}")
+@router.get("/")
+async def read_many(
+    interactor: FromDishka[ReadUsers],
+    ids: Annotated[list[UserId], Query()],
+) -> UsersModel:
+    """HTTP endpoint for retrieving data of many users by IDs with a single query."""
+    return await interactor.execute(ids)
+
+
+@router.get("/{user_id}", response_model=UserModel)
 async def read(
     interactor: FromDishka[ReadUser],
     user_id: UserId,
-) -> UserModel:
-    """HTTP endpoint for retrieving user data by ID."""
-    return await interactor.execute(user_id)
+) -> FastJSONResponse:
+    """HTTP endpoint for retrieving user data by ID.
+
+    The model is built by the interactor, so it is serialized directly without response validation.
+    """
+    return FastJSONResponse(await interactor.execute(user_id))
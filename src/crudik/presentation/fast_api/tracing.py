@@ -1,21 +1,59 @@
-from collections.abc import Awaitable, Callable
+from ipaddress import ip_address, ip_network
 
 import structlog
-from dishka import AsyncContainer
-from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from crudik.adapters.tracing import TraceId
+from crudik.adapters.tracing import TRACE_DEBUG_KEY, TracingConfig, make_trace_id
 
+DEBUG_HEADER_VALUES = frozenset({b"1", b"true"})
 
-async def tracing_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """Middleware that binds trace id logging contextvar for each request."""
-    if request.method not in {"GET", "POST", "DELETE", "PUT", "PATCH"}:
-        return await call_next(request)
 
-    dishka_container: AsyncContainer = request.state.dishka_container
-    trace_id: TraceId = await dishka_container.get(TraceId)
-    with structlog.contextvars.bound_contextvars(trace_id=trace_id):
-        return await call_next(request)
+class TracingMiddleware:
+    """ASGI middleware that binds trace id logging contextvar for each request and echoes it in the response.
+
+    The header is read from the ASGI scope directly, without building a request or resolving dependencies,
+    and the trace id is stored in the request state for ``HTTPTraceProvider``.
+    Requests flagged with the debug header by a trusted client also get the trace debug contextvar,
+    which disables log sampling.
+    """
+
+    def __init__(self, app: ASGIApp, *, config: TracingConfig) -> None:
+        self.app = app
+        self._config = config
+        self._header = config.trace_id_header.lower().encode("latin-1")
+        self._debug_header = None if config.debug_header is None else config.debug_header.lower().encode("latin-1")
+        self._debug_trusted_networks = tuple(ip_network(network) for network in config.debug_trusted_networks)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Binds the trace id around the request and adds its header to the response start."""
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        header_value = None
+        debug = False
+        for name, value in scope["headers"]:
+            if name == self._header:
+                header_value = value
+            elif name == self._debug_header:
+                debug = value.lower() in DEBUG_HEADER_VALUES and self._is_trusted(scope)
+        trace_id = make_trace_id(None if header_value is None else header_value.decode("latin-1"), self._config)
+        scope.setdefault("state", {})["trace_id"] = trace_id
+        trace_id_header = (self._header, trace_id.encode("latin-1"))
+
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), trace_id_header]
+            await send(message)
+
+        context = {"trace_id": trace_id, TRACE_DEBUG_KEY: True} if debug else {"trace_id": trace_id}
+        with structlog.contextvars.bound_contextvars(**context):
+            return await self.app(scope, receive, send_with_trace_id)
+
+    def _is_trusted(self, scope: Scope) -> bool:
+        if (client := scope.get("client")) is None:
+            return False
+        try:
+            address = ip_address(client[0])
+        except ValueError:
+            return False
+        return any(address in network for network in self._debug_trusted_networks)
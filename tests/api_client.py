@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Self
+from typing import Any, Self
 
 from adaptix import Retort
 from adaptix.load_error import LoadError
@@ -9,7 +9,9 @@ from crudik.adapters.auth.model import AuthUserId
 from crudik.adapters.errors.http.response import ErrorResponse
 from crudik.adapters.tracing import TraceId, TracingConfig
 from crudik.application.create_user import CreatedUser
+from crudik.application.create_users_batch import CreatedUsersBatch
 from crudik.application.read_user import UserModel
+from crudik.application.read_users import UsersModel
 from crudik.entities.common.identifiers import UserId
 
 retort = Retort()
@@ -86,6 +88,8 @@ class AuthContext:
     def __exit__(self, *exc_info: object) -> None:
         """Remove authentication header after the context."""
         self._api_client.remove_header(self._config.auth_user_id_header)
+        if self._access_token:
+            self._api_client.remove_header(self._config.access_token_header)
         if exc_info[0] is not None:  # exc type
             raise exc_info[1]  # type: ignore[misc] # exc value
 
@@ -138,17 +142,17 @@ class ApiClient:
         """Remove HTTP header."""
         del self._headers[header]
 
-    def authenticate(self, *, auth_user_id: AuthUserId) -> AuthContext:
-        """Set auth user ID for requests."""
-        return AuthContext(self, auth_user_id, self._config, self._access_token)
+    def authenticate(self, *, auth_user_id: AuthUserId, access_token: str | None = None) -> AuthContext:
+        """Set auth user ID for requests, with the given access token instead of the default one."""
+        return AuthContext(self, auth_user_id, self._config, access_token or self._access_token)
 
-    async def readiness(self) -> APIResponse[EmptyResponse]:
+    async def readiness(self) -> APIResponse[dict[str, Any]]:
         """GET /internal/ready."""
         url = "/internal/ready"
         async with self.session.get(url, headers=self._headers) as response:
             return await self._load_response(
                 response,
-                response_type=EmptyResponse,
+                response_type=dict[str, Any],
             )
 
     async def liveness(self) -> APIResponse[EmptyResponse]:
@@ -160,6 +164,15 @@ class ApiClient:
                 response_type=EmptyResponse,
             )
 
+    async def internal_stats(self) -> APIResponse[dict[str, Any]]:
+        """GET /internal/stats."""
+        url = "/internal/stats"
+        async with self.session.get(url, headers=self._headers) as response:
+            return await self._load_response(
+                response,
+                response_type=dict[str, Any],
+            )
+
     async def create_user(self) -> APIResponse[CreatedUser]:
         """Create a new user via POST /users/."""
         url = "/users/"
@@ -169,6 +182,16 @@ class ApiClient:
                 response_type=CreatedUser,
             )
 
+    async def create_users_batch(self, auth_user_ids: list[str]) -> APIResponse[CreatedUsersBatch]:
+        """Create users for many auth user IDs via POST /users/batch."""
+        url = "/users/batch"
+        json = {"auth_user_ids": auth_user_ids}
+        async with self.session.post(url, headers=self._headers, json=json) as response:
+            return await self._load_response(
+                response,
+                response_type=CreatedUsersBatch,
+            )
+
     async def read_user(self, user_id: UserId) -> APIResponse[UserModel]:
         """Read user by id via GET /users/{user_id}."""
         url = f"/users/{user_id}"
@@ -177,3 +200,13 @@ class ApiClient:
                 response,
                 response_type=UserModel,
             )
+
+    async def read_users(self, user_ids: list[UserId]) -> APIResponse[UsersModel]:
+        """Read many users by ids via GET /users/?ids=..."""
+        url = "/users/"
+        params = [("ids", str(user_id)) for user_id in user_ids]
+        async with self.session.get(url, headers=self._headers, params=params) as response:
+            return await self._load_response(
+                response,
+                response_type=UsersModel,
+            )
@@ -1,5 +1,6 @@
 import os
 from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
 from uuid import uuid4
 
 import aiohttp
@@ -127,6 +128,34 @@ async def access_token(app_config: Config) -> str:
     )
 
 
+def encode_role_access_token(app_config: Config, role: str) -> str:
+    """Dummy access token with email_verified set to True and the role."""
+    *path, roles_key = app_config.web_auth.roles_claim.split(".")
+    claims: dict[str, Any] = {roles_key: [role]}
+    for key in reversed(path):
+        claims = {key: claims}
+    return jwt.encode(
+        {
+            "email_verified": True,
+            **claims,
+        },
+        key=DUMMY_PRIVATE_KEY,
+        algorithm=app_config.web_auth.access_token_alg,
+    )
+
+
+@pytest.fixture(scope="session")
+async def provisioner_access_token(app_config: Config) -> str:
+    """Dummy access token with email_verified set to True and the role of users provisioner."""
+    return encode_role_access_token(app_config, app_config.users_batch.provisioner_role)
+
+
+@pytest.fixture(scope="session")
+async def stats_reader_access_token(app_config: Config) -> str:
+    """Dummy access token with email_verified set to True and the role of stats reader."""
+    return encode_role_access_token(app_config, app_config.stats.reader_role)
+
+
 @pytest.fixture
 def api_client(http_session: ClientSession, app_config: Config, trace_id: TraceId, access_token: str) -> ApiClient:
     """Create and provide API client for tests."""
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+
+ROUTE = "POST /users/"
+POLL_ATTEMPTS = 20
+POLL_INTERVAL = 0.05
+
+
+async def get_di_stats(api_client: ApiClient) -> dict[str, Any]:
+    """Get DI timings, waiting for the route, as timings are recorded after the response is sent."""
+    di: dict[str, Any] = {}
+    for _ in range(POLL_ATTEMPTS):
+        response = await api_client.internal_stats()
+        di = response.assert_status(200).ensure_ok()["di"]
+        if ROUTE in di:
+            break
+        await asyncio.sleep(POLL_INTERVAL)
+    return di
+
+
+async def test_stats_expose_di_timings(
+    api_client: ApiClient,
+    app_config: Config,
+    stats_reader_access_token: str,
+) -> None:
+    """Test that the stats endpoint reports DI timings of the routes that were called."""
+    if not app_config.di_profiling.enabled:
+        pytest.skip("DI profiling is disabled")
+
+    with api_client.authenticate(auth_user_id="di-profile"):
+        (await api_client.create_user()).assert_status(200)
+
+    with api_client.authenticate(auth_user_id="stats", access_token=stats_reader_access_token):
+        route = (await get_di_stats(api_client))[ROUTE]
+    assert route["requests"] >= 1
+    assert route["resolve_us"] > 0
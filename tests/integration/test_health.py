@@ -0,0 +1,80 @@
+from dataclasses import replace
+
+from crudik.adapters.db.engine import create_engine
+from crudik.adapters.db.health import DbHealthChecker, HealthConfig
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+from tests.clock import FakeClock
+
+MAX_AGE = 10.0
+HALF_SATURATION = 0.5
+
+
+async def test_health_is_ready_after_successful_check(app_config: Config) -> None:
+    """Test that a successful check makes the database healthy, and the state ages until the next one."""
+    engine = create_engine(app_config.db, app_config.db.connection_url)
+    clock = FakeClock()
+    checker = DbHealthChecker(config=HealthConfig(max_age=MAX_AGE), engine=engine, clock=clock)
+    try:
+        before_check = checker.get_health()
+        await checker.check()
+        after_check = checker.get_health()
+        clock.now += MAX_AGE + 1
+        stale = checker.get_health()
+    finally:
+        await engine.dispose()
+
+    assert not before_check.ready
+    assert before_check.age is None
+    assert after_check.ready
+    assert after_check.healthy
+    assert after_check.age == 0
+    assert not stale.ready
+    assert stale.healthy
+
+
+async def test_health_is_not_ready_when_database_is_unreachable(app_config: Config) -> None:
+    """Test that a failed check is recorded instead of raised."""
+    config = replace(app_config.db, host="127.0.0.1", port=1)
+    engine = create_engine(config, config.connection_url)
+    checker = DbHealthChecker(config=HealthConfig(), engine=engine)
+    try:
+        await checker.check()
+        health = checker.get_health()
+    finally:
+        await engine.dispose()
+
+    assert not health.ready
+    assert not health.healthy
+    assert health.error is not None
+
+
+async def test_health_is_not_ready_when_pool_is_saturated(app_config: Config) -> None:
+    """Test that a healthy database is not ready while the pool is busier than allowed."""
+    config = replace(app_config.db, pool_size=2, max_overflow=0)
+    engine = create_engine(config, config.connection_url)
+    checker = DbHealthChecker(config=HealthConfig(max_pool_saturation=HALF_SATURATION - 0.1), engine=engine)
+    try:
+        await checker.check()
+        idle = checker.get_health()
+        async with engine.connect():
+            busy = checker.get_health()
+    finally:
+        await engine.dispose()
+
+    assert idle.ready
+    assert idle.pool_saturation == 0
+    assert not busy.ready
+    assert busy.healthy
+    assert busy.pool_saturation == HALF_SATURATION
+
+
+async def test_readiness_probe_reports_cached_health(api_client: ApiClient) -> None:
+    """Test that the readiness probe exposes the background check state."""
+    response = await api_client.readiness()
+
+    health = response.assert_status(200).ensure_ok()
+    assert health["healthy"]
+    assert health["warmup_done"]
+    assert health["age"] is not None
+    assert "pool_saturation" in health
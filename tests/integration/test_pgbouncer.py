@@ -0,0 +1,45 @@
+import asyncio
+import os
+from dataclasses import replace
+
+import pytest
+from fastapi import Request
+
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.main.config.loader import Config
+from crudik.main.di.container import get_async_container
+from tests.integration.utils import make_http_request, without_caches
+
+CONCURRENT_USERS = 20
+
+
+@pytest.fixture(params=["postgres", "pgbouncer"])
+def pgbouncer_mode_config(request: pytest.FixtureRequest, app_config: Config) -> Config:
+    """Config in PgBouncer mode, connected to Postgres directly or to PgBouncer at $PGBOUNCER_HOST:$PGBOUNCER_PORT."""
+    db = replace(app_config.db, pgbouncer=True, null_pool=True)
+    if request.param == "pgbouncer":
+        if (host := os.getenv("PGBOUNCER_HOST")) is None:
+            pytest.skip("PGBOUNCER_HOST is not set")
+        db = replace(db, host=host, port=int(os.getenv("PGBOUNCER_PORT", "6432")))
+    return replace(without_caches(app_config), db=db)
+
+
+async def test_create_and_read_user_in_pgbouncer_mode(pgbouncer_mode_config: Config, access_token: str) -> None:
+    """Test that concurrent requests work when their statements may land on any server connection."""
+    config = pgbouncer_mode_config
+    container = get_async_container(config)
+
+    async def create_and_read(auth_user_id: str) -> None:
+        request = make_http_request(config, auth_user_id, access_token)
+        async with container({Request: request}) as request_container:
+            user_id = (await (await request_container.get(CreateUser)).execute()).id
+
+        for _ in range(2):
+            async with container({Request: request}) as request_container:
+                assert (await (await request_container.get(ReadUser)).execute(user_id)).id == user_id
+
+    try:
+        await asyncio.gather(*(create_and_read(str(i)) for i in range(CONCURRENT_USERS)))
+    finally:
+        await container.close()
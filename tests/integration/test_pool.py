@@ -0,0 +1,46 @@
+import asyncio
+from dataclasses import replace
+
+from sqlalchemy import text
+
+from crudik.adapters.db.engine import create_engine
+from crudik.adapters.db.pool import InstrumentedAsyncQueuePool
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+
+CONCURRENT_CHECKOUTS = 3
+
+
+async def test_pool_counts_waiting_checkouts(app_config: Config) -> None:
+    """Test that checkouts exceeding the pool limits are counted as waits."""
+    config = replace(app_config.db, pool_size=1, max_overflow=0)
+    engine = create_engine(config, config.connection_url)
+
+    async def checkout() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT pg_sleep(0.05)"))
+
+    try:
+        await asyncio.gather(*(checkout() for _ in range(CONCURRENT_CHECKOUTS)))
+        pool = engine.pool
+        assert isinstance(pool, InstrumentedAsyncQueuePool)
+        assert pool.stats.checkouts == CONCURRENT_CHECKOUTS
+        assert pool.stats.waits == CONCURRENT_CHECKOUTS - 1
+        assert pool.stats.waiters == 0
+        assert pool.stats.max_wait_time > 0
+    finally:
+        await engine.dispose()
+
+
+async def test_stats_expose_pool_occupancy(
+    api_client: ApiClient,
+    app_config: Config,
+    stats_reader_access_token: str,
+) -> None:
+    """Test that the stats endpoint reports the primary pool."""
+    with api_client.authenticate(auth_user_id="stats", access_token=stats_reader_access_token):
+        response = await api_client.internal_stats()
+
+    pools = response.assert_status(200).ensure_ok()["pools"]
+    assert pools["primary"]["size"] == app_config.db.pool_size
+    assert pools["replicas"] == {}
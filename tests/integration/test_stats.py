@@ -0,0 +1,26 @@
+from tests.api_client import ApiClient
+
+
+async def test_stats_without_authentication_fails(api_client: ApiClient) -> None:
+    """Test that anonymous requests to the stats endpoint return 401 error."""
+    response = await api_client.internal_stats()
+
+    error = response.assert_status(401).ensure_err()
+    assert error.code == "UNAUTHORIZED"
+
+
+async def test_stats_without_reader_role_fails(api_client: ApiClient) -> None:
+    """Test that an ordinary user cannot read the stats and gets 403 error."""
+    with api_client.authenticate(auth_user_id="1"):
+        response = await api_client.internal_stats()
+
+    error = response.assert_status(403).ensure_err()
+    assert error.code == "ACCESS_DENIED"
+
+
+async def test_stats_with_reader_role(api_client: ApiClient, stats_reader_access_token: str) -> None:
+    """Test that a user with the reader role gets the stats."""
+    with api_client.authenticate(auth_user_id="1", access_token=stats_reader_access_token):
+        response = await api_client.internal_stats()
+
+    assert set(response.assert_status(200).ensure_ok()) == {"caches", "pools", "di"}
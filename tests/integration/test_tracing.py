@@ -0,0 +1,37 @@
+from aiohttp import ClientSession
+
+from crudik.adapters.tracing import TraceId
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+
+
+async def test_trace_id_is_echoed(api_client: ApiClient, app_config: Config, trace_id: TraceId) -> None:
+    """Test that the trace id passed by the client is returned in the response headers."""
+    with api_client.authenticate(auth_user_id="1"):
+        response = await api_client.create_user()
+
+    response.assert_status(200)
+    assert response.http_response.headers[app_config.tracing.trace_id_header] == trace_id
+
+
+async def test_trace_id_is_echoed_in_error_response(
+    api_client: ApiClient,
+    app_config: Config,
+    trace_id: TraceId,
+) -> None:
+    """Test that application error responses carry the trace id too."""
+    response = await api_client.create_user()
+
+    response.assert_status(401)
+    assert response.http_response.headers[app_config.tracing.trace_id_header] == trace_id
+
+
+async def test_trace_id_is_generated(http_session: ClientSession, app_config: Config) -> None:
+    """Test that a request without trace id gets a new one, different for every request."""
+    async with http_session.get("/internal/alive") as first, http_session.get("/internal/alive") as second:
+        first_trace_id = first.headers.get(app_config.tracing.trace_id_header)
+        second_trace_id = second.headers.get(app_config.tracing.trace_id_header)
+
+    assert first_trace_id
+    assert second_trace_id
+    assert first_trace_id != second_trace_id
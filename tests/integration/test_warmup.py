@@ -0,0 +1,34 @@
+from dishka import AsyncContainer
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from crudik.adapters.db.models import user_table
+from crudik.adapters.db.warmup import DbWarmup, WarmupConfig
+
+WARMUP_CONNECTIONS = 2
+
+
+async def test_warmup_fills_pool_without_writing(container: AsyncContainer, session: AsyncSession) -> None:
+    """Test that warmup leaves open connections in the pool and no rows in the database."""
+    engine = await container.get(AsyncEngine)
+    warmup = DbWarmup(
+        config=WarmupConfig(enabled=True, connections=WARMUP_CONNECTIONS),
+        engine=engine,
+        replica_engines=[],
+    )
+    done_before_run = warmup.is_done
+
+    await warmup.run()
+
+    assert not done_before_run
+    assert warmup.is_done
+    assert engine.pool.checkedin() == WARMUP_CONNECTIONS  # type: ignore[attr-defined]
+    users_count = (await session.execute(select(func.count()).select_from(user_table))).scalar_one()
+    assert users_count == 0
+
+
+async def test_disabled_warmup_is_done(container: AsyncContainer) -> None:
+    """Test that readiness is not held back when warmup is disabled."""
+    warmup = DbWarmup(config=WarmupConfig(enabled=False), engine=await container.get(AsyncEngine), replica_engines=[])
+
+    assert warmup.is_done
@@ -1,5 +1,14 @@
+from dishka import AsyncContainer
+from fastapi import Request
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from crudik.adapters.db.models import user_table
+from crudik.application.create_user import CreateUser
+from crudik.main.config.loader import Config
 from tests.api_client import ApiClient
 from tests.integration.user.utils import create_user
+from tests.integration.utils import count_statements, make_http_request
 
 
 async def test_create_user(api_client: ApiClient) -> None:
@@ -31,3 +40,29 @@ async def test_create_user_without_auth_fails(api_client: ApiClient) -> None:
 
     error = response.assert_status(401).ensure_err()
     assert error.code == "UNAUTHORIZED"
+
+
+async def test_create_user_that_already_exists_leaves_no_user(api_client: ApiClient, session: AsyncSession) -> None:
+    """Test that a conflicting creation does not leave an orphan user row."""
+    with api_client.authenticate(auth_user_id="1"):
+        await create_user(api_client)
+        await api_client.create_user()
+
+    users_count = (await session.execute(select(func.count()).select_from(user_table))).scalar_one()
+    assert users_count == 1
+
+
+async def test_create_user_issues_single_statement(
+    container: AsyncContainer,
+    app_config: Config,
+    access_token: str,
+) -> None:
+    """Test that the user and its auth user record are inserted with one SQL statement."""
+    engine = await container.get(AsyncEngine)
+    request = make_http_request(app_config, "1", access_token)
+    async with container({Request: request}) as request_container:
+        interactor = await request_container.get(CreateUser)
+        with count_statements(engine) as statements:
+            await interactor.execute()
+
+    assert len(statements) == 1, statements
@@ -0,0 +1,87 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crudik.adapters.db.models import auth_user_table, user_table
+from crudik.application.create_users_batch import UsersBatchItemStatus
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+from tests.integration.user.utils import create_user
+
+
+async def test_create_users_batch(
+    api_client: ApiClient,
+    session: AsyncSession,
+    provisioner_access_token: str,
+) -> None:
+    """Test that a user is created for every auth user ID of the batch."""
+    auth_user_ids = ["2", "3", "4"]
+
+    with api_client.authenticate(auth_user_id="1", access_token=provisioner_access_token):
+        await create_user(api_client)
+        response = await api_client.create_users_batch(auth_user_ids)
+
+    batch = response.assert_status(200).ensure_ok()
+    assert [item.auth_user_id for item in batch.items] == auth_user_ids
+    assert all(item.status == UsersBatchItemStatus.CREATED for item in batch.items)
+    assert all(item.id is not None for item in batch.items)
+
+    users_count = (await session.execute(select(func.count()).select_from(user_table))).scalar_one()
+    auth_users_count = (await session.execute(select(func.count()).select_from(auth_user_table))).scalar_one()
+    assert users_count == auth_users_count == len(auth_user_ids) + 1
+
+
+async def test_create_users_batch_reports_conflicts(
+    api_client: ApiClient,
+    session: AsyncSession,
+    provisioner_access_token: str,
+) -> None:
+    """Test that already bound and repeated IDs are reported per item without leaving orphan users."""
+    with api_client.authenticate(auth_user_id="1", access_token=provisioner_access_token):
+        await create_user(api_client)
+        response = await api_client.create_users_batch(["1", "2", "2"])
+
+    batch = response.assert_status(200).ensure_ok()
+    statuses = {item.auth_user_id: item.status for item in batch.items}
+    assert statuses == {"1": UsersBatchItemStatus.ALREADY_EXISTS, "2": UsersBatchItemStatus.CREATED}
+
+    users_count = (await session.execute(select(func.count()).select_from(user_table))).scalar_one()
+    assert users_count == len(statuses)
+
+
+async def test_create_users_batch_too_large_fails(
+    api_client: ApiClient,
+    app_config: Config,
+    provisioner_access_token: str,
+) -> None:
+    """Test that a batch above the configured limit returns 422 error."""
+    max_size = app_config.users_batch.max_size
+
+    with api_client.authenticate(auth_user_id="1", access_token=provisioner_access_token):
+        await create_user(api_client)
+        response = await api_client.create_users_batch([str(i) for i in range(max_size + 1)])
+
+    error = response.assert_status(422).ensure_err()
+    assert error.code == "USERS_BATCH_TOO_LARGE"
+    assert error.meta is not None
+    assert error.meta["max_size"] == max_size
+
+
+async def test_create_users_batch_without_provisioner_role_fails(api_client: ApiClient, session: AsyncSession) -> None:
+    """Test that an ordinary user cannot bind auth user IDs of other people and gets 403 error."""
+    with api_client.authenticate(auth_user_id="1"):
+        await create_user(api_client)
+        response = await api_client.create_users_batch(["2", "3"])
+
+    error = response.assert_status(403).ensure_err()
+    assert error.code == "ACCESS_DENIED"
+
+    users_count = (await session.execute(select(func.count()).select_from(user_table))).scalar_one()
+    assert users_count == 1
+
+
+async def test_create_users_batch_without_auth_fails(api_client: ApiClient) -> None:
+    """Test that creating a batch without authentication returns 401 error."""
+    response = await api_client.create_users_batch(["1"])
+
+    error = response.assert_status(401).ensure_err()
+    assert error.code == "UNAUTHORIZED"
@@ -1,7 +1,15 @@
 from uuid import uuid4
 
+from dishka import AsyncContainer
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.application.read_user import ReadUser
+from crudik.main.config.loader import Config
+from crudik.main.di.container import get_async_container
 from tests.api_client import ApiClient
 from tests.integration.user.utils import create_user
+from tests.integration.utils import count_statements, make_http_request, without_caches
 
 
 async def test_read_user(api_client: ApiClient) -> None:
@@ -52,3 +60,53 @@ async def test_read_user_without_auth_fails(api_client: ApiClient) -> None:
 
     error = response.assert_status(401).ensure_err()
     assert error.code == "UNAUTHORIZED"
+
+
+async def test_read_user_issues_single_statement(
+    api_client: ApiClient,
+    app_config: Config,
+    access_token: str,
+) -> None:
+    """Test that identity resolution and user lookup take one SQL statement per request."""
+    auth_user_id = "1"
+    with api_client.authenticate(auth_user_id=auth_user_id):
+        user_id = await create_user(api_client)
+
+    config = without_caches(app_config)
+    container = get_async_container(config)
+    try:
+        engine = await container.get(AsyncEngine)
+        for _ in range(2):
+            request = make_http_request(config, auth_user_id, access_token)
+            async with container({Request: request}) as request_container:
+                interactor = await request_container.get(ReadUser)
+                with count_statements(engine) as statements:
+                    await interactor.execute(user_id)
+
+            assert len(statements) == 1, statements
+    finally:
+        await container.close()
+
+
+async def test_repeated_read_user_is_served_from_cache(
+    api_client: ApiClient,
+    container: AsyncContainer,
+    app_config: Config,
+    access_token: str,
+) -> None:
+    """Test that a repeated read issues no SQL statements once the caches are warm."""
+    auth_user_id = "1"
+    with api_client.authenticate(auth_user_id=auth_user_id):
+        user_id = await create_user(api_client)
+
+    engine = await container.get(AsyncEngine)
+    statements_per_request = []
+    for _ in range(2):
+        request = make_http_request(app_config, auth_user_id, access_token)
+        async with container({Request: request}) as request_container:
+            interactor = await request_container.get(ReadUser)
+            with count_statements(engine) as statements:
+                await interactor.execute(user_id)
+        statements_per_request.append(len(statements))
+
+    assert statements_per_request == [1, 0]
@@ -0,0 +1,45 @@
+import asyncio
+from dataclasses import replace
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.adapters.batching.config import BatchingConfig
+from crudik.application.read_user import ReadUser
+from crudik.entities.common.identifiers import UserId
+from crudik.main.config.loader import Config
+from crudik.main.di.container import get_async_container
+from tests.api_client import ApiClient
+from tests.integration.user.utils import create_user
+from tests.integration.utils import count_statements, make_http_request
+
+CONCURRENT_REQUESTS = 10
+AUTH_USER_AND_USER_STATEMENTS = 2
+
+
+async def test_concurrent_reads_are_batched(api_client: ApiClient, app_config: Config, access_token: str) -> None:
+    """Test that concurrent requests resolve their identities and users with one statement per lookup kind."""
+    users: dict[str, UserId] = {}
+    for i in range(CONCURRENT_REQUESTS):
+        auth_user_id = str(i)
+        with api_client.authenticate(auth_user_id=auth_user_id):
+            users[auth_user_id] = await create_user(api_client)
+
+    config = replace(app_config, batching=BatchingConfig(enabled=True, window=0.05, max_batch_size=100))
+    container = get_async_container(config)
+
+    async def read_user(auth_user_id: str, user_id: UserId) -> UserId:
+        request = make_http_request(config, auth_user_id, access_token)
+        async with container({Request: request}) as request_container:
+            interactor = await request_container.get(ReadUser)
+            return (await interactor.execute(user_id)).id
+
+    try:
+        engine = await container.get(AsyncEngine)
+        with count_statements(engine) as statements:
+            results = await asyncio.gather(*(read_user(*item) for item in users.items()))
+    finally:
+        await container.close()
+
+    assert results == list(users.values())
+    assert len(statements) == AUTH_USER_AND_USER_STATEMENTS, statements
@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+import pytest
+from dishka import AsyncContainer
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.application.errors.user import UserNotFoundError
+from crudik.application.read_users import ReadUsers
+from crudik.main.config.loader import Config
+from tests.api_client import ApiClient
+from tests.integration.user.utils import create_user
+from tests.integration.utils import count_statements, make_http_request
+
+IDENTITY_AND_LOOKUP_STATEMENTS = 2
+
+
+async def test_read_users(api_client: ApiClient) -> None:
+    """Test successful read of many users by ids, with duplicates collapsed."""
+    with api_client.authenticate(auth_user_id="1"):
+        user_id = await create_user(api_client)
+        response = await api_client.read_users([user_id, user_id])
+
+    content = response.assert_status(200).ensure_ok()
+    assert [item.id for item in content.items] == [user_id]
+
+
+async def test_read_users_that_do_not_exist_fails(api_client: ApiClient) -> None:
+    """Test that reading a non-existent user among others returns 404 error."""
+    fake_user_id = uuid4()
+    with api_client.authenticate(auth_user_id="1"):
+        user_id = await create_user(api_client)
+        response = await api_client.read_users([user_id, fake_user_id])
+
+    error = response.assert_status(404).ensure_err()
+    assert error.code == "USER_NOT_FOUND"
+    assert error.meta is not None
+    assert error.meta["user_id"] == str(fake_user_id)
+
+
+async def test_read_users_by_other_user_fails(api_client: ApiClient) -> None:
+    """Test that reading another user's data among others returns 403 error."""
+    with api_client.authenticate(auth_user_id="1"):
+        first_user_id = await create_user(api_client)
+
+    with api_client.authenticate(auth_user_id="2"):
+        second_user_id = await create_user(api_client)
+        response = await api_client.read_users([second_user_id, first_user_id])
+
+    error = response.assert_status(403).ensure_err()
+    assert error.code == "ACCESS_DENIED"
+
+
+async def test_read_users_too_many_ids_fails(api_client: ApiClient, app_config: Config) -> None:
+    """Test that reading more IDs than the configured read limit returns 422 error."""
+    max_ids = app_config.users_read.max_ids
+    with api_client.authenticate(auth_user_id="1"):
+        await create_user(api_client)
+        response = await api_client.read_users([uuid4() for _ in range(max_ids + 1)])
+
+    error = response.assert_status(422).ensure_err()
+    assert error.code == "USERS_BATCH_TOO_LARGE"
+    assert error.meta is not None
+    assert error.meta["max_size"] == max_ids
+
+
+async def test_read_users_without_auth_fails(api_client: ApiClient) -> None:
+    """Test that reading users without authentication returns 401 error."""
+    response = await api_client.read_users([uuid4()])
+
+    error = response.assert_status(401).ensure_err()
+    assert error.code == "UNAUTHORIZED"
+
+
+async def test_read_users_issues_single_lookup_statement(
+    api_client: ApiClient,
+    container: AsyncContainer,
+    app_config: Config,
+    access_token: str,
+) -> None:
+    """Test that users are loaded with one SQL statement regardless of their count."""
+    auth_user_id = "1"
+    with api_client.authenticate(auth_user_id=auth_user_id):
+        user_id = await create_user(api_client)
+
+    engine = await container.get(AsyncEngine)
+    request = make_http_request(app_config, auth_user_id, access_token)
+    async with container({Request: request}) as request_container:
+        interactor = await request_container.get(ReadUsers)
+        with count_statements(engine) as statements, pytest.raises(UserNotFoundError):
+            await interactor.execute([user_id, uuid4(), uuid4()])
+
+    assert len(statements) == IDENTITY_AND_LOOKUP_STATEMENTS, statements
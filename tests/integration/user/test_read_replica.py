@@ -0,0 +1,87 @@
+from dataclasses import replace
+
+from dishka import AsyncContainer
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.adapters.db.config import DbReplicaConfig
+from crudik.adapters.db.replica import ReplicaRouter
+from crudik.application.create_user import CreateUser
+from crudik.application.read_user import ReadUser
+from crudik.entities.common.identifiers import UserId
+from crudik.main.config.loader import Config
+from crudik.main.di.container import get_async_container
+from tests.api_client import ApiClient
+from tests.integration.user.utils import create_user
+from tests.integration.utils import count_statements, make_http_request, without_caches
+
+UNREACHABLE_PORT = 1
+
+
+def with_replica(config: Config, replica: DbReplicaConfig) -> Config:
+    """Copy config with caches disabled and a single read replica."""
+    config = without_caches(config)
+    return replace(config, db=replace(config.db, replicas=[replica]))
+
+
+async def read_user(container: AsyncContainer, config: Config, access_token: str, user_id: UserId) -> None:
+    """Read the user in-process, authenticated as auth user 1."""
+    request = make_http_request(config, "1", access_token)
+    async with container({Request: request}) as request_container:
+        await (await request_container.get(ReadUser)).execute(user_id)
+
+
+async def test_read_user_is_routed_to_replica(api_client: ApiClient, app_config: Config, access_token: str) -> None:
+    """Test that read-only lookups use the replica engine only."""
+    with api_client.authenticate(auth_user_id="1"):
+        user_id = await create_user(api_client)
+
+    # the primary stands in for its own replica
+    config = with_replica(app_config, DbReplicaConfig(host=app_config.db.host, port=app_config.db.port))
+    container = get_async_container(config)
+    try:
+        primary = await container.get(AsyncEngine)
+        replica = (await container.get(ReplicaRouter)).engines[0]
+        with count_statements(primary) as primary_statements, count_statements(replica) as replica_statements:
+            await read_user(container, config, access_token, user_id)
+    finally:
+        await container.close()
+
+    assert primary_statements == []
+    assert len(replica_statements) == 1, replica_statements
+
+
+async def test_writer_reads_its_writes_from_primary(app_config: Config, access_token: str) -> None:
+    """Test that an auth user that has just committed is routed to the primary."""
+    config = with_replica(app_config, DbReplicaConfig(host=app_config.db.host, port=app_config.db.port))
+    container = get_async_container(config)
+    try:
+        async with container({Request: make_http_request(config, "1", access_token)}) as request_container:
+            user_id = (await (await request_container.get(CreateUser)).execute()).id
+
+        replica = (await container.get(ReplicaRouter)).engines[0]
+        with count_statements(replica) as replica_statements:
+            await read_user(container, config, access_token, user_id)
+    finally:
+        await container.close()
+
+    assert replica_statements == []
+
+
+async def test_unhealthy_replica_falls_back_to_primary(
+    api_client: ApiClient,
+    app_config: Config,
+    access_token: str,
+) -> None:
+    """Test that a replica failing to connect is skipped by the request and marked unhealthy."""
+    with api_client.authenticate(auth_user_id="1"):
+        user_id = await create_user(api_client)
+
+    config = with_replica(app_config, DbReplicaConfig(host=app_config.db.host, port=UNREACHABLE_PORT))
+    container = get_async_container(config)
+    try:
+        router = await container.get(ReplicaRouter)
+        await read_user(container, config, access_token, user_id)
+        assert router.pick(None) is None
+    finally:
+        await container.close()
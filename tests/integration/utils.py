@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from crudik.adapters.auth.model import AuthUserId
+from crudik.adapters.cache.config import CacheConfig, TTLCacheConfig, UserCacheConfig
+from crudik.main.config.loader import Config
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Collect SQL statements executed by the engine inside the context."""
+    statements: list[str] = []
+
+    def on_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+
+def make_http_request(config: Config, auth_user_id: AuthUserId, access_token: str) -> Request:
+    """Create HTTP request authenticated as the given auth user, to resolve request-scoped dependencies in-process."""
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (config.web_auth.user_id_header.lower().encode(), auth_user_id.encode()),
+                (config.web_auth.access_token_header.lower().encode(), access_token.encode()),
+            ],
+        },
+    )
+
+
+def without_caches(config: Config) -> Config:
+    """Copy config with all in-process caches disabled, to observe the queries behind them."""
+    return replace(
+        config,
+        cache=CacheConfig(
+            auth_user=TTLCacheConfig(enabled=False),
+            access_token=TTLCacheConfig(enabled=False),
+            user=UserCacheConfig(enabled=False),
+        ),
+    )
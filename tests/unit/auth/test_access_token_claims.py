@@ -0,0 +1,34 @@
+import time
+
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache, get_access_token_digest
+from crudik.adapters.cache.ttl import MISSING
+from tests.clock import FakeClock
+from tests.unit.fakes import make_access_token, make_web_auth_idp
+
+REQUESTS = 3
+
+
+async def test_repeated_token_is_decoded_once() -> None:
+    """Test that claims of an already seen token are served from the cache."""
+    cache = AccessTokenClaimsCache(max_size=10, ttl=300)
+    access_token = make_access_token(time.time() + 60)
+
+    for _ in range(REQUESTS):
+        assert await make_web_auth_idp(access_token, cache).get_auth_user_id() == "1"
+
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == REQUESTS - 1
+
+
+async def test_cached_claims_expire_with_token() -> None:
+    """Test that cached claims are not used after the token expiration time."""
+    clock = FakeClock()
+    cache = AccessTokenClaimsCache(max_size=10, ttl=300, clock=clock)
+    access_token = make_access_token(time.time() + 60)
+
+    await make_web_auth_idp(access_token, cache).get_auth_user_id()
+    digest = get_access_token_digest(access_token)
+    assert cache.get(digest) is not MISSING
+
+    clock.now = 61
+    assert cache.get(digest) is MISSING
@@ -0,0 +1,38 @@
+import time
+
+from crudik.adapters.auth.idp.user import IdProviderImpl
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+from tests.unit.fakes import InMemoryAuthUserGateway, make_access_token, make_auth_user, make_web_auth_idp
+
+
+async def test_auth_user_id_is_resolved_once_per_request() -> None:
+    """Test that repeated calls within a request do not parse the access token again."""
+    cache = AccessTokenClaimsCache(max_size=0, ttl=300)
+    idp = make_web_auth_idp(make_access_token(time.time() + 60), cache)
+
+    first = await idp.get_auth_user_id()
+    second = await idp.get_auth_user_id()
+
+    assert first == second
+    assert cache.stats.misses == 1
+
+
+async def test_user_is_resolved_once_per_request() -> None:
+    """Test that repeated calls within a request do not query the gateway again."""
+    gateway = InMemoryAuthUserGateway()
+    auth_user = make_auth_user("1")
+    await gateway.create(auth_user)
+    idp = IdProviderImpl(
+        auth_user_idp=make_web_auth_idp(
+            make_access_token(time.time() + 60),
+            AccessTokenClaimsCache(max_size=0, ttl=300),
+        ),
+        auth_user_gateway=gateway,
+    )
+
+    first = await idp.get_user()
+    second = await idp.get_user()
+
+    assert first is second
+    assert first.id == auth_user.user_id
+    assert gateway.lookups == 1
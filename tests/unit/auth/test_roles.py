@@ -0,0 +1,24 @@
+import time
+
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+from tests.unit.fakes import make_access_token, make_web_auth_idp
+
+
+async def test_roles_are_read_from_nested_claim() -> None:
+    """Test that roles are taken from the configured path of the access token claims."""
+    cache = AccessTokenClaimsCache(max_size=10, ttl=300)
+    access_token = make_access_token(time.time() + 60, realm_access={"roles": ["users-provisioner", "viewer"]})
+
+    roles = await make_web_auth_idp(access_token, cache).get_roles()
+
+    assert roles == {"users-provisioner", "viewer"}
+
+
+async def test_token_without_roles_claim_grants_no_roles() -> None:
+    """Test that a token without the roles claim, or with a malformed one, grants no roles."""
+    cache = AccessTokenClaimsCache(max_size=10, ttl=300)
+    without_claim = make_access_token(time.time() + 60)
+    malformed_claim = make_access_token(time.time() + 60, realm_access={"roles": "users-provisioner"})
+
+    assert await make_web_auth_idp(without_claim, cache).get_roles() == frozenset()
+    assert await make_web_auth_idp(malformed_claim, cache).get_roles() == frozenset()
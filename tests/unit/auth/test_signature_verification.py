@@ -0,0 +1,153 @@
+import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import Request
+from jwt.algorithms import RSAAlgorithm
+
+from crudik.adapters.auth.errors.base import AuthUnavailableError, UnauthorizedError, UnauthorizedReason
+from crudik.adapters.auth.idp.access_token import VerifiedAccessTokenDecoder
+from crudik.adapters.auth.idp.auth_user import WebAuthConfig, WebAuthUserIdProvider
+from crudik.adapters.auth.idp.jwks import JWKSKeyStore
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    """Signing key of the identity provider."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Thread pool for signature checks."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def write_jwks(path: Path, keys: dict[str, rsa.RSAPrivateKey]) -> None:
+    """Publish public parts of the keys as a JWKS file."""
+    jwks = [{**RSAAlgorithm.to_jwk(key.public_key(), as_dict=True), "kid": kid} for kid, key in keys.items()]
+    path.write_text(json.dumps({"keys": jwks}))
+
+
+def sign(key: rsa.RSAPrivateKey, kid: str, sub: str = "1") -> str:
+    """Create access token of the subject with verified email."""
+    return jwt.encode(
+        {"sub": sub, "email_verified": True, "exp": int(time.time()) + 60},
+        key=key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+def make_idp(jwks_path: Path, executor: ThreadPoolExecutor, access_token: str) -> WebAuthUserIdProvider:
+    """Create id provider that verifies the access token of the request."""
+    config = WebAuthConfig(
+        user_id_header="X-Auth-User",
+        access_token_header="X-Access-Token",  # noqa: S106
+        access_token_alg="RS256",  # noqa: S106
+        allow_unverified_email=False,
+        verify_signature=True,
+        jwks_uri=str(jwks_path),
+        jwks_refresh_interval=0,
+    )
+    request = Request(
+        {
+            "type": "http",
+            "headers": [
+                (b"x-auth-user", b"spoofed"),
+                (b"x-access-token", access_token.encode()),
+            ],
+        },
+    )
+    return WebAuthUserIdProvider(
+        http_request=request,
+        config=config,
+        claims_cache=AccessTokenClaimsCache(max_size=0, ttl=300),
+        decoder=VerifiedAccessTokenDecoder(
+            algorithm=config.access_token_alg,
+            audience=None,
+            key_store=JWKSKeyStore(jwks_uri=str(jwks_path), refresh_interval=0, executor=executor),
+            executor=executor,
+        ),
+    )
+
+
+async def test_auth_user_id_is_taken_from_verified_token(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test that the subject of a correctly signed token is used instead of the user id header."""
+    jwks_path = tmp_path / "jwks.json"
+    write_jwks(jwks_path, {"key-1": private_key})
+
+    idp = make_idp(jwks_path, executor, sign(private_key, "key-1", sub="42"))
+
+    assert await idp.get_auth_user_id() == "42"
+
+
+async def test_forged_token_is_rejected(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test that a token signed with a foreign key is rejected."""
+    jwks_path = tmp_path / "jwks.json"
+    write_jwks(jwks_path, {"key-1": private_key})
+    forger_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    idp = make_idp(jwks_path, executor, sign(forger_key, "key-1"))
+
+    with pytest.raises(UnauthorizedError) as exc_info:
+        await idp.get_auth_user_id()
+    assert exc_info.value.reason == UnauthorizedReason.INVALID_ACCESS_TOKEN
+
+
+async def test_rotated_key_is_loaded_by_kid(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test that a token signed with an unknown key makes the store reload JWKS."""
+    jwks_path = tmp_path / "jwks.json"
+    write_jwks(jwks_path, {"key-1": private_key})
+    key_store = JWKSKeyStore(jwks_uri=str(jwks_path), refresh_interval=0, executor=executor)
+    await key_store.get_key("key-1")
+
+    new_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    write_jwks(jwks_path, {"key-1": private_key, "key-2": new_key})
+
+    assert (await key_store.get_key("key-2")).key_id == "key-2"
+    with pytest.raises(jwt.PyJWKClientError):
+        await key_store.get_key("key-3")
+
+
+async def test_failed_jwks_load_is_retried(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test that a failed JWKS load is reported as unavailable auth and does not delay the next load."""
+    jwks_path = tmp_path / "jwks.json"
+    key_store = JWKSKeyStore(jwks_uri=str(jwks_path), refresh_interval=3600, executor=executor)
+    with pytest.raises(AuthUnavailableError):
+        await key_store.get_key("key-1")
+
+    write_jwks(jwks_path, {"key-1": private_key})
+
+    assert (await key_store.get_key("key-1")).key_id == "key-1"
+
+
+async def test_unreachable_jwks_endpoint_fails_as_unavailable(executor: ThreadPoolExecutor) -> None:
+    """Test that a JWKS endpoint that cannot be reached is reported as unavailable auth."""
+    key_store = JWKSKeyStore(jwks_uri="http://127.0.0.1:9/jwks.json", refresh_interval=3600, executor=executor)
+
+    with pytest.raises(AuthUnavailableError):
+        await key_store.get_key("key-1")
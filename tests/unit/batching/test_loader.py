@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from crudik.adapters.batching.loader import BatchLoader
+
+WINDOW = 0.01
+
+
+class RecordingLoadMany:
+    """Batch load function that doubles existing keys and remembers every batch."""
+
+    def __init__(self, existing: set[int], error: Exception | None = None) -> None:
+        self.existing = existing
+        self.error = error
+        self.batches: list[list[int]] = []
+
+    async def __call__(self, keys: Sequence[int]) -> Mapping[int, int]:
+        """Load a batch."""
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return {key: key * 2 for key in keys if key in self.existing}
+
+
+async def test_concurrent_lookups_are_merged_into_one_batch() -> None:
+    """Test that lookups within the window share one batch and missing keys resolve to None."""
+    load_many = RecordingLoadMany(existing={1, 2})
+    loader = BatchLoader(load_many=load_many, window=WINDOW, max_batch_size=100)
+
+    results = list(await asyncio.gather(loader.load(1), loader.load(2), loader.load(3)))
+
+    assert results == [2, 4, None]
+    assert load_many.batches == [[1, 2, 3]]
+
+
+async def test_identical_keys_are_deduplicated() -> None:
+    """Test that concurrent lookups of the same key load it once."""
+    load_many = RecordingLoadMany(existing={1})
+    loader = BatchLoader(load_many=load_many, window=WINDOW, max_batch_size=100)
+
+    results = list(await asyncio.gather(*(loader.load(1) for _ in range(5))))
+
+    assert results == [2] * 5
+    assert load_many.batches == [[1]]
+
+
+async def test_full_batch_is_dispatched_without_waiting_for_window() -> None:
+    """Test that reaching the batch size limit starts loading immediately."""
+    load_many = RecordingLoadMany(existing={1, 2, 3})
+    loader = BatchLoader(load_many=load_many, window=3600, max_batch_size=2)
+
+    results = list(await asyncio.wait_for(asyncio.gather(loader.load(1), loader.load(2)), timeout=1))
+
+    assert results == [2, 4]
+    assert load_many.batches == [[1, 2]]
+    await loader.close()
+
+
+async def test_error_is_propagated_to_every_waiter() -> None:
+    """Test that a failed batch fails all lookups of it."""
+    error = RuntimeError("db is down")
+    loader = BatchLoader(load_many=RecordingLoadMany(existing=set(), error=error), window=WINDOW, max_batch_size=100)
+
+    results = list(await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True))
+
+    assert results == [error, error]
+
+
+async def test_cancelled_waiter_does_not_cancel_lookup_for_others() -> None:
+    """Test that cancelling one caller keeps the shared lookup alive."""
+    load_many = RecordingLoadMany(existing={1})
+    loader = BatchLoader(load_many=load_many, window=WINDOW, max_batch_size=100)
+
+    cancelled = asyncio.create_task(loader.load(1))
+    other = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert list(await asyncio.gather(other)) == [2]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
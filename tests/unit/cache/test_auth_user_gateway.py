@@ -0,0 +1,61 @@
+from crudik.adapters.cache.gateway.auth_user import AuthUserCache, CachedAuthUserGateway
+from tests.unit.fakes import InMemoryAuthUserGateway, make_auth_user
+
+
+async def test_repeated_get_hits_cache() -> None:
+    """Test that the wrapped gateway is queried only once for a known auth user."""
+    inner = InMemoryAuthUserGateway()
+    auth_user = make_auth_user("1")
+    await inner.create(auth_user)
+    gateway = CachedAuthUserGateway(gateway=inner, cache=AuthUserCache(max_size=10, ttl=10))
+
+    first = await gateway.get("1")
+    second = await gateway.get("1")
+
+    assert inner.lookups == 1
+    assert first is not None
+    assert second is not None
+    assert second.user.id == auth_user.user_id
+    assert second is not first
+
+
+async def test_unknown_auth_user_is_not_cached() -> None:
+    """Test that a missing auth user is looked up again after it gets created."""
+    inner = InMemoryAuthUserGateway()
+    gateway = CachedAuthUserGateway(gateway=inner, cache=AuthUserCache(max_size=10, ttl=10))
+
+    assert await gateway.get("1") is None
+    await inner.create(make_auth_user("1"))
+
+    assert await gateway.get("1") is not None
+
+
+async def test_create_invalidates_cached_mapping() -> None:
+    """Test that creating a mapping drops the stale cached one, e.g. after the old user was deleted."""
+    inner = InMemoryAuthUserGateway()
+    await inner.create(make_auth_user("1"))
+    gateway = CachedAuthUserGateway(gateway=inner, cache=AuthUserCache(max_size=10, ttl=10))
+    await gateway.get("1")
+    inner.storage.clear()
+
+    new_auth_user = make_auth_user("1")
+    assert await gateway.create(new_auth_user)
+    auth_user = await gateway.get("1")
+
+    assert auth_user is not None
+    assert auth_user.user_id == new_auth_user.user_id
+
+
+async def test_get_user_shares_cache_with_get() -> None:
+    """Test that the linked user is served from the cache populated by any lookup."""
+    inner = InMemoryAuthUserGateway()
+    auth_user = make_auth_user("1")
+    await inner.create(auth_user)
+    gateway = CachedAuthUserGateway(gateway=inner, cache=AuthUserCache(max_size=10, ttl=10))
+
+    await gateway.get("1")
+    user = await gateway.get_user("1")
+
+    assert inner.lookups == 1
+    assert user is not None
+    assert user.id == auth_user.user_id
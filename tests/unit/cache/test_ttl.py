@@ -0,0 +1,64 @@
+from crudik.adapters.cache.ttl import MISSING, TTLCache
+from tests.clock import FakeClock
+
+
+def test_get_returns_stored_value() -> None:
+    """Test that a stored value is returned and counted as a hit."""
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == cache.stats.hits / (cache.stats.hits + cache.stats.misses)
+
+
+def test_entry_expires_after_ttl() -> None:
+    """Test that an entry is not returned after its time-to-live."""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 10
+    assert cache.get("a") is MISSING
+    assert len(cache) == 0
+
+
+def test_entry_ttl_cannot_exceed_cache_ttl() -> None:
+    """Test that per-entry ttl only shortens the default one."""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10, clock=clock)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 1, ttl=100)
+
+    clock.now = 5
+    assert cache.get("short") is MISSING
+    assert cache.get("long") == 1
+
+    clock.now = 10
+    assert cache.get("long") is MISSING
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test that the cache never grows beyond its size limit."""
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 1)
+    cache.get("a")
+    cache.set("c", 1)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_drops_entry() -> None:
+    """Test that an invalidated entry is not returned."""
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=10)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("b")
+
+    assert cache.get("a") is MISSING
@@ -0,0 +1,81 @@
+from uuid import uuid4
+
+from crudik.adapters.cache.gateway.user import CachedUserGateway, UserCache
+from crudik.entities.user import User
+from tests.clock import FakeClock
+from tests.unit.fakes import InMemoryUserGateway
+
+NEGATIVE_TTL = 5
+TTL = 60
+
+
+def make_gateway(inner: InMemoryUserGateway, clock: FakeClock | None = None) -> CachedUserGateway:
+    """Create cached gateway over the in-memory one."""
+    cache = UserCache(max_size=10, ttl=TTL, clock=clock or FakeClock())
+    return CachedUserGateway(gateway=inner, cache=cache, negative_ttl=NEGATIVE_TTL)
+
+
+async def test_repeated_get_hits_cache() -> None:
+    """Test that both existing and missing users are looked up once."""
+    inner = InMemoryUserGateway()
+    user = User(uuid4())
+    inner.storage[user.id] = user
+    gateway = make_gateway(inner)
+    missing_id = uuid4()
+
+    for _ in range(3):
+        cached = await gateway.get(user.id)
+        assert cached is not None
+        assert cached.id == user.id
+        assert await gateway.get(missing_id) is None
+
+    assert inner.lookups == len([user.id, missing_id])
+
+
+async def test_missing_user_expires_after_negative_ttl() -> None:
+    """Test that a missing user is looked up again after the short negative ttl."""
+    clock = FakeClock()
+    inner = InMemoryUserGateway()
+    gateway = make_gateway(inner, clock)
+    user = User(uuid4())
+
+    assert await gateway.get(user.id) is None
+    inner.storage[user.id] = user
+    assert await gateway.get(user.id) is None
+
+    clock.now = NEGATIVE_TTL
+    assert await gateway.get(user.id) is not None
+
+
+async def test_existing_user_expires_after_ttl() -> None:
+    """Test that a user deleted outside of the application is served from the cache only until the ttl."""
+    clock = FakeClock()
+    inner = InMemoryUserGateway()
+    gateway = make_gateway(inner, clock)
+    user = User(uuid4())
+    inner.storage[user.id] = user
+
+    assert await gateway.get(user.id) is not None
+    del inner.storage[user.id]
+    assert await gateway.get(user.id) is not None
+
+    clock.now = TTL
+    assert await gateway.get(user.id) is None
+
+
+async def test_get_many_loads_only_misses() -> None:
+    """Test that cached users are not requested from the wrapped gateway again."""
+    inner = InMemoryUserGateway()
+    first, second = User(uuid4()), User(uuid4())
+    inner.storage = {first.id: first, second.id: second}
+    gateway = make_gateway(inner)
+    await gateway.get(first.id)
+    missing_id = uuid4()
+
+    users = await gateway.get_many([first.id, second.id, missing_id])
+    assert {user.id for user in users} == {first.id, second.id}
+
+    inner.lookups = 0
+    users = await gateway.get_many([first.id, second.id, missing_id])
+    assert {user.id for user in users} == {first.id, second.id}
+    assert inner.lookups == 0
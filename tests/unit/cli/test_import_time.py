@@ -0,0 +1,79 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+CONFIG_PATH = Path(__file__).parents[3] / ".config" / "app" / "config.local.toml"
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$", re.MULTILINE)
+CLI_BUDGET = 0.5
+
+# The command runs without touching the outside world, so only the imports it needs are measured.
+# The API does not start the server, migrations render SQL offline, which still runs the alembic env script.
+# Budgets are cumulative import times in seconds, generous enough for a loaded CI runner.
+RUN_COMMAND = """
+import sys
+{stub}
+sys.argv = ["crudik", *{argv!r}]
+from crudik.main.cli import main
+main()
+"""
+STUB_UVICORN = "import uvicorn; uvicorn.run = lambda *args, **kwargs: None"
+STUB_ALEMBIC = """
+import alembic.config
+alembic_main = alembic.config.main
+alembic.config.main = lambda argv, **kwargs: alembic_main(argv=[*argv, "--sql"], **kwargs)
+"""
+
+
+def import_modules(code: str) -> dict[str, int]:
+    """Run code with ``-X importtime``, returning the self import time in microseconds of every module."""
+    env = {"APP_CONFIG_PATH": str(CONFIG_PATH), **os.environ}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return {module: int(self_us) for self_us, module in IMPORT_TIME_RE.findall(result.stderr)}
+
+
+def test_cli_module_imports_no_commands() -> None:
+    """Test that importing the CLI does not load the dependencies of any command."""
+    modules = import_modules("import crudik.main.cli")
+
+    assert not {"alembic", "fastapi", "uvicorn", "sqlalchemy", "dishka"} & modules.keys()
+    assert sum(modules.values()) / 1e6 < CLI_BUDGET
+
+
+@pytest.mark.parametrize(
+    ("stub", "argv", "required", "forbidden", "budget"),
+    [
+        (
+            STUB_ALEMBIC,
+            ["migrations", "apply"],
+            {"crudik.adapters.db.config", "crudik.adapters.db.models.base"},
+            {"fastapi", "uvicorn", "dishka", "jwt", "crudik.presentation"},
+            3.0,
+        ),
+        (STUB_UVICORN, ["run", "api"], {"fastapi"}, {"alembic"}, 6.0),
+    ],
+    ids=["migrations apply", "run api"],
+)
+def test_command_imports_only_its_dependencies(
+    stub: str,
+    argv: list[str],
+    required: set[str],
+    forbidden: set[str],
+    budget: float,
+) -> None:
+    """Test that a command does not import the dependencies of other commands and stays in its import time budget."""
+    modules = import_modules(RUN_COMMAND.format(stub=stub, argv=argv))
+
+    assert required <= modules.keys()
+    assert not forbidden & modules.keys()
+    assert sum(modules.values()) / 1e6 < budget
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+from dishka import Provider, Scope, make_async_container, provide
+from starlette.types import Message, Receive, Send
+from starlette.types import Scope as ASGIScope
+
+from crudik.presentation.fast_api.container import UNMATCHED_ROUTE, DiProfiler, ScopelessPathsContainerMiddleware
+from tests.clock import FakeClock
+
+RESOLVE_SECONDS = 2.0
+CLOSE_SECONDS = 3.0
+REQUESTS = 2
+
+
+class Dependency:
+    """Request-scoped dependency."""
+
+
+def make_provider(clock: FakeClock) -> Provider:
+    """Create a provider whose factory and finalizer advance the clock."""
+
+    class SlowProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        async def get_dependency(self) -> AsyncIterator[Dependency]:
+            clock.now += RESOLVE_SECONDS
+            yield Dependency()
+            clock.now += CLOSE_SECONDS
+
+    return SlowProvider()
+
+
+async def call(profiler: DiProfiler, clock: FakeClock, route: object | None) -> None:
+    """Send a request through the middleware to an endpoint resolving the dependency."""
+    container = make_async_container(make_provider(clock))
+
+    async def app(scope: ASGIScope, _receive: Receive, _send: Send) -> None:
+        await scope["state"]["dishka_container"].get(Dependency)
+        if route is not None:
+            scope["route"] = route
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(_message: Message) -> None:
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/users/1",
+        "headers": [],
+        "state": {},
+        "app": SimpleNamespace(state=SimpleNamespace(dishka_container=container)),
+    }
+    await ScopelessPathsContainerMiddleware(app, paths=(), profiler=profiler)(scope, receive, send)
+    await container.close()
+
+
+async def test_timings_are_recorded_per_route() -> None:
+    """Test that resolution and scope closing times are accumulated under the method and route path."""
+    clock = FakeClock()
+    profiler = DiProfiler(clock=clock)
+    route = SimpleNamespace(path="/users/{user_id}")
+
+    for _ in range(REQUESTS):
+        await call(profiler, clock, route)
+    await call(profiler, clock, None)
+
+    stats = profiler.get_stats()
+    assert stats.keys() == {"GET /users/{user_id}", f"GET {UNMATCHED_ROUTE}"}
+    route_stats = stats["GET /users/{user_id}"]
+    assert route_stats.requests == REQUESTS
+    assert route_stats.enter == 0
+    assert route_stats.resolve == REQUESTS * RESOLVE_SECONDS
+    assert route_stats.close == REQUESTS * CLOSE_SECONDS
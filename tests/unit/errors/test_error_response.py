@@ -0,0 +1,81 @@
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any, ClassVar, override
+from uuid import uuid4
+
+import pytest
+
+from crudik.adapters.auth.errors.base import UnauthorizedError, UnauthorizedReason
+from crudik.adapters.errors.http.response import ErrorResponse
+from crudik.application.errors.user import UserNotFoundError
+from crudik.entities.errors.base import AccessDeniedError, AppError, app_error
+from crudik.presentation.fast_api.error_handlers import get_app_error_response, get_error_response_spec
+
+DETAILED_ERROR_ID = uuid4()
+
+
+@app_error
+class SpecificAccessDeniedError(AccessDeniedError):
+    """Unmapped subclass of a mapped error."""
+
+    code: ClassVar[str] = "SPECIFIC_ACCESS_DENIED"
+
+
+@app_error
+class UnmappedError(AppError):
+    """Error without status mapping."""
+
+    code: ClassVar[str] = "UNMAPPED"
+    message: str = "Unmapped"
+
+
+@app_error
+class DetailedError(AppError):
+    """Error with meta values of types the stdlib JSON encoder does not support."""
+
+    code: ClassVar[str] = "DETAILED"
+    message: str = "Detailed"
+
+    @property
+    @override
+    def meta(self) -> dict[str, Any] | None:
+        """Returns a timestamp, an amount and a nested error reason."""
+        return {
+            "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "amount": Decimal("1.50"),
+            "nested": {"reason": UnauthorizedReason.MISSING_USER_ID, "ids": [DETAILED_ERROR_ID]},
+        }
+
+
+@pytest.mark.parametrize(
+    "err",
+    [
+        UnauthorizedError(reason=UnauthorizedReason.MISSING_USER_ID, header="X-Auth-User"),
+        UserNotFoundError(user_id=uuid4()),
+        AccessDeniedError(message='Access "denied" ё'),
+        DetailedError(),
+    ],
+)
+async def test_body_matches_error_response_model(err: AppError) -> None:
+    """Test that the fast path renders the same body as the ``ErrorResponse`` model."""
+    response = await get_app_error_response(err)
+
+    expected = ErrorResponse(code=err.code, message=err.message, meta=err.meta).model_dump(mode="json")
+    assert json.loads(bytes(response.body)) == expected
+
+
+@pytest.mark.parametrize(
+    ("error_type", "status"),
+    [
+        (UnauthorizedError, 401),
+        (SpecificAccessDeniedError, 403),
+        (UnmappedError, 500),
+    ],
+)
+def test_status_is_looked_up_along_mro(error_type: type[AppError], status: int) -> None:
+    """Test that errors get the status of their closest mapped base class, or 500."""
+    spec = get_error_response_spec(error_type)
+
+    assert spec.status == status
+    assert get_error_response_spec(error_type) is spec
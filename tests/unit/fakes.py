@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from typing import Any, override
+from uuid import uuid4
+
+import jwt
+from fastapi import Request
+
+from crudik.adapters.auth.common.gateway.auth_user import AuthUserGateway
+from crudik.adapters.auth.idp.access_token import UnverifiedAccessTokenDecoder
+from crudik.adapters.auth.idp.auth_user import WebAuthConfig, WebAuthUserIdProvider
+from crudik.adapters.auth.model import AuthUser, AuthUserId
+from crudik.adapters.cache.access_token import AccessTokenClaimsCache
+from crudik.application.common.gateway.user import UserGateway
+from crudik.entities.common.identifiers import UserId
+from crudik.entities.user import User
+
+web_auth_config = WebAuthConfig(
+    user_id_header="X-Auth-User",
+    access_token_header="X-Access-Token",  # noqa: S106
+    access_token_alg="HS256",  # noqa: S106
+    allow_unverified_email=False,
+)
+
+
+class InMemoryAuthUserGateway(AuthUserGateway):
+    """AuthUserGateway backed by a dict that counts lookups."""
+
+    def __init__(self) -> None:
+        self.storage: dict[AuthUserId, AuthUser] = {}
+        self.lookups = 0
+
+    @override
+    async def get(self, auth_user_id: AuthUserId) -> AuthUser | None:
+        self.lookups += 1
+        return self.storage.get(auth_user_id)
+
+    @override
+    async def get_user(self, auth_user_id: AuthUserId) -> User | None:
+        auth_user = await self.get(auth_user_id)
+        return None if auth_user is None else auth_user.user
+
+    @override
+    async def create(self, auth_user: AuthUser) -> bool:
+        if auth_user.auth_user_id in self.storage:
+            return False
+        self.storage[auth_user.auth_user_id] = auth_user
+        return True
+
+    @override
+    async def create_many(self, auth_users: Sequence[AuthUser]) -> set[AuthUserId]:
+        return {auth_user.auth_user_id for auth_user in auth_users if await self.create(auth_user)}
+
+
+class InMemoryUserGateway(UserGateway):
+    """UserGateway backed by a dict that counts lookups."""
+
+    def __init__(self) -> None:
+        self.storage: dict[UserId, User] = {}
+        self.lookups = 0
+
+    @override
+    async def get(self, user_id: UserId) -> User | None:
+        self.lookups += 1
+        return self.storage.get(user_id)
+
+    @override
+    async def get_many(self, user_ids: Sequence[UserId]) -> list[User]:
+        self.lookups += 1
+        return [self.storage[user_id] for user_id in user_ids if user_id in self.storage]
+
+
+def make_auth_user(auth_user_id: AuthUserId) -> AuthUser:
+    """Create auth user linked to a new user."""
+    user_id = uuid4()
+    return AuthUser(auth_user_id=auth_user_id, user_id=user_id, user=User(user_id))
+
+
+def make_web_auth_idp(access_token: str, cache: AccessTokenClaimsCache) -> WebAuthUserIdProvider:
+    """Create id provider for a request carrying the access token."""
+    request = Request(
+        {
+            "type": "http",
+            "headers": [
+                (web_auth_config.user_id_header.lower().encode(), b"1"),
+                (web_auth_config.access_token_header.lower().encode(), access_token.encode()),
+            ],
+        },
+    )
+    return WebAuthUserIdProvider(
+        http_request=request,
+        config=web_auth_config,
+        claims_cache=cache,
+        decoder=UnverifiedAccessTokenDecoder(algorithm=web_auth_config.access_token_alg),
+    )
+
+
+def make_access_token(exp: float, **claims: Any) -> str:
+    """Create access token with verified email and the extra claims that expires at ``exp``."""
+    return jwt.encode(
+        {"email_verified": True, "exp": int(exp), **claims},
+        key="dummy-key-used-only-in-tests-32b",
+        algorithm=web_auth_config.access_token_alg,
+    )
@@ -0,0 +1,45 @@
+import logging
+import logging.config
+from collections.abc import Iterator
+
+import pytest
+import structlog
+
+from crudik.adapters.logs.config import LoggingConfig
+from crudik.main.logs import configure_structlog
+
+
+@pytest.fixture
+def configure_logging() -> Iterator[None]:
+    """Configure logging with a quieter ``tests.quiet`` logger."""
+    config = LoggingConfig(level="DEBUG", levels={"tests.quiet": "WARNING"})
+    logging.config.dictConfig(configure_structlog(config))
+    yield
+    structlog.reset_defaults()
+    root = logging.getLogger()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers.clear()
+    root.setLevel(logging.WARNING)
+    logging.getLogger("tests.quiet").setLevel(logging.NOTSET)
+
+
+@pytest.mark.usefixtures("configure_logging")
+def test_levels_are_set_per_logger(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a logger level overrides the root one for the logger and its children."""
+    structlog.get_logger("tests.loud").debug("loud debug")
+    structlog.get_logger("tests.quiet.child").debug("quiet debug")
+    structlog.get_logger("tests.quiet.child").warning("quiet warning")
+
+    events = [record.msg["event"] for record in caplog.records]  # type: ignore[index]
+    assert events == ["loud debug", "quiet warning"]
+
+
+@pytest.mark.usefixtures("configure_logging")
+def test_loggers_filter_at_their_level() -> None:
+    """Test that structlog loggers are built with no-op methods for the levels disabled for them."""
+    loud = structlog.get_logger("tests.loud").bind()
+    quiet = structlog.get_logger("tests.quiet.child").bind()
+
+    assert type(loud) is structlog.make_filtering_bound_logger(logging.DEBUG)
+    assert type(quiet) is structlog.make_filtering_bound_logger(logging.WARNING)
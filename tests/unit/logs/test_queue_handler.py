@@ -0,0 +1,150 @@
+import io
+import logging
+import threading
+from typing import override
+
+import structlog
+
+from crudik.adapters.logs.config import OverflowPolicy
+from crudik.adapters.logs.queue import BatchingQueueHandler
+
+RECORDS = 10
+QUEUE_SIZE = 2
+BATCHES = 2
+CLOSE_STARTED_WAIT = 0.1
+CLOSE_TIMEOUT = 5.0
+
+
+class BlockedStream(io.StringIO):
+    """Stream whose writes wait until it is released, like stdout of a stalled log collector."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = threading.Event()
+        self.released = threading.Event()
+        self.writes = 0
+
+    @override
+    def write(self, s: str, /) -> int:
+        self.writing.set()
+        self.released.wait()
+        self.writes += 1
+        return super().write(s)
+
+
+class ContextFormatter(logging.Formatter):
+    """Formatter appending the trace ID bound to the structlog context to the message."""
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{record.getMessage()} {structlog.contextvars.get_contextvars().get('trace_id')}"
+
+
+def make_record(message: str) -> logging.LogRecord:
+    """Create an INFO record with the given message."""
+    return logging.makeLogRecord({"msg": message, "levelno": logging.INFO, "levelname": "INFO"})
+
+
+def make_handler(stream: io.StringIO, overflow: OverflowPolicy) -> BatchingQueueHandler:
+    """Create a handler with a small queue, writing bare messages."""
+    handler = BatchingQueueHandler(stream=stream, max_size=QUEUE_SIZE, batch_size=RECORDS, overflow=overflow)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def stall_writer(handler: BatchingQueueHandler, stream: BlockedStream) -> None:
+    """Make the writer take the first record and wait in the write of its batch."""
+    handler.handle(make_record("first"))
+    stream.writing.wait()
+
+
+def test_records_are_written_in_batches() -> None:
+    """Test that records queued while the writer is busy are written in a single batch."""
+    stream = BlockedStream()
+    handler = BatchingQueueHandler(stream=stream, max_size=RECORDS, batch_size=RECORDS, overflow=OverflowPolicy.BLOCK)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    stall_writer(handler, stream)
+
+    for i in range(RECORDS - 1):
+        handler.handle(make_record(str(i)))
+    stream.released.set()
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["first", *(str(i) for i in range(RECORDS - 1))]
+    assert stream.writes == BATCHES
+    assert handler.dropped == 0
+
+
+def test_drop_new_keeps_oldest_records() -> None:
+    """Test that records which do not fit in the queue are dropped and counted."""
+    stream = BlockedStream()
+    handler = make_handler(stream, OverflowPolicy.DROP_NEW)
+    stall_writer(handler, stream)
+
+    for i in range(RECORDS):
+        handler.handle(make_record(str(i)))
+    stream.released.set()
+    handler.close()
+
+    dropped = RECORDS - QUEUE_SIZE
+    assert stream.getvalue().splitlines() == ["first", f"Log records dropped: {dropped}, {dropped} in total", "0", "1"]
+    assert handler.dropped == dropped
+
+
+def test_drop_oldest_keeps_newest_records() -> None:
+    """Test that the oldest queued records make room for new ones."""
+    stream = BlockedStream()
+    handler = make_handler(stream, OverflowPolicy.DROP_OLDEST)
+    stall_writer(handler, stream)
+
+    for i in range(RECORDS):
+        handler.handle(make_record(str(i)))
+    stream.released.set()
+    handler.close()
+
+    dropped = RECORDS - QUEUE_SIZE
+    assert stream.getvalue().splitlines() == [
+        "first",
+        f"Log records dropped: {dropped}, {dropped} in total",
+        str(RECORDS - 2),
+        str(RECORDS - 1),
+    ]
+    assert handler.dropped == dropped
+
+
+def test_records_are_formatted_in_context_they_were_logged_in() -> None:
+    """Test that context variables bound by the thread logging a foreign record reach its rendering."""
+    stream = BlockedStream()
+    stream.released.set()
+    handler = make_handler(stream, OverflowPolicy.BLOCK)
+    handler.setFormatter(ContextFormatter())
+
+    def log() -> None:
+        structlog.contextvars.bind_contextvars(trace_id="trace")
+        handler.handle(make_record("message"))
+
+    thread = threading.Thread(target=log)
+    thread.start()
+    thread.join()
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["message trace"]
+
+
+def test_close_stops_writer_when_overflow_drops_queued_records() -> None:
+    """Test that close returns even if records logged after it push everything queued before out of the queue."""
+    stream = BlockedStream()
+    handler = make_handler(stream, OverflowPolicy.DROP_OLDEST)
+    stall_writer(handler, stream)
+    handler.handle(make_record("queued"))
+
+    closer = threading.Thread(target=handler.close, daemon=True)
+    closer.start()
+    closer.join(CLOSE_STARTED_WAIT)
+    for i in range(RECORDS):
+        handler.handle(make_record(str(i)))
+    stream.released.set()
+    closer.join(CLOSE_TIMEOUT)
+
+    assert not closer.is_alive()
+    assert stream.getvalue().splitlines()[0] == "first"
@@ -0,0 +1,62 @@
+import pytest
+import structlog
+from structlog.typing import EventDict
+
+from crudik.adapters.logs.config import EventSamplingConfig
+from crudik.adapters.logs.sampling import EventSampler
+from crudik.adapters.tracing import TRACE_DEBUG_KEY
+from tests.clock import FakeClock
+
+EVENT = "Read user successful"
+EVERY = 3
+EVENTS = 10
+RATE = 2.0
+
+
+def sample(sampler: EventSampler, **event_dict: object) -> EventDict | None:
+    """Run the sampler on an event, returning ``None`` if it is dropped."""
+    try:
+        return sampler(None, "info", {"event": EVENT, "level": "info", **event_dict})
+    except structlog.DropEvent:
+        return None
+
+
+def test_one_in_every_event_is_kept() -> None:
+    """Test that one in ``every`` events is kept, carrying the number of events it stands for."""
+    sampler = EventSampler({EVENT: EventSamplingConfig(every=EVERY)})
+
+    kept = [event_dict for _ in range(EVENTS) if (event_dict := sample(sampler)) is not None]
+
+    assert [event_dict["sample_rate"] for event_dict in kept] == [1, EVERY, EVERY, EVERY]
+
+
+def test_events_are_kept_up_to_rate() -> None:
+    """Test that events over the rate are dropped until the bucket refills."""
+    clock = FakeClock()
+    sampler = EventSampler({EVENT: EventSamplingConfig(rate=RATE)}, clock=clock)
+
+    burst = [sample(sampler) for _ in range(EVENTS)]
+    clock.now += 1
+    refilled = sample(sampler)
+
+    assert [event_dict["sample_rate"] for event_dict in burst if event_dict is not None] == [1, 1]
+    assert refilled is not None
+    assert refilled["sample_rate"] == EVENTS - RATE + 1
+
+
+@pytest.mark.parametrize(
+    "event_dict",
+    [
+        {"level": "warning"},
+        {"level": "error"},
+        {TRACE_DEBUG_KEY: True},
+        {"event": "Read user request"},
+    ],
+)
+def test_event_is_not_sampled(event_dict: dict[str, object]) -> None:
+    """Test that warnings, errors, debugged traces and events without sampling config are always kept."""
+    sampler = EventSampler({EVENT: EventSamplingConfig(every=EVENTS)})
+
+    kept = [sample(sampler, **event_dict) for _ in range(EVENTS)]
+
+    assert all(event_dict is not None and "sample_rate" not in event_dict for event_dict in kept)
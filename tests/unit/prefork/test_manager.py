@@ -0,0 +1,138 @@
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import suppress
+
+from crudik.main.prefork import RESTART_DELAY, STARTUP_FAILURE
+
+WORKERS = 2
+REQUESTS = 10
+TIMEOUT = 30
+CRASH_NOTICE_WAIT = 0.3
+EXITING_RUN_TIME = 1.5
+
+# Serves the app with the given config options, prints the port and exits with the code of the manager
+RUN_MANAGER = """
+import os
+import sys
+import uvicorn
+from crudik.main.prefork import PreforkManager
+
+{app}
+
+config = uvicorn.Config(app, host="127.0.0.1", port=0, log_config=None, {options})
+sock = config.bind_socket()
+# The port is reported once the socket listens, so connections wait in the backlog until a worker starts
+sock.listen(config.backlog)
+print(sock.getsockname()[1], flush=True)
+sys.exit(PreforkManager(config, sock, {workers}).run())
+"""
+
+OK_APP = """
+async def app(scope, receive, send):
+    if scope["type"] == "http":
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+"""
+
+CRASHING_APP = """
+async def app(scope, receive, send):
+    os._exit(1)
+"""
+
+EXITING_APP = """
+async def app(scope, receive, send):
+    await receive()
+    await send({"type": "lifespan.startup.complete"})
+    os._exit(0)
+"""
+
+FAILING_STARTUP_APP = """
+async def app(scope, receive, send):
+    await receive()
+    await send({"type": "lifespan.startup.failed", "message": "no database"})
+"""
+
+
+def start_manager(app: str, options: str, workers: int) -> tuple[subprocess.Popen[str], int]:
+    """Start the manager in a subprocess, returning it with the port its workers serve."""
+    code = RUN_MANAGER.format(app=app, options=options, workers=workers)
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    assert process.stdout is not None
+    return process, int(process.stdout.readline())
+
+
+def wait_manager(process: subprocess.Popen[str]) -> int:
+    """Wait for the manager to exit, killing it with its workers if it hangs."""
+    try:
+        return process.wait(TIMEOUT)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        raise
+
+
+def test_recycled_workers_are_replaced() -> None:
+    """Test that requests keep being served while workers are recycled, and that the manager stops on SIGTERM."""
+    process, port = start_manager(OK_APP, 'limit_max_requests=2, lifespan="off"', WORKERS)
+    with process:
+        try:
+            statuses = []
+            for _ in range(REQUESTS):
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=TIMEOUT) as response:
+                    statuses.append(response.status)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            exit_code = wait_manager(process)
+
+    assert statuses == [200] * REQUESTS
+    assert exit_code == 0
+
+
+def test_stop_during_crash_restart_delay() -> None:
+    """Test that a stop signal received while waiting to replace a crashed worker stops the manager."""
+    process, port = start_manager(CRASHING_APP, 'lifespan="off"', 1)
+    with process:
+        try:
+            with suppress(urllib.error.URLError, ConnectionError):
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=TIMEOUT).close()
+            time.sleep(CRASH_NOTICE_WAIT)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            exit_code = wait_manager(process)
+
+    assert exit_code == 0
+
+
+def test_exiting_workers_are_not_replaced_in_loop() -> None:
+    """Test that workers exiting right after the start are replaced no sooner than the restart delay."""
+    process, _ = start_manager(EXITING_APP, 'lifespan="on"', 1)
+    with process:
+        try:
+            time.sleep(EXITING_RUN_TIME)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            exit_code = wait_manager(process)
+        assert process.stdout is not None
+        output = process.stdout.read()
+
+    assert exit_code == 0
+    assert 1 <= output.count("Worker recycled") <= math.ceil(EXITING_RUN_TIME / RESTART_DELAY)
+
+
+def test_worker_startup_failure_fails_manager() -> None:
+    """Test that the manager stops with a non-zero exit code if a worker fails to start."""
+    process, _ = start_manager(FAILING_STARTUP_APP, 'lifespan="on"', WORKERS)
+    with process:
+        exit_code = wait_manager(process)
+
+    assert exit_code == STARTUP_FAILURE
@@ -0,0 +1,28 @@
+import json
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from crudik.application.read_user import UserModel
+from crudik.presentation.fast_api.responses import FastJSONResponse
+
+
+def test_model_body_matches_json_response() -> None:
+    """Test that a model is rendered to the same JSON as the default FastAPI serialization."""
+    model = UserModel(id=uuid4())
+
+    response = FastJSONResponse(model)
+
+    expected = JSONResponse(jsonable_encoder(model))
+    assert json.loads(bytes(response.body)) == json.loads(bytes(expected.body))
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_plain_content_is_compact() -> None:
+    """Test that non-model content is rendered like ``JSONResponse``."""
+    content = {"items": [1, "ё", None], "ok": True}
+
+    response = FastJSONResponse(content)
+
+    assert response.body == JSONResponse(content).body
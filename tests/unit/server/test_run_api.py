@@ -0,0 +1,104 @@
+import inspect
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from uvicorn.importer import import_from_string
+
+from crudik.main import fast_api
+from crudik.main.config.loader import load_config_from_toml
+from crudik.presentation.fast_api.config import HttpImplementation, LoopImplementation, ServerConfig
+
+CONFIG_DIR = Path(__file__).parents[3] / ".config" / "app"
+SERVER_SECTION_RE = re.compile(r"^\[server\]\n(?:(?!\[).*\n)*", re.MULTILINE)
+SERVER_SECTION = """[server]
+port = 5001
+host = "127.0.0.1"
+uds = "/run/crudik/api.sock"
+workers = 3
+loop = "asyncio"
+http = "h11"
+backlog = 64
+timeout_keep_alive = 7
+limit_concurrency = 50
+limit_max_requests = 1000
+
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Local config with every server option set, used as $APP_CONFIG_PATH."""
+    path = tmp_path / "config.toml"
+    local_config = (CONFIG_DIR / "config.local.toml").read_text()
+    path.write_text(SERVER_SECTION_RE.sub(SERVER_SECTION, local_config, count=1))
+    monkeypatch.setenv("APP_CONFIG_PATH", str(path))
+    return path
+
+
+def test_server_section_is_loaded(config_path: Path) -> None:
+    """Test that every server option is loaded from the config, enums by their values."""
+    assert load_config_from_toml(config_path).server == ServerConfig(
+        port=5001,
+        host="127.0.0.1",
+        uds="/run/crudik/api.sock",
+        workers=3,
+        loop=LoopImplementation.ASYNCIO,
+        http=HttpImplementation.H11,
+        backlog=64,
+        timeout_keep_alive=7,
+        limit_concurrency=50,
+        limit_max_requests=1000,
+    )
+
+
+@pytest.mark.parametrize("name", ["config.toml", "config.local.toml"])
+def test_shipped_configs_run_single_worker(name: str) -> None:
+    """Test that shipped configs keep one worker process.
+
+    Read-your-writes pins of replicas, user caches and stats live in the worker memory,
+    so a request served by another worker could read a lagging replica or a stale cache.
+    """
+    assert load_config_from_toml(CONFIG_DIR / name).server.workers == 1
+
+
+@pytest.mark.usefixtures("config_path")
+def test_run_api_passes_server_options_to_uvicorn(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the API is started with the worker app factory and the configured server options uvicorn accepts."""
+    calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    run = uvicorn.run
+    monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: calls.append((args, kwargs)))
+
+    fast_api.run_api()
+
+    [(args, kwargs)] = calls
+    inspect.signature(run).bind(*args, **kwargs)
+    assert import_from_string(args[0]) is fast_api.create_worker_app
+    assert kwargs | {"log_config": None} == {
+        "factory": True,
+        "port": 5001,
+        "host": "127.0.0.1",
+        "uds": "/run/crudik/api.sock",
+        "workers": 3,
+        "loop": "asyncio",
+        "http": "h11",
+        "backlog": 64,
+        "timeout_keep_alive": 7,
+        "limit_concurrency": 50,
+        "limit_max_requests": 1000,
+        "log_config": None,
+    }
+    assert kwargs["log_config"]["handlers"]
+
+
+@pytest.mark.usefixtures("config_path")
+async def test_worker_app_factory_builds_app_from_config() -> None:
+    """Test that the factory called in every worker builds an application with its own container."""
+    app = fast_api.create_worker_app()
+
+    assert isinstance(app, FastAPI)
+    assert app.state.dishka_container is not None
+    await app.state.dishka_container.close()
@@ -0,0 +1,63 @@
+from typing import Any
+
+import pytest
+import structlog
+from starlette.types import Message, Receive, Scope, Send
+
+from crudik.adapters.tracing import TRACE_DEBUG_KEY, TracingConfig
+from crudik.presentation.fast_api.tracing import TracingMiddleware
+
+CONFIG = TracingConfig(
+    trace_id_header="X-Trace-Id",
+    debug_header="X-Debug-Trace",
+    debug_trusted_networks=["10.0.0.0/8"],
+)
+TRUSTED_CLIENT = ("10.1.2.3", 50000)
+UNTRUSTED_CLIENT = ("203.0.113.7", 50000)
+
+
+async def call(
+    headers: list[tuple[bytes, bytes]],
+    client: tuple[str, int] | None = TRUSTED_CLIENT,
+) -> tuple[dict[str, Any], list[Message]]:
+    """Send a request through the middleware, returning the contextvars seen by the app and the sent messages."""
+    contextvars: dict[str, Any] = {}
+    messages: list[Message] = []
+
+    async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        contextvars.update(structlog.contextvars.get_contextvars())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "headers": headers, "client": client}
+    await TracingMiddleware(app, config=CONFIG)(scope, receive, send)
+    return contextvars, messages
+
+
+async def test_trace_id_is_bound_and_echoed() -> None:
+    """Test that the trace id from the header is bound for logs and returned in the response."""
+    contextvars, messages = await call([(b"x-trace-id", b"abc")])
+
+    assert contextvars == {"trace_id": "abc"}
+    assert (b"x-trace-id", b"abc") in messages[0]["headers"]
+
+
+@pytest.mark.parametrize(("value", "debug"), [(b"1", True), (b"TRUE", True), (b"0", False)])
+async def test_debug_header_flags_trace(value: bytes, *, debug: bool) -> None:
+    """Test that the debug header binds the trace debug contextvar."""
+    contextvars, _ = await call([(b"x-trace-id", b"abc"), (b"x-debug-trace", value)])
+
+    assert contextvars.get(TRACE_DEBUG_KEY, False) is debug
+
+
+@pytest.mark.parametrize("client", [UNTRUSTED_CLIENT, None])
+async def test_debug_header_from_untrusted_client_is_ignored(client: tuple[str, int] | None) -> None:
+    """Test that clients outside the trusted networks cannot opt their requests out of log sampling."""
+    contextvars, _ = await call([(b"x-trace-id", b"abc"), (b"x-debug-trace", b"1")], client)
+
+    assert TRACE_DEBUG_KEY not in contextvars